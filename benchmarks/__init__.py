@@ -0,0 +1 @@
+"""Benchmarks of compiler phases on generated programs (run as `python -m benchmarks.<name>` from repository root)."""
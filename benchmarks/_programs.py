@@ -0,0 +1,85 @@
+"""Generators of benchmark programs and measurement helpers shared by benchmarks."""
+
+from __future__ import annotations
+
+import gc
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Functions within each group of that size share macro and memory
+SHARED_DEFINITIONS_GROUP_SIZE = 10
+# First function within each group of that size uses inline function defined before it
+INLINE_FUNCTIONS_GROUP_SIZE = 4
+
+
+def many_functions_program(functions_count: int) -> str:
+    """Get source of program with given count of functions, that uses macros, memories, inline functions and calls.
+
+    Every function is reachable from entry point (each function calls one defined before it).
+    """
+    lines: list[str] = []
+    for idx in range(functions_count):
+        if idx % SHARED_DEFINITIONS_GROUP_SIZE == 0:
+            lines.append(f"macro LIMIT{idx} {idx % 7} end")
+            lines.append(f"memory buf{idx} 16")
+        if (idx + 1) % INLINE_FUNCTIONS_GROUP_SIZE == 0:
+            lines.extend(
+                (
+                    f"inline func int helper{idx}[int]",
+                    "    copy 10 > if drop 10 end",
+                    "end",
+                ),
+            )
+        shared_idx = idx - idx % SHARED_DEFINITIONS_GROUP_SIZE
+        lines.extend(
+            (
+                f"func void f{idx}",
+                f"    LIMIT{shared_idx} copy 0 > if drop 1 end",
+                "    while copy 0 > do dec end drop",
+                f"    buf{shared_idx} {idx} !<",
+            ),
+        )
+        if idx:
+            lines.append(f"    call f{idx // 2}")
+        if idx and idx % INLINE_FUNCTIONS_GROUP_SIZE == 0:
+            lines.append(f"    {idx} helper{idx - 1} drop")
+        lines.append("end")
+
+    lines.extend(("func void main", f"    call f{functions_count - 1}", "end"))
+    return "\n".join(lines) + "\n"
+
+
+def best_of[T](repeats: int, measured: Callable[[], T]) -> tuple[float, T]:
+    """Get shortest wall time (in seconds) of given repeats of function and its last result.
+
+    Garbage is collected before each repeat, so garbage of previous repeats is not collected within measured one.
+    """
+    best_time = float("inf")
+    result: T | None = None
+    for _ in range(repeats):
+        gc.collect()
+        started_at = perf_counter()
+        result = measured()
+        best_time = min(best_time, perf_counter() - started_at)
+    assert result is not None
+    return best_time, result
+
+
+def mostly_unused_functions_program(functions_count: int, reachable_count: int) -> str:
+    """Get source of program with given count of functions (each with its own memory), where only few are reachable.
+
+    Each function calls one defined right before it, entry point calls last of first `reachable_count` functions.
+    Unreachable functions still have callers, so they are not removed by checking for callers alone.
+    """
+    lines: list[str] = []
+    for idx in range(functions_count):
+        lines.extend((f"memory m{idx} 8", f"func void f{idx}", f"    m{idx} {idx} !<"))
+        if idx:
+            lines.append(f"    call f{idx - 1}")
+        lines.append("end")
+
+    lines.extend(("func void main", f"    call f{reachable_count - 1}", "end"))
+    return "\n".join(lines) + "\n"
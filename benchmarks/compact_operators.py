@@ -0,0 +1,145 @@
+"""Benchmark of memory and iteration of compact (struct-of-arrays) form of operators against operator objects.
+
+Usage: `python -m benchmarks.compact_operators [--functions N] [--repeats N]`.
+Program is parsed and optimized (so operators carry optimization fields), then sources of all functions are:
+- measured by memory allocated for operator objects and for compact form (tokens are shared, so not counted),
+- iterated by type/operand dispatch loop (like typechecker and codegen loops) over both forms,
+- converted into compact form and back, which must yield same operators (round-trip is lossless).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from gofra.consts import GOFRA_ENTRY_POINT
+from gofra.gofra import process_input_file
+from gofra.optimizer import optimize_program
+from gofra.parser import CompactOperators, Operator, OperatorType
+from gofra.parser.compact import OPCODE_TYPE_MASK, compact_functions_source
+from gofra.typecheck import validate_type_safety
+
+from ._programs import best_of, many_functions_program
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def allocated_bytes[T](allocate: Callable[[], T]) -> tuple[int, T]:
+    """Get count of bytes that are allocated (and still alive) by given function and its result."""
+    tracemalloc.start()
+    try:
+        result = allocate()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return allocated, result
+
+
+def dispatch_operators(sources: list[list[Operator]]) -> int:
+    calls = 0
+    for source in sources:
+        for operator in source:
+            if operator.type == OperatorType.FUNCTION_CALL and operator.operand:
+                calls += 1
+    return calls
+
+
+def dispatch_compact(sources: list[CompactOperators]) -> int:
+    calls = 0
+    for compact in sources:
+        for opcode, operand in zip(compact.opcodes, compact.operands, strict=True):
+            if opcode & OPCODE_TYPE_MASK == OperatorType.FUNCTION_CALL and operand >= 0:
+                calls += 1
+    return calls
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=3000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "many_functions.gof"
+        path.write_text(many_functions_program(args.functions))
+        program = process_input_file(path, include_paths=[])
+    functions = {**program.functions, GOFRA_ENTRY_POINT: program.entry_point}
+    validate_type_safety(functions)
+    # Functions are not inlined nor eliminated, so all of them are measured
+    optimize_program(
+        program,
+        passes=["constant-folding", "peephole", "syscall-injection", "tail-calls"],
+    )
+    functions = [
+        function
+        for function in (*program.functions.values(), program.entry_point)
+        if function.has_executable_body()
+    ]
+    operators_count = sum(len(function.source) for function in functions)
+
+    compact_size, compact_sources = allocated_bytes(
+        lambda: compact_functions_source(functions),
+    )
+    operators_size, operators_sources = allocated_bytes(
+        lambda: [compact.to_operators() for compact in compact_sources.values()],
+    )
+    optimized_count = sum(
+        len(compact.optimizations) for compact in compact_sources.values()
+    )
+    print(
+        f"{len(functions)} functions, {operators_count} operators "
+        f"({optimized_count} with optimization fields)",
+    )
+    print(
+        f"memory:     operators {operators_size / operators_count:>6.1f} B/op"
+        f" ({operators_size / 2**20:.1f} MiB), "
+        f"compact {compact_size / operators_count:>6.1f} B/op"
+        f" ({compact_size / 2**20:.1f} MiB)",
+    )
+
+    operators_time, operators_calls = best_of(
+        args.repeats,
+        lambda: dispatch_operators(operators_sources),
+    )
+    compact_time, compact_calls = best_of(
+        args.repeats,
+        lambda: dispatch_compact(list(compact_sources.values())),
+    )
+    print(
+        f"iteration:  operators {operators_time * 1000:>6.1f}ms, "
+        f"compact {compact_time * 1000:>6.1f}ms",
+    )
+
+    into_compact_time, _ = best_of(
+        args.repeats,
+        lambda: compact_functions_source(functions),
+    )
+    from_compact_time, _ = best_of(
+        args.repeats,
+        lambda: [compact.to_operators() for compact in compact_sources.values()],
+    )
+    print(
+        f"conversion: into compact {into_compact_time * 1000:>6.1f}ms, "
+        f"back {from_compact_time * 1000:>6.1f}ms",
+    )
+
+    is_lossless = all(
+        compact_sources[function.name].to_operators() == list(function.source)
+        for function in functions
+    )
+    is_same = is_lossless and operators_calls == compact_calls
+    print(
+        "round-trip: "
+        + ("lossless" if is_lossless else "DIFFERENT OPERATORS")
+        + ("" if operators_calls == compact_calls else ", DIFFERENT ITERATION"),
+    )
+    return 0 if is_same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
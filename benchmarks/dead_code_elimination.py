@@ -0,0 +1,59 @@
+"""Benchmark of dead code elimination on program where most functions (and their memories) are unused.
+
+Usage: `python -m benchmarks.dead_code_elimination [--functions N] [--reachable N] [--repeats N]`.
+Only functions reachable from entry point (and their memories) must be kept.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+from gofra.gofra import process_input_file
+from gofra.optimizer.strategies import optimize_dead_code_elimination
+
+from ._programs import best_of, mostly_unused_functions_program
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=5000)
+    parser.add_argument("--reachable", type=int, default=35)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "mostly_unused_functions.gof"
+        path.write_text(
+            mostly_unused_functions_program(args.functions, args.reachable),
+        )
+        programs = [
+            process_input_file(path, include_paths=[]) for _ in range(args.repeats)
+        ]
+
+    functions_before = len(programs[0].functions)
+    memories_before = len(programs[0].memories)
+    remaining_programs = iter(programs)
+
+    def eliminate() -> tuple[set[str], set[str]]:
+        program = next(remaining_programs)
+        optimize_dead_code_elimination(program)
+        return set(program.functions), set(program.memories)
+
+    elapsed, (functions, memories) = best_of(args.repeats, eliminate)
+    is_expected = functions == {f"f{idx}" for idx in range(args.reachable)} and (
+        memories == {f"m{idx}" for idx in range(args.reachable)}
+    )
+    print(
+        f"{elapsed * 1000:.1f}ms, "
+        f"functions {functions_before} -> {len(functions)}, "
+        f"memories {memories_before} -> {len(memories)}"
+        + ("" if is_expected else "  UNEXPECTED RESULT"),
+    )
+    return 0 if is_expected else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
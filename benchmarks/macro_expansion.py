@@ -0,0 +1,98 @@
+"""Benchmark of macro expansion from pre-parsed operator templates against expansion from macro tokens.
+
+Usage: `python -m benchmarks.macro_expansion [--usages N] [--repeats N]`.
+Single function uses macro given count of times (100k by default), for macro with nested blocks and for short macros.
+Each program is parsed with templates and with templates disabled (every usage is parsed from macro tokens again),
+both must produce same operators.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from gofra.parser import parse_file
+
+from ._programs import best_of
+
+# Macro bodies (by name of case), each usage of macro is followed by `drop` of its result
+MACRO_BODIES = {
+    "nested blocks": "1 1 == if 2 2 == if 3 drop end end 4",
+    "constant": "1",
+    "expression": "2 3 +",
+}
+
+
+def macro_usages_program(body: str, usages: int) -> str:
+    """Get source of program with single function that uses macro with given body given count of times."""
+    return (
+        f"macro BODY {body} end\n"
+        "func void main\n" + "    BODY drop\n" * usages + "end\n"
+    )
+
+
+def _operators_snapshot(path: Path) -> list[tuple[object, ...]]:
+    _, entry_point = parse_file(path, [])
+    return [
+        (
+            operator.type,
+            operator.operand,
+            operator.jumps_to_operator_idx,
+            operator.token.location,
+        )
+        for operator in entry_point.source
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--usages", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.usages} usages of macro")
+    print(
+        f"{'macro':<16}{'operators':>10}{'tokens':>10}{'templates':>11}{'speedup':>9}",
+    )
+    is_same = True
+    with tempfile.TemporaryDirectory() as directory:
+        for name, body in MACRO_BODIES.items():
+            path = Path(directory) / "macro_usages.gof"
+            path.write_text(macro_usages_program(body, args.usages))
+
+            # Only parsing is timed (its result is dropped), so operators of one run are not alive within other
+            def parse(path: Path = path) -> int:
+                _, entry_point = parse_file(path, [])
+                return len(entry_point.source)
+
+            # Without template, each usage of macro is expanded from its tokens
+            without_templates = mock.patch(
+                "gofra.parser.parser._parse_macro_template",
+                return_value=None,
+            )
+            with without_templates:
+                tokens_time, _ = best_of(args.repeats, parse)
+            templates_time, _ = best_of(args.repeats, parse)
+
+            with without_templates:
+                tokens_snapshot = _operators_snapshot(path)
+            templates_snapshot = _operators_snapshot(path)
+            is_same &= templates_snapshot == tokens_snapshot
+            print(
+                f"{name:<16}{len(templates_snapshot):>10}"
+                f"{tokens_time:>9.2f}s{templates_time:>10.2f}s"
+                f"{tokens_time / templates_time:>8.2f}x"
+                + (
+                    ""
+                    if templates_snapshot == tokens_snapshot
+                    else "  DIFFERENT OUTPUT"
+                ),
+            )
+    return 0 if is_same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Benchmark of parallel parsing of function bodies (`-j/--jobs`) against single-pass parsing.
+
+Usage: `python -m benchmarks.parallel_parsing [--functions N] [--jobs 1 2 4 8] [--repeats N]`.
+Each count of jobs must produce same functions (every operator field and location) as single-pass parsing.
+Count of jobs is capped by count of available CPUs, so effective count is reported next to requested one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+from gofra.parser import parse_file
+from gofra.parser.parallel import parallel_jobs_count
+
+from ._programs import best_of, many_functions_program
+
+
+def _functions_snapshot(path: Path, jobs: int) -> dict[str, list[tuple[object, ...]]]:
+    context, entry_point = parse_file(path, [], jobs=jobs)
+    return {
+        function.name: [
+            (
+                operator.type,
+                operator.operand,
+                operator.jumps_to_operator_idx,
+                operator.token.location,
+                operator.expanded_from.location if operator.expanded_from else None,
+            )
+            for operator in function.source
+        ]
+        for function in (*context.functions.values(), entry_point)
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=3000)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "many_functions.gof"
+        path.write_text(many_functions_program(args.functions))
+
+        serial_time, serial_snapshot = best_of(
+            args.repeats,
+            lambda: _functions_snapshot(path, jobs=1),
+        )
+        print(
+            f"{args.functions} functions, available CPUs: {parallel_jobs_count(2**16)}",
+        )
+        print(f"{'jobs':>6}{'effective':>11}{'time':>10}{'speedup':>9}")
+        is_same = True
+        for jobs in args.jobs:
+            elapsed, snapshot = best_of(
+                args.repeats,
+                lambda jobs=jobs: _functions_snapshot(path, jobs=jobs),
+            )
+            is_same &= snapshot == serial_snapshot
+            print(
+                f"{jobs:>6}{parallel_jobs_count(jobs):>11}{elapsed:>9.3f}s"
+                f"{serial_time / elapsed:>8.2f}x"
+                + ("" if snapshot == serial_snapshot else "  DIFFERENT OUTPUT"),
+            )
+    return 0 if is_same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""Benchmark of typechecking within process pool (`-j/--jobs`) against serial typechecking.
+
+Usage: `python -m benchmarks.parallel_typecheck [--functions N] [--jobs 1 2 4 8] [--repeats N]`.
+Program is parsed once, then typechecked with each count of jobs (every count must accept it, as serial does).
+Count of jobs is capped by count of available CPUs, so effective count is reported next to requested one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+from gofra.consts import GOFRA_ENTRY_POINT
+from gofra.exceptions import GofraError
+from gofra.parser import parse_file
+from gofra.parser.parallel import parallel_jobs_count
+from gofra.typecheck import validate_type_safety
+
+from ._programs import best_of, many_functions_program
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=3000)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "many_functions.gof"
+        path.write_text(many_functions_program(args.functions))
+        context, entry_point = parse_file(path, [])
+    functions = {**context.functions, GOFRA_ENTRY_POINT: entry_point}
+
+    def typecheck(jobs: int) -> str:
+        try:
+            validate_type_safety(functions, jobs=jobs)
+        except GofraError as e:
+            return type(e).__name__
+        return "ok"
+
+    serial_time, serial_result = best_of(args.repeats, lambda: typecheck(jobs=1))
+    operators_count = sum(len(function.source) for function in functions.values())
+    print(
+        f"{len(functions)} functions ({operators_count} operators), "
+        f"available CPUs: {parallel_jobs_count(2**16)}, serial: {serial_result}",
+    )
+    print(f"{'jobs':>6}{'effective':>11}{'time':>10}{'speedup':>9}")
+    is_same = True
+    for jobs in args.jobs:
+        elapsed, result = best_of(args.repeats, lambda jobs=jobs: typecheck(jobs=jobs))
+        is_same &= result == serial_result
+        print(
+            f"{jobs:>6}{parallel_jobs_count(jobs):>11}{elapsed * 1000:>8.1f}ms"
+            f"{serial_time / elapsed:>8.2f}x"
+            + ("" if result == serial_result else f"  DIFFERENT RESULT ({result})"),
+        )
+    return 0 if is_same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""Benchmark of memory taken by tokens (and their locations) that are alive after parsing of large program.
+
+Usage: `python -m benchmarks.token_memory [--functions N]`.
+Program is parsed once and kept alive, then peak RSS of process and live `Token` / `TokenLocation` objects are reported.
+Size of live objects is compared against same objects within unslotted layout (per-instance `__dict__`,
+location holding its `Path`), which is layout of tokens before these are slotted and their paths interned.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import resource
+import sys
+import tempfile
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from gofra.gofra import process_input_file
+from gofra.lexer import Token
+from gofra.lexer.tokens import TokenLocation, TokenType
+
+from ._programs import many_functions_program
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Instances created to measure size of single instance
+SIZE_SAMPLE_INSTANCES = 10_000
+
+
+@dataclass(frozen=True)
+class _UnslottedTokenLocation:
+    filepath: Path
+    line_number: int
+    col_number: int
+
+
+@dataclass(frozen=True)
+class _UnslottedToken:
+    type: TokenType
+    text: str
+    value: int | float | str
+    location: _UnslottedTokenLocation
+
+
+def instance_size(create: Callable[[], object]) -> float:
+    """Get bytes allocated per instance created by given function (averaged over many instances)."""
+    tracemalloc.start()
+    try:
+        instances = [create() for _ in range(SIZE_SAMPLE_INSTANCES)]
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (allocated - sys.getsizeof(instances)) / len(instances)
+
+
+def peak_rss_mib() -> float:
+    """Get peak resident set size of current process (in MiB)."""
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports it in KiB, macOS in bytes
+    return peak_rss / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "many_functions.gof"
+        path.write_text(many_functions_program(args.functions))
+        program = process_input_file(path, include_paths=[])
+
+    # Measured before sizes of instances are sampled, so these are not counted
+    parsed_peak_rss = peak_rss_mib()
+
+    gc.collect()
+    objects = gc.get_objects()
+    tokens = [obj for obj in objects if type(obj) is Token]
+    locations = [obj for obj in objects if type(obj) is TokenLocation]
+    del objects
+
+    sample_path = Path(directory)
+    sizes = {
+        "Token": (
+            len(tokens),
+            instance_size(
+                lambda: Token(
+                    TokenType.WORD,
+                    "",
+                    "",
+                    TokenLocation.from_filepath(sample_path, 0, 0),
+                ),
+            )
+            - instance_size(lambda: TokenLocation.from_filepath(sample_path, 0, 0)),
+            instance_size(
+                lambda: _UnslottedToken(
+                    TokenType.WORD,
+                    "",
+                    "",
+                    _UnslottedTokenLocation(sample_path, 0, 0),
+                ),
+            )
+            - instance_size(lambda: _UnslottedTokenLocation(sample_path, 0, 0)),
+        ),
+        "TokenLocation": (
+            len(locations),
+            instance_size(lambda: TokenLocation.from_filepath(sample_path, 0, 0)),
+            instance_size(lambda: _UnslottedTokenLocation(sample_path, 0, 0)),
+        ),
+    }
+
+    print(
+        f"{args.functions} functions ({len(program.functions)} parsed), "
+        f"peak RSS: {parsed_peak_rss:.1f} MiB",
+    )
+    print(f"{'':<16}{'live':>10}{'slotted':>18}{'unslotted':>18}")
+    for name, (count, slotted_size, unslotted_size) in sizes.items():
+        print(
+            f"{name:<16}{count:>10}"
+            f"{slotted_size:>6.0f}B{count * slotted_size / 2**20:>9.1f} MiB"
+            f"{unslotted_size:>6.0f}B{count * unslotted_size / 2**20:>9.1f} MiB",
+        )
+
+    # Live tokens must be found (and be slotted, without per-instance dictionary)
+    is_slotted = bool(tokens and locations) and not any(
+        hasattr(instance, "__dict__") for instance in (tokens[0], locations[0])
+    )
+    return 0 if is_slotted else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""Benchmark of memory allocated while reading tokens with forward token cursor against reversed token deque.
+
+Usage: `python -m benchmarks.token_reading [--functions N] [--repeats N]`.
+Tokens of generated program are read one by one (as parser reads them) from:
+- reversed deque, which parser used before (lexer stream is materialized and copied before first token is read),
+- forward token cursor over lazily lexed stream (tokens are lexed while they are read).
+Both must read same count of tokens, memory is traced with `tracemalloc` (when reading starts and at peak).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import tracemalloc
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from gofra.lexer import load_file_for_lexical_analysis
+from gofra.parser.cursor import TokenCursor
+
+from ._programs import best_of, many_functions_program
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from gofra.lexer import Token
+
+
+def read_from_reversed_deque(path: Path) -> tuple[int, int]:
+    """Read tokens from reversed deque, get traced memory when reading starts and count of read tokens."""
+    tokens = deque(reversed(list(load_file_for_lexical_analysis(path))))
+    started_with, _ = tracemalloc.get_traced_memory()
+    read_count = 0
+    while tokens:
+        tokens.pop()
+        read_count += 1
+    return started_with, read_count
+
+
+def read_from_cursor(path: Path) -> tuple[int, int]:
+    """Read tokens from forward cursor, get traced memory when reading starts and count of read tokens."""
+    cursor = TokenCursor(load_file_for_lexical_analysis(path))
+    started_with, _ = tracemalloc.get_traced_memory()
+    read_count = 0
+    while not cursor.is_exhausted():
+        cursor.pop()
+        read_count += 1
+    return started_with, read_count
+
+
+def traced_reading(
+    read: Callable[[Path], tuple[int, int]],
+    path: Path,
+) -> tuple[int, int, int]:
+    """Get traced memory when reading starts, peak of traced memory and count of read tokens."""
+    tracemalloc.start()
+    try:
+        started_with, read_count = read(path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return started_with, peak, read_count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=5000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    readers: dict[str, Callable[[Path], tuple[int, int]]] = {
+        "reversed deque": read_from_reversed_deque,
+        "token cursor": read_from_cursor,
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "many_functions.gof"
+        path.write_text(many_functions_program(args.functions))
+
+        tokens: list[Token] = list(load_file_for_lexical_analysis(path))
+        print(
+            f"{args.functions} functions ({path.stat().st_size / 2**20:.1f} MiB source, {len(tokens)} tokens)",
+        )
+        print(f"{'':<16}{'at start':>12}{'peak':>12}{'time':>10}")
+        is_same = True
+        for name, read in readers.items():
+            started_with, peak, read_count = traced_reading(read, path)
+            # Timed without tracing, as tracing slows allocations
+            elapsed, _ = best_of(args.repeats, lambda read=read: read(path))
+            is_same &= read_count == len(tokens)
+            print(
+                f"{name:<16}{started_with / 2**20:>8.1f} MiB{peak / 2**20:>8.1f} MiB"
+                f"{elapsed * 1000:>8.0f}ms"
+                + ("" if read_count == len(tokens) else "  DIFFERENT TOKENS COUNT"),
+            )
+    return 0 if is_same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
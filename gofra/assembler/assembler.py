@@ -10,9 +10,11 @@ from subprocess import CalledProcessError, check_output
 from typing import TYPE_CHECKING, Literal
 
 from gofra.cli.output import cli_message
+from gofra.cli.time_report import TimeReport
 from gofra.codegen import generate_code_for_assembler
 from gofra.codegen.backends.general import CODEGEN_ENTRY_POINT_SYMBOL
 from gofra.codegen.get_backend import get_backend_for_target
+from gofra.tracing import trace_span
 
 from .exceptions import (
     NoToolkitForAssemblingError,
@@ -37,31 +39,40 @@ def assemble_program(  # noqa: PLR0913
     additional_linker_flags: list[str],
     additional_assembler_flags: list[str],
     delete_build_cache_after_compilation: bool,
+    time_report: TimeReport | None = None,
 ) -> None:
-    """Convert given program into executable/library/etc using assembly and linker."""
-    _validate_toolkit_installation()
-    _prepare_build_cache_directory(build_cache_dir)
+    """Convert given program into executable/library/etc using assembly and linker.
 
-    assembly_filepath = _generate_assembly_file_with_codegen(
-        context,
-        target,
-        output,
-        build_cache_dir=build_cache_dir,
-        verbose=verbose,
-    )
+    Codegen, assembler and linker are measured as separate phases within given time report (if any).
+    """
+    time_report = time_report or TimeReport(enabled=False)
+    _validate_toolkit_installation()
+    prepare_build_cache_directory(build_cache_dir)
+
+    with time_report.phase("codegen") as phase:
+        assembly_filepath = _generate_assembly_file_with_codegen(
+            context,
+            target,
+            output,
+            build_cache_dir=build_cache_dir,
+            verbose=verbose,
+        )
+        phase.counts["assembly_bytes"] = assembly_filepath.stat().st_size
 
     if output_format == "assembly":
         assembly_filepath.replace(output)
         return
 
-    object_filepath = _assemble_object_file(
-        target,
-        assembly_filepath,
-        output,
-        additional_assembler_flags=additional_assembler_flags,
-        build_cache_dir=build_cache_dir,
-        verbose=verbose,
-    )
+    with time_report.phase("assembler") as phase:
+        object_filepath = _assemble_object_file(
+            target,
+            assembly_filepath,
+            output,
+            additional_assembler_flags=additional_assembler_flags,
+            build_cache_dir=build_cache_dir,
+            verbose=verbose,
+        )
+        phase.counts["object_bytes"] = object_filepath.stat().st_size
     if output_format == "object":
         object_filepath.replace(output)
         if delete_build_cache_after_compilation:
@@ -69,21 +80,23 @@ def assemble_program(  # noqa: PLR0913
         return
 
     assert output_format in ("executable", "library")
-    _link_final_output(
-        output,
-        target,
-        object_filepath,
-        output_format=output_format,
-        additional_linker_flags=additional_linker_flags,
-        verbose=verbose,
-    )
+    with time_report.phase("linker") as phase:
+        _link_final_output(
+            output,
+            target,
+            object_filepath,
+            output_format=output_format,
+            additional_linker_flags=additional_linker_flags,
+            verbose=verbose,
+        )
+        phase.counts["output_bytes"] = output.stat().st_size
 
     if delete_build_cache_after_compilation:
         assembly_filepath.unlink()
         object_filepath.unlink()
 
 
-def _prepare_build_cache_directory(build_cache_directory: Path) -> None:
+def prepare_build_cache_directory(build_cache_directory: Path) -> None:
     """Try to create and fill cache directory with required files."""
     if build_cache_directory.exists():
         return
@@ -149,7 +162,8 @@ def _link_final_output(  # noqa: PLR0913
         text=f"Running linker command: `{' '.join(command)}`",
         verbose=verbose,
     )
-    check_output(command)  # noqa: S603
+    with trace_span("ld", category="subprocess", args={"command": command}):
+        check_output(command)  # noqa: S603
 
 
 def _assemble_object_file(  # noqa: PLR0913
@@ -191,7 +205,8 @@ def _assemble_object_file(  # noqa: PLR0913
         verbose=verbose,
     )
     try:
-        check_output(command)  # noqa: S603
+        with trace_span("as", category="subprocess", args={"command": command}):
+            check_output(command)  # noqa: S603
     except CalledProcessError as e:
         cli_message(
             "ERROR",
@@ -8,10 +8,14 @@ from platform import system as current_platform_system
 from typing import TYPE_CHECKING
 
 from gofra.cli.output import cli_message
+from gofra.optimizer import OPTIMIZATION_PASSES
 
 if TYPE_CHECKING:
     from gofra.assembler.assembler import OUTPUT_FORMAT_T
+    from gofra.cli.ir import IR_FORMAT_T
     from gofra.codegen.targets import TARGET_T
+    from gofra.lexer import LEXER_ENGINE_T
+    from gofra.optimizer import OPTIMIZATION_LEVEL_T
 
 
 @dataclass(frozen=True)
@@ -27,7 +31,7 @@ class CLIArguments:
 
     include_paths: list[Path]
 
-    ir: bool
+    ir: IR_FORMAT_T | None
 
     linker_flags: list[str]
     assembler_flags: list[str]
@@ -36,12 +40,32 @@ class CLIArguments:
 
     target: TARGET_T
 
-    disable_optimizations: bool
+    optimization_level: OPTIMIZATION_LEVEL_T
+    optimization_remarks: bool
+    # Names of optimization passes to apply instead of pipeline of optimization level
+    optimization_passes: list[str] | None
+    optimization_passes_report: bool
     skip_typecheck: bool
 
     build_cache_dir: Path
     delete_build_cache: bool
 
+    include_cache: bool
+    incremental_typecheck: bool
+    include_cache_stats: bool
+    peephole_stats: bool
+    print_includes: bool
+    stack_report: bool
+
+    lexer_engine: LEXER_ENGINE_T
+
+    jobs: int
+
+    time_report: bool
+    time_report_json: Path | None
+
+    trace: Path | None
+
 
 def parse_cli_arguments() -> CLIArguments:
     """Parse CLI arguments from argparse into custom DTO."""
@@ -65,6 +89,27 @@ def parse_cli_arguments() -> CLIArguments:
             text="Skipping typecheck is unsafe, ensure that you know what you doing",
         )
 
+    if args.jobs < 1:
+        cli_message(
+            level="ERROR",
+            text="Count of jobs must be at least one.",
+        )
+        sys.exit(1)
+
+    optimization_passes = (
+        [name for name in args.passes.split(",") if name]
+        if args.passes is not None
+        else None
+    )
+    for pass_name in optimization_passes or ():
+        if pass_name not in OPTIMIZATION_PASSES:
+            cli_message(
+                level="ERROR",
+                text=f"Unknown optimization pass '{pass_name}', "
+                f"available passes: {', '.join(OPTIMIZATION_PASSES)}",
+            )
+            sys.exit(1)
+
     target: TARGET_T = args.target or infer_target()
     assert target in ("x86_64-linux", "aarch64-darwin")
 
@@ -86,20 +131,36 @@ def parse_cli_arguments() -> CLIArguments:
 
     return CLIArguments(
         debug_symbols=bool(args.debug_symbols),
-        ir=bool(args.ir),
+        ir=args.ir,
         source_filepaths=source_filepaths,
         output_filepath=output_filepath,
         output_format=args.output_format,
         execute_after_compilation=bool(args.execute),
         delete_build_cache=bool(args.delete_cache),
+        include_cache=not bool(args.no_include_cache),
+        incremental_typecheck=bool(args.incremental_typecheck),
+        include_cache_stats=bool(args.include_cache_stats),
+        peephole_stats=bool(args.peephole_stats),
+        print_includes=bool(args.print_includes),
+        stack_report=bool(args.stack_report),
         build_cache_dir=Path(args.cache_dir),
         target=target,
-        disable_optimizations=bool(args.disable_optimizations),
+        optimization_level="0"
+        if args.disable_optimizations
+        else args.optimization_level,
+        optimization_remarks=bool(args.optimization_remarks),
+        optimization_passes=optimization_passes,
+        optimization_passes_report=bool(args.pass_stats),
         skip_typecheck=bool(args.skip_typecheck),
         include_paths=include_paths,
         verbose=bool(args.verbose),
         linker_flags=args.linker,
         assembler_flags=assembler_flags,
+        lexer_engine=args.lexer,
+        jobs=args.jobs,
+        time_report=bool(args.time_report),
+        time_report_json=Path(args.time_report_json) if args.time_report_json else None,
+        trace=Path(args.trace) if args.trace else None,
     )
 
 
@@ -145,9 +206,12 @@ def _construct_argument_parser() -> ArgumentParser:
 
     parser.add_argument(
         "-ir",
+        "--ir",
         required=False,
-        action="store_true",
-        help="If passed will just emit IR of provided file(s) into stdin.",
+        nargs="?",
+        const="operators",
+        choices=["operators", "cfg"],
+        help="If passed will just emit IR of provided file(s) into stdin. `cfg` emits basic blocks of each function with control flow between them.",
     )
     parser.add_argument(
         "--debug-symbols",
@@ -217,15 +281,81 @@ def _construct_argument_parser() -> ArgumentParser:
         required=False,
         help="If passed, will delete cache after run",
     )
+    parser.add_argument(
+        "--no-include-cache",
+        "-nic",
+        action="store_true",
+        required=False,
+        help="If passed, tokens of included files will not be loaded from (and stored into) cache directory",
+    )
+    parser.add_argument(
+        "--include-cache-stats",
+        action="store_true",
+        required=False,
+        help="If passed, will show hit/miss statistics of included files cache",
+    )
+    parser.add_argument(
+        "--peephole-stats",
+        action="store_true",
+        required=False,
+        help="If passed, will show hits of each peephole optimization rule",
+    )
+    parser.add_argument(
+        "--print-includes",
+        action="store_true",
+        required=False,
+        help="If passed, will show include graph (which files are included from where) with resolution time of each include",
+    )
+    parser.add_argument(
+        "--stack-report",
+        action="store_true",
+        required=False,
+        help="If passed, will show maximal data stack depth of each function and whole program (including called functions), requires typecheck",
+    )
 
     parser.add_argument(
         "--disable-optimizations",
         "-no",
         action="store_true",
         required=False,
-        help="If passed, all optimizations will be disable (DCE, CF)",
+        help="If passed, all optimizations will be disable (same as `-O0`)",
+    )
+    parser.add_argument(
+        "--optimization-level",
+        "-O",
+        type=str,
+        default="1",
+        required=False,
+        choices=["0", "1", "2", "s"],
+        help="Level of optimizations: 0 disables them, 1 (default) and 2 inlines more calls (larger code), s optimizes for size",
+    )
+    parser.add_argument(
+        "--optimization-remarks",
+        action="store_true",
+        required=False,
+        help="If passed, will show decisions made by optimizer (e.g which calls are inlined and why)",
+    )
+    parser.add_argument(
+        "--passes",
+        type=str,
+        default=None,
+        required=False,
+        help=f"Comma separated optimization passes to apply instead of pipeline of optimization level (required passes are applied before), available: {', '.join(OPTIMIZATION_PASSES)}",
+    )
+    parser.add_argument(
+        "--pass-stats",
+        action="store_true",
+        required=False,
+        help="If passed, will show time and program size change of each applied optimization pass",
     )
 
+    parser.add_argument(
+        "--incremental-typecheck",
+        "-it",
+        action="store_true",
+        required=False,
+        help="If passed, functions that are typechecked within previous compilation (and not changed since) will not be typechecked again (stored within cache directory)",
+    )
     parser.add_argument(
         "--skip-typecheck",
         "-nt",
@@ -234,6 +364,43 @@ def _construct_argument_parser() -> ArgumentParser:
         help="If passed, will disable type safety checking",
     )
 
+    parser.add_argument(
+        "--lexer",
+        type=str,
+        required=False,
+        default="scanner",
+        choices=["scanner", "lines"],
+        help="Lexer engine to tokenize source files with. Both produces same tokens, `scanner` is faster (whole-buffer regex), `lines` is original line-by-line lexer",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        required=False,
+        default=1,
+        help="Count of processes to parse and typecheck function bodies with (capped by count of available CPUs). Parallel parsing and typechecking pays off only on programs with many functions",
+    )
+
+    parser.add_argument(
+        "--time-report",
+        action="store_true",
+        required=False,
+        help="If passed, will show wall/CPU time, peak Python memory and counters of each compilation phase (parse, typecheck, optimize, codegen, assembler, linker), memory tracing slows down compilation",
+    )
+    parser.add_argument(
+        "--time-report-json",
+        type=str,
+        required=False,
+        help="Path to JSON file to store time report into (machine-readable form of `--time-report`)",
+    )
+    parser.add_argument(
+        "--trace",
+        type=str,
+        required=False,
+        help="Path to JSON file to store trace of compiler internals into (Chrome trace-event format, viewable within `chrome://tracing` or Perfetto)",
+    )
+
     return parser
 
 
@@ -1,16 +1,32 @@
 import sys
+from collections.abc import Generator
+from contextlib import contextmanager
 from subprocess import CalledProcessError, run
 
-from gofra.assembler import assemble_program
-from gofra.cli.ir import emit_ir_into_stdout
+from gofra.assembler import assemble_program, prepare_build_cache_directory
+from gofra.cli.includes import emit_include_graph_into_stdout
+from gofra.cli.ir import emit_cfg_into_stdout, emit_ir_into_stdout
 from gofra.consts import GOFRA_ENTRY_POINT
+from gofra.context import ProgramContext
 from gofra.gofra import process_input_file
+from gofra.lexer.cache import TokenCache
 from gofra.optimizer import optimize_program
-from gofra.typecheck import validate_type_safety
+from gofra.parser.includes import IncludeGraph
+from gofra.tracing import start_tracing, stop_tracing
+from gofra.typecheck import TypecheckCache, analyze_stack_depth, validate_type_safety
 
 from .arguments import CLIArguments, parse_cli_arguments
 from .errors import cli_gofra_error_handler
 from .output import cli_message
+from .remarks import emit_optimization_remarks_into_stdout
+from .stack_report import emit_stack_report_into_stdout
+from .time_report import (
+    TimeReport,
+    count_program_definitions,
+    emit_optimization_passes_report_into_stdout,
+    emit_time_report_into_stdout,
+    write_time_report_json,
+)
 
 
 def cli_entry_point() -> None:
@@ -19,7 +35,8 @@ def cli_entry_point() -> None:
         args = parse_cli_arguments()
         assert len(args.source_filepaths) == 1
 
-        cli_process_toolchain_on_input_files(args)
+        with cli_tracing(args):
+            cli_process_toolchain_on_input_files(args)
 
         if args.execute_after_compilation:
             if args.output_format != "executable":
@@ -31,10 +48,70 @@ def cli_entry_point() -> None:
             cli_execute_after_compilation(args)
 
 
+@contextmanager
+def cli_tracing(args: CLIArguments) -> Generator[None]:
+    """Trace compiler internals within context if user requested.
+
+    Trace is stored even if compilation is failed, so it is possible to see where it was failed.
+    """
+    if args.trace is None:
+        yield
+        return
+
+    tracer = start_tracing()
+    try:
+        yield
+    finally:
+        stop_tracing()
+        tracer.write(args.trace)
+        cli_message(
+            level="INFO",
+            text=f"Stored trace of {len(tracer.events)} events into `{args.trace}`",
+            verbose=args.verbose,
+        )
+
+
 def cli_process_toolchain_on_input_files(args: CLIArguments) -> None:
     """Process full toolchain onto input source files."""
+    token_cache = None
+    if args.include_cache:
+        prepare_build_cache_directory(args.build_cache_dir)
+        token_cache = TokenCache(
+            directory=args.build_cache_dir / "includes",
+            lexer_engine=args.lexer_engine,
+        )
+
+    include_graph = IncludeGraph()
+    time_report = TimeReport(
+        enabled=args.time_report or args.time_report_json is not None,
+    )
+
     cli_message(level="INFO", text="Parsing input files...", verbose=args.verbose)
-    context = process_input_file(args.source_filepaths[0], args.include_paths)
+    with time_report.phase("parse") as phase:
+        context = process_input_file(
+            args.source_filepaths[0],
+            args.include_paths,
+            lexer_engine=args.lexer_engine,
+            token_cache=token_cache,
+            include_graph=include_graph,
+            jobs=args.jobs,
+        )
+        phase.counts["tokens"] = context.parsed_tokens_count
+        phase.counts["files"] = len(include_graph.included_paths)
+        phase.counts.update(count_program_definitions(context))
+
+    if args.print_includes:
+        emit_include_graph_into_stdout(include_graph)
+
+    if args.include_cache_stats:
+        cli_message(
+            level="INFO",
+            text=(
+                f"Include cache: {token_cache.hits} hits, {token_cache.misses} misses"
+                if token_cache
+                else "Include cache is disabled"
+            ),
+        )
 
     if not args.skip_typecheck:
         cli_message(
@@ -42,20 +119,70 @@ def cli_process_toolchain_on_input_files(args: CLIArguments) -> None:
             text="Validating type safety...",
             verbose=args.verbose,
         )
-        validate_type_safety(
-            functions={**context.functions, GOFRA_ENTRY_POINT: context.entry_point},
-        )
+        typecheck_cache = None
+        if args.incremental_typecheck:
+            prepare_build_cache_directory(args.build_cache_dir)
+            typecheck_cache = TypecheckCache(
+                directory=args.build_cache_dir / "typecheck",
+                program_path=args.source_filepaths[0],
+            )
+
+        with time_report.phase("typecheck") as phase:
+            validate_type_safety(
+                functions={**context.functions, GOFRA_ENTRY_POINT: context.entry_point},
+                cache=typecheck_cache,
+                jobs=args.jobs,
+            )
+            phase.counts.update(count_program_definitions(context))
+            if typecheck_cache:
+                phase.counts["skipped"] = typecheck_cache.skipped
 
-    if not args.disable_optimizations:
+        if typecheck_cache:
+            cli_message(
+                level="INFO",
+                text=f"Incremental typecheck: {typecheck_cache.skipped} functions skipped (unchanged), "
+                f"{typecheck_cache.checked} typechecked",
+                verbose=args.verbose,
+            )
+
+    if args.optimization_level != "0" or args.optimization_passes is not None:
         cli_message(
             level="INFO",
             text="Applying optimizations...",
             verbose=args.verbose,
         )
-        optimize_program(context)
+        with time_report.phase("optimize") as phase:
+            optimization_passes_statistics = optimize_program(
+                context,
+                level=args.optimization_level,
+                passes=args.optimization_passes,
+            )
+            phase.counts.update(count_program_definitions(context))
+            phase.counts["passes"] = len(optimization_passes_statistics)
+            phase.counts["peephole"] = sum(context.peephole_rules_hits.values())
+
+        if args.optimization_passes_report:
+            emit_optimization_passes_report_into_stdout(optimization_passes_statistics)
+
+        if args.peephole_stats:
+            cli_emit_peephole_stats(context)
+        if args.optimization_remarks:
+            emit_optimization_remarks_into_stdout(context)
+
+    if (args.ir or args.stack_report) and not args.skip_typecheck:
+        # Stack depth is emulated by typechecker, so it is only known for type safe program
+        analyze_stack_depth(
+            {**context.functions, GOFRA_ENTRY_POINT: context.entry_point},
+        )
+    if args.stack_report:
+        emit_stack_report_into_stdout(context, target=args.target)
 
     if args.ir:
-        emit_ir_into_stdout(context)
+        if args.ir == "cfg":
+            emit_cfg_into_stdout(context)
+        else:
+            emit_ir_into_stdout(context)
+        cli_emit_time_report(args, time_report)
         sys.exit(0)
 
     cli_message(
@@ -73,7 +200,9 @@ def cli_process_toolchain_on_input_files(args: CLIArguments) -> None:
         additional_assembler_flags=args.assembler_flags,
         build_cache_dir=args.build_cache_dir,
         delete_build_cache_after_compilation=args.delete_build_cache,
+        time_report=time_report,
     )
+    cli_emit_time_report(args, time_report)
 
     cli_message(
         level="INFO",
@@ -82,6 +211,27 @@ def cli_process_toolchain_on_input_files(args: CLIArguments) -> None:
     )
 
 
+def cli_emit_peephole_stats(context: ProgramContext) -> None:
+    """Show hits of each peephole optimization rule (most hit first)."""
+    if not context.peephole_rules_hits:
+        cli_message(level="INFO", text="Peephole: no rules applied")
+        return
+    for rule_name, hits in sorted(
+        context.peephole_rules_hits.items(),
+        key=lambda rule_hits: rule_hits[1],
+        reverse=True,
+    ):
+        cli_message(level="INFO", text=f"Peephole rule `{rule_name}`: {hits} hits")
+
+
+def cli_emit_time_report(args: CLIArguments, time_report: TimeReport) -> None:
+    """Show and/or store time report of compilation if user requested."""
+    if args.time_report:
+        emit_time_report_into_stdout(time_report)
+    if args.time_report_json:
+        write_time_report_json(time_report, args.time_report_json)
+
+
 def cli_execute_after_compilation(args: CLIArguments) -> None:
     """Run executable after compilation if user requested."""
     cli_message(
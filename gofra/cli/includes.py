@@ -0,0 +1,41 @@
+"""Include graph for CLI.
+
+Allows to view which files are included (and from where) from CLI.
+"""
+
+from typing import TYPE_CHECKING
+
+from gofra.parser.includes import IncludeGraph, IncludeRecord
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def emit_include_graph_into_stdout(include_graph: IncludeGraph) -> None:
+    """Display include graph via stdout, grouped by file in which include occurred."""
+    records = include_graph.records
+    total_resolution_time_ns = sum(record.resolution_time_ns for record in records)
+    print(
+        f"[include graph: {len(include_graph.included_paths)} files, "
+        f"{len(records)} includes, resolved in {_format_time(total_resolution_time_ns)}]",
+    )
+    records_by_includer: dict[Path, list[IncludeRecord]] = {}
+    for record in records:
+        records_by_includer.setdefault(record.included_from, []).append(record)
+
+    for included_from, included_records in records_by_includer.items():
+        print(f"{included_from}")
+        for record in included_records:
+            emit_include_record(record)
+
+
+def emit_include_record(record: IncludeRecord) -> None:
+    status = " (already included)" if record.was_already_included else ""
+    print(
+        f"   '{record.requested_path}' -> {record.resolved_path} "
+        f"[{_format_time(record.resolution_time_ns)}]{status}",
+    )
+
+
+def _format_time(time_ns: int) -> str:
+    return f"{time_ns / 1_000_000:.3f}ms"
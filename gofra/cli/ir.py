@@ -3,12 +3,17 @@
 Allows to view IR from CLI.
 """
 
+from typing import Literal
+
 from gofra.consts import GOFRA_ENTRY_POINT
 from gofra.context import ProgramContext
 from gofra.parser.functions.function import Function
 from gofra.parser.intrinsics import Intrinsic
 from gofra.parser.operators import Operator, OperatorType
 
+# `operators` is flat sequence of operators, `cfg` is basic blocks of control-flow graph
+type IR_FORMAT_T = Literal["operators", "cfg"]
+
 
 def emit_ir_into_stdout(context: ProgramContext) -> None:
     """Display IR via stdout."""
@@ -16,27 +21,65 @@ def emit_ir_into_stdout(context: ProgramContext) -> None:
     for function in functions.values():
         emit_ir_function_signature(function, context.entry_point)
         context_block_shift = 0
-        for operator in function.source:
+        for operator_idx, operator in enumerate(function.source):
             if operator.type in (OperatorType.DO, OperatorType.END):
                 context_block_shift -= 1
+            emit_ir_stack_depth(function, operator_idx)
             emit_ir_operator(operator, context_block_shift=context_block_shift)
             if operator.type in (OperatorType.DO, OperatorType.IF, OperatorType.WHILE):
                 context_block_shift += 1
 
 
+def emit_cfg_into_stdout(context: ProgramContext) -> None:
+    """Display IR as control-flow graph (basic blocks with their edges and dominators) via stdout."""
+    functions = {**context.functions, GOFRA_ENTRY_POINT: context.entry_point}
+    for function in functions.values():
+        emit_ir_function_signature(function, context.entry_point)
+        if function.is_externally_defined:
+            continue
+        control_flow_graph = function.control_flow_graph()
+        for block in control_flow_graph.blocks:
+            successors = ", ".join(f"BB{idx}" for idx in block.successors)
+            if block.exits_function:
+                successors = f"{successors}, exit" if successors else "exit"
+            immediate_dominator = control_flow_graph.immediate_dominators[block.idx]
+            attributes = [
+                f"-> {successors}",
+                f"idom=BB{immediate_dominator}"
+                if immediate_dominator is not None
+                else "",
+                "loop header" if block.is_loop_header else "",
+                "" if control_flow_graph.is_reachable(block.idx) else "unreachable",
+            ]
+            print(
+                f"  BB{block.idx} [{block.start}..{block.end}) "
+                + " ".join(attribute for attribute in attributes if attribute),
+            )
+            for operator_idx in range(block.start, block.end):
+                emit_ir_stack_depth(function, operator_idx)
+                emit_ir_operator(function.source[operator_idx], context_block_shift=1)
+
+
 def emit_ir_operator(operator: Operator, context_block_shift: int) -> None:  # noqa: PLR0911
     shift = " " * (context_block_shift + 3)
-    assert (  # noqa: PT018
-        not operator.has_optimizations
-        and not operator.infer_type_after_optimization
-        and not operator.syscall_optimization_injected_args
-        and not operator.syscall_optimization_omit_result
-    ), "Optimizations are not implemented in IR representation"
     match operator.type:
         case OperatorType.PUSH_INTEGER:
+            if operator.has_optimizations:
+                # Folded constant
+                inferred_type = operator.infer_type_after_optimization
+                return print(
+                    f"{shift}PUSH {operator.operand} (folded"
+                    + (f" {inferred_type.name}" if inferred_type else "")
+                    + ")",
+                )
             return print(f"{shift}PUSH {operator.operand}")
         case OperatorType.INTRINSIC:
             assert isinstance(operator.operand, Intrinsic)
+            if operator.is_syscall() and operator.has_optimizations:
+                return print(
+                    f"{shift}{operator.operand.name} "
+                    f"({_format_syscall_optimizations(operator)})",
+                )
             return print(f"{shift}{operator.operand.name}")
         case OperatorType.PUSH_MEMORY_POINTER:
             return print(f"{shift}PUSH_MEM '{operator.operand}'")
@@ -47,11 +90,51 @@ def emit_ir_operator(operator: Operator, context_block_shift: int) -> None:  # n
         case OperatorType.END:
             return print(f"{shift}" + "}")
         case OperatorType.FUNCTION_CALL:
+            if operator.call_optimization_is_tail_call:
+                return print(f"{shift}{operator.operand}() (tail call)")
             return print(f"{shift}{operator.operand}()")
         case _:
             return print(f"{shift}{operator.type.name}<{operator.operand}>")
 
 
+def _format_syscall_optimizations(operator: Operator) -> str:
+    """Format injected arguments (in order of popping, `_` is popped from stack) and omitted result of syscall."""
+    optimizations: list[str] = []
+    if operator.syscall_optimization_injected_args:
+        injected_args = ", ".join(
+            "_" if injected_arg is None else str(injected_arg)
+            for injected_arg in operator.syscall_optimization_injected_args
+        )
+        optimizations.append(f"injected [{injected_args}]")
+    if operator.syscall_optimization_omit_result:
+        optimizations.append("result omitted")
+    return ", ".join(optimizations)
+
+
+def emit_ir_stack_depth(function: Function, operator_idx: int) -> None:
+    """Display depth of stack before operator (prefix of operator line), if stack depth is analyzed."""
+    if function.stack_depth is None:
+        return
+    depth = function.stack_depth.operators_stack_depth[operator_idx]
+    print(f"[{'-' if depth is None else depth:>3}]", end="")
+
+
+def emit_ir_stack_depth_summary(function: Function) -> None:
+    if function.stack_depth is None:
+        return
+    max_stack_depth_with_calls = function.stack_depth.max_stack_depth_with_calls
+    print(
+        f"  (max stack depth={function.stack_depth.max_stack_depth}, "
+        "with calls="
+        + (
+            "unbounded"
+            if max_stack_depth_with_calls is None
+            else str(max_stack_depth_with_calls)
+        )
+        + ")",
+    )
+
+
 def emit_ir_function_signature(function: Function, entry_point: Function) -> None:
     if function.is_externally_defined:
         print(f"[external function symbol '{function.name}'", end=" ")
@@ -59,7 +142,9 @@ def emit_ir_function_signature(function: Function, entry_point: Function) -> Non
         return
     if function == entry_point:
         print(f"[entry point symbol '{function.name}']")
+        emit_ir_stack_depth_summary(function)
         return
     print(f"[function symbol '{function.name}'", end=" ")
     print(f"({function.type_contract_in} -> {function.type_contract_out})", end=" ")
     print(f"(global={function.is_global_linker_symbol})]")
+    emit_ir_stack_depth_summary(function)
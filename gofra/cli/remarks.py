@@ -0,0 +1,21 @@
+"""Optimization remarks for CLI.
+
+Allows to view decisions made by optimizer (what is applied or missed and why) at location of each decision.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from gofra.context import ProgramContext
+
+
+def emit_optimization_remarks_into_stdout(context: ProgramContext) -> None:
+    """Display each optimization remark via stdout (in order of decisions)."""
+    for remark in context.optimization_remarks:
+        location = remark.token.location
+        print(
+            f"{location.filepath}:{location.line_number + 1}:{location.col_number + 1}: "
+            f"remark [{remark.optimization}] {remark.kind}: {remark.message}",
+        )
@@ -0,0 +1,55 @@
+"""Data stack depth report for CLI.
+
+Allows to view how deep data stack grows within each function (and whole program), to size stack of deployments.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from gofra.codegen.backends.aarch64_macos.registers import AARCH64_STACK_ALIGNMENT
+from gofra.consts import GOFRA_ENTRY_POINT
+
+if TYPE_CHECKING:
+    from gofra.codegen.targets import TARGET_T
+    from gofra.context import ProgramContext
+
+# Bytes of machine stack that single stack cell occupies within code generated for target
+_TARGET_STACK_CELL_SIZE: dict[TARGET_T, int] = {
+    "x86_64-linux": 8,
+    "aarch64-darwin": AARCH64_STACK_ALIGNMENT,
+}
+
+
+def emit_stack_report_into_stdout(context: ProgramContext, target: TARGET_T) -> None:
+    """Display maximal stack depth of each function (and whole program) via stdout.
+
+    Stack depth must be analyzed before (attached to functions).
+    """
+    functions = {**context.functions, GOFRA_ENTRY_POINT: context.entry_point}
+    print(f"{'function':<32}{'max depth':>12}{'with calls':>12}")
+    for name, function in functions.items():
+        if function.stack_depth is None:
+            continue
+        print(
+            f"{name:<32}"
+            f"{function.stack_depth.max_stack_depth:>12}"
+            f"{_format_depth(function.stack_depth.max_stack_depth_with_calls):>12}",
+        )
+
+    entry_point_stack_depth = context.entry_point.stack_depth
+    if entry_point_stack_depth is None:
+        return
+    program_stack_depth = entry_point_stack_depth.max_stack_depth_with_calls
+    if program_stack_depth is None:
+        print("Program data stack depth is unbounded (recursive calls)")
+        return
+    cell_size = _TARGET_STACK_CELL_SIZE[target]
+    print(
+        f"Program data stack depth is {program_stack_depth} cells "
+        f"({program_stack_depth * cell_size} bytes on {target}, without return addresses)",
+    )
+
+
+def _format_depth(depth: int | None) -> str:
+    return "unbounded" if depth is None else str(depth)
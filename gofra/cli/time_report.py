@@ -0,0 +1,182 @@
+"""Per-phase compilation time (and memory) report for CLI.
+
+Allows to view where compilation time is spent (parser, typechecker, optimizer, codegen, assembler and linker).
+Python memory is traced with `tracemalloc` only when report is enabled, as tracing slows down compilation.
+"""
+
+from __future__ import annotations
+
+import json
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from resource import RUSAGE_CHILDREN, getrusage
+from time import perf_counter_ns, process_time_ns
+from typing import TYPE_CHECKING
+
+from gofra.consts import GOFRA_VERSION
+from gofra.tracing import trace_span
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from gofra.context import ProgramContext
+    from gofra.optimizer import OptimizationPassStatistics
+
+
+@dataclass(frozen=False, slots=True)
+class PhaseTiming:
+    """Measurements of single compilation phase."""
+
+    name: str
+
+    wall_time_ns: int = 0
+    # CPU time of compiler process itself
+    cpu_time_ns: int = 0
+    # CPU time of subprocesses (assembler, linker) that was finished within phase
+    subprocess_time_ns: int = 0
+    # Peak of memory allocated by Python within phase
+    peak_memory_bytes: int = 0
+
+    # Phase specific counters (tokens, operators, functions, etc.)
+    counts: dict[str, int] = field(default_factory=lambda: dict())  # noqa: C408
+
+
+@dataclass(frozen=False)
+class TimeReport:
+    """Report of compilation phases in order they was finished.
+
+    If report is disabled, phases are not measured (and not recorded).
+    """
+
+    enabled: bool = field(default=True)
+    phases: list[PhaseTiming] = field(default_factory=lambda: list())  # noqa: C408
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[PhaseTiming]:
+        """Measure phase within context, counters may be filled by caller.
+
+        Phase is also traced (if tracing is enabled).
+        """
+        with trace_span(name, category="phase"):
+            yield from self._measure_phase(name)
+
+    def _measure_phase(self, name: str) -> Generator[PhaseTiming]:
+        phase = PhaseTiming(name=name)
+        if not self.enabled:
+            yield phase
+            return
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+
+        subprocess_time_started_at = _subprocesses_cpu_time_ns()
+        cpu_time_started_at = process_time_ns()
+        wall_time_started_at = perf_counter_ns()
+        try:
+            yield phase
+        finally:
+            phase.wall_time_ns = perf_counter_ns() - wall_time_started_at
+            phase.cpu_time_ns = process_time_ns() - cpu_time_started_at
+            phase.subprocess_time_ns = (
+                _subprocesses_cpu_time_ns() - subprocess_time_started_at
+            )
+            _, phase.peak_memory_bytes = tracemalloc.get_traced_memory()
+            self.phases.append(phase)
+
+    def total(self) -> PhaseTiming:
+        """Get sum of all phases (peak memory is peak of all phases)."""
+        return PhaseTiming(
+            name="total",
+            wall_time_ns=sum(phase.wall_time_ns for phase in self.phases),
+            cpu_time_ns=sum(phase.cpu_time_ns for phase in self.phases),
+            subprocess_time_ns=sum(phase.subprocess_time_ns for phase in self.phases),
+            peak_memory_bytes=max(
+                (phase.peak_memory_bytes for phase in self.phases),
+                default=0,
+            ),
+        )
+
+
+def count_program_definitions(context: ProgramContext) -> dict[str, int]:
+    """Get counters of program (used as counters of phases that are transforming program)."""
+    functions = [*context.functions.values(), context.entry_point]
+    return {
+        "functions": len(functions),
+        "operators": sum(len(function.source) for function in functions),
+        "memories": len(context.memories),
+    }
+
+
+def emit_time_report_into_stdout(time_report: TimeReport) -> None:
+    """Display time report via stdout, one phase per line with total at the end."""
+    print(
+        f"{'phase':<12}{'wall':>12}{'cpu':>12}{'subprocess':>12}{'peak memory':>14}  counts",
+    )
+    for phase in (*time_report.phases, time_report.total()):
+        counts = ", ".join(f"{name}={count}" for name, count in phase.counts.items())
+        print(
+            f"{phase.name:<12}"
+            f"{_format_time(phase.wall_time_ns):>12}"
+            f"{_format_time(phase.cpu_time_ns):>12}"
+            f"{_format_time(phase.subprocess_time_ns):>12}"
+            f"{_format_memory(phase.peak_memory_bytes):>14}"
+            f"  {counts}",
+        )
+
+
+def emit_optimization_passes_report_into_stdout(
+    statistics: list[OptimizationPassStatistics],
+) -> None:
+    """Display time and program size change of each applied optimization pass via stdout."""
+    print(f"{'pass':<20}{'wall':>12}{'operators':>30}{'functions':>24}")
+    for pass_statistics in statistics:
+        print(
+            f"{pass_statistics.name:<20}"
+            f"{_format_time(pass_statistics.wall_time_ns):>12}"
+            f"{_format_size_delta(pass_statistics.operators_before, pass_statistics.operators_after):>30}"
+            f"{_format_size_delta(pass_statistics.functions_before, pass_statistics.functions_after):>24}",
+        )
+
+
+def write_time_report_json(time_report: TimeReport, path: Path) -> None:
+    """Store time report as JSON file (machine-readable form of report)."""
+    report = {
+        "version": GOFRA_VERSION,
+        "phases": [_phase_to_json(phase) for phase in time_report.phases],
+        "total": _phase_to_json(time_report.total()),
+    }
+    with path.open("w") as fd:
+        json.dump(report, fd, indent=2)
+        fd.write("\n")
+
+
+def _phase_to_json(phase: PhaseTiming) -> dict[str, object]:
+    return {
+        "name": phase.name,
+        "wall_time_ns": phase.wall_time_ns,
+        "cpu_time_ns": phase.cpu_time_ns,
+        "subprocess_time_ns": phase.subprocess_time_ns,
+        "peak_memory_bytes": phase.peak_memory_bytes,
+        "counts": phase.counts,
+    }
+
+
+def _subprocesses_cpu_time_ns() -> int:
+    """Get CPU time of all finished (waited for) subprocesses of compiler."""
+    usage = getrusage(RUSAGE_CHILDREN)
+    return int((usage.ru_utime + usage.ru_stime) * 1_000_000_000)
+
+
+def _format_time(time_ns: int) -> str:
+    return f"{time_ns / 1_000_000:.3f}ms"
+
+
+def _format_size_delta(size_before: int, size_after: int) -> str:
+    return f"{size_before} -> {size_after} ({size_after - size_before:+})"
+
+
+def _format_memory(size_bytes: int) -> str:
+    return f"{size_bytes / (1024 * 1024):.2f}MiB"
@@ -13,11 +13,17 @@ class AARCH64CodegenContext:
 
     fd: IO[str]
     strings: MutableMapping[str, str] = field()
+    # Key of static string segment by its string (reverse of strings)
+    string_keys: MutableMapping[str, str] = field(default_factory=lambda: dict())  # noqa: C408
 
     def write(self, *lines: str) -> int:
         return self.fd.write("\t" + "\n\t".join(lines) + "\n")
 
     def load_string(self, string: str) -> str:
-        string_key = "str%d" % len(self.strings)
-        self.strings[string_key] = string
+        """Get key of static string segment with given string, same strings share single segment."""
+        string_key = self.string_keys.get(string)
+        if string_key is None:
+            string_key = "str%d" % len(self.strings)
+            self.strings[string_key] = string
+            self.string_keys[string] = string_key
         return string_key
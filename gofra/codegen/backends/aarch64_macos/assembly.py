@@ -61,15 +61,7 @@ def store_integer_into_register(
     register: AARCH64_GP_REGISTERS,
     value: int,
 ) -> None:
-    """Store given value into given register."""
-    context.write(f"mov {register}, #{value}")
-
-
-def push_integer_onto_stack(
-    context: AARCH64CodegenContext,
-    value: int,
-) -> None:
-    """Push given integer onto stack with auto shifting less-significant bytes.
+    """Store given integer into given register with auto shifting less-significant bytes.
 
     Value must be less than 16 bytes (18_446_744_073_709_551_615).
     Negative numbers is dissalowed.
@@ -77,15 +69,14 @@ def push_integer_onto_stack(
     TODO(@kirillzhosul): Negative numbers IS dissalowed:
         Consider using signed two complement representation with sign bit (highest bit) set
     """
-    assert value >= 0, "Tried to push negative integer onto stack!"
+    assert value >= 0, "Tried to store negative integer into register!"
     assert value <= AARCH64_DOUBLE_WORD_BITS, (
-        "Tried to push integer that exceeding 16 bytes (64 bits register)."
+        "Tried to store integer that exceeding 16 bytes (64 bits register)."
     )
 
     if value <= AARCH64_HALF_WORD_BITS:
         # We have small immediate value which we may just store without shifts
-        context.write(f"mov X0, #{value}")
-        push_register_onto_stack(context, register="X0")
+        context.write(f"mov {register}, #{value}")
         return
 
     preserve_bits = False
@@ -97,13 +88,20 @@ def push_integer_onto_stack(
 
         if not preserve_bits:
             # Store upper bits
-            context.write(f"movz X0, #{chunk}, lsl #{shift}")
+            context.write(f"movz {register}, #{chunk}, lsl #{shift}")
             preserve_bits = True
             continue
 
         # Store lower bits
-        context.write(f"movk X0, #{chunk}, lsl #{shift}")
+        context.write(f"movk {register}, #{chunk}, lsl #{shift}")
+
 
+def push_integer_onto_stack(
+    context: AARCH64CodegenContext,
+    value: int,
+) -> None:
+    """Push given integer onto stack (see `store_integer_into_register` for allowed values)."""
+    store_integer_into_register(context, register="X0", value=value)
     push_register_onto_stack(context, register="X0")
 
 
@@ -261,11 +259,7 @@ def call_function_block(
     Also allows to call ABI/FFI function with providing arguments and return value (retval) via:
     `abi_ffi_push_retval_onto_stack` / `abi_ffi_arguments_count`
     """
-    assert abi_ffi_arguments_count >= 0, "FFI arguments count cannot go negative"
-    if abi_ffi_arguments_count:
-        arguments = abi_ffi_arguments_count
-        registers = AARCH64_MACOS_ABI_ARGUMENT_REGISTERS[:arguments][::-1]
-        pop_cells_from_stack_into_registers(context, *registers)
+    load_abi_ffi_arguments_into_registers(context, abi_ffi_arguments_count)
 
     context.write(f"bl {function_name}")
 
@@ -273,6 +267,32 @@ def call_function_block(
         push_register_onto_stack(context, AARCH64_MACOS_ABI_RETVAL_REGISTER)
 
 
+def tail_call_function_block(
+    context: AARCH64CodegenContext,
+    function_name: str,
+    *,
+    abi_ffi_arguments_count: int,
+) -> None:
+    """Call an function as last operation of caller by jumping into it, so callee returns straight into caller of caller.
+
+    Arguments are loaded same as within `call_function_block`, only for functions that has no return value to push.
+    """
+    load_abi_ffi_arguments_into_registers(context, abi_ffi_arguments_count)
+    context.write(f"b {function_name}")
+
+
+def load_abi_ffi_arguments_into_registers(
+    context: AARCH64CodegenContext,
+    abi_ffi_arguments_count: int,
+) -> None:
+    """Pop arguments of called function from stack into ABI argument registers (first argument is deepest)."""
+    assert abi_ffi_arguments_count >= 0, "FFI arguments count cannot go negative"
+    if abi_ffi_arguments_count:
+        arguments = abi_ffi_arguments_count
+        registers = AARCH64_MACOS_ABI_ARGUMENT_REGISTERS[:arguments][::-1]
+        pop_cells_from_stack_into_registers(context, *registers)
+
+
 def function_begin_with_prologue(
     context: AARCH64CodegenContext,
     *,
@@ -20,6 +20,7 @@ from gofra.codegen.backends.aarch64_macos.assembly import (
     push_register_onto_stack,
     push_static_address_onto_stack,
     store_into_memory_from_stack_arguments,
+    tail_call_function_block,
 )
 from gofra.codegen.backends.aarch64_macos.registers import (
     AARCH64_MACOS_EPILOGUE_EXIT_CODE,
@@ -34,6 +35,7 @@ from gofra.consts import GOFRA_ENTRY_POINT
 from gofra.parser.functions.function import Function
 from gofra.parser.intrinsics import Intrinsic
 from gofra.parser.operators import Operator, OperatorType
+from gofra.tracing import trace_span
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -118,6 +120,14 @@ def aarch64_macos_operator_instructions(
             assert isinstance(operator.operand, str)
 
             function = program.functions[operator.operand]
+            if operator.call_optimization_is_tail_call:
+                assert not function.abi_ffi_push_retval_onto_stack()
+                tail_call_function_block(
+                    context,
+                    function_name=function.name,
+                    abi_ffi_arguments_count=len(function.type_contract_in),
+                )
+                return
             call_function_block(
                 context,
                 function_name=function.name,
@@ -175,12 +185,11 @@ def aarch64_macos_intrinsic_instructions(
             | Intrinsic.SYSCALL5
             | Intrinsic.SYSCALL6
         ):
-            assert operator.syscall_optimization_injected_args is None, "TODO: Optimize"
             ipc_syscall_macos(
                 context,
                 arguments_count=operator.get_syscall_arguments_count() - 1,
                 store_retval_onto_stack=not operator.syscall_optimization_omit_result,
-                injected_args=None,
+                injected_args=operator.syscall_optimization_injected_args,
             )
         case Intrinsic.MEMORY_LOAD:
             load_memory_from_stack_arguments(context)
@@ -207,16 +216,26 @@ def aarch64_macos_executable_functions(
         assert not function.is_global_linker_symbol or (
             not function.type_contract_in and not function.type_contract_out
         ), "Codegen does not supports global linker symbols that has type contracts"
-        function_begin_with_prologue(
-            context,
-            function_name=function.name,
-            as_global_linker_symbol=function.is_global_linker_symbol,
-        )
+        with trace_span(
+            "codegen function",
+            category="codegen",
+            args={"function": function.name},
+        ):
+            function_begin_with_prologue(
+                context,
+                function_name=function.name,
+                as_global_linker_symbol=function.is_global_linker_symbol,
+            )
 
-        aarch64_macos_instruction_set(context, function.source, program, function.name)
+            aarch64_macos_instruction_set(
+                context,
+                function.source,
+                program,
+                function.name,
+            )
 
-        # TODO(@kirillzhosul): This is included even after explicit return after end
-        function_end_with_epilogue(context)
+            # TODO(@kirillzhosul): This is included even after explicit return after end
+            function_end_with_epilogue(context)
 
 
 def aarch64_macos_program_entry_point(context: AARCH64CodegenContext) -> None:
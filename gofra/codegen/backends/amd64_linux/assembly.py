@@ -144,6 +144,32 @@ def function_end_with_epilogue(context: AMD64CodegenContext) -> None:
     context.write("ret")
 
 
+def tail_call_function_block(
+    context: AMD64CodegenContext,
+    function_name: str,
+    *,
+    abi_ffi_arguments_count: int,
+) -> None:
+    """Call an function as last operation of caller by jumping into it, so callee returns straight into caller of caller.
+
+    Arguments are loaded same as within `call_function_block`, only for functions that has no return value to push.
+    """
+    load_abi_ffi_arguments_into_registers(context, abi_ffi_arguments_count)
+    context.write(f"jmp {function_name}")
+
+
+def load_abi_ffi_arguments_into_registers(
+    context: AMD64CodegenContext,
+    abi_ffi_arguments_count: int,
+) -> None:
+    """Pop arguments of called function from stack into ABI argument registers (first argument is deepest)."""
+    assert abi_ffi_arguments_count >= 0, "FFI arguments count cannot go negative"
+    if abi_ffi_arguments_count:
+        arguments = abi_ffi_arguments_count
+        registers = AMD64_LINUX_ABI_ARGUMENTS_REGISTERS[:arguments][::-1]
+        pop_cells_from_stack_into_registers(context, *registers)
+
+
 def function_begin_with_prologue(
     context: AMD64CodegenContext,
     *,
@@ -171,11 +197,7 @@ def call_function_block(
     Also allows to call ABI/FFI function with providing arguments and return value (retval) via:
     `abi_ffi_push_retval_onto_stack` / `abi_ffi_arguments_count`
     """
-    assert abi_ffi_arguments_count >= 0, "FFI arguments count cannot go negative"
-    if abi_ffi_arguments_count:
-        arguments = abi_ffi_arguments_count
-        registers = AMD64_LINUX_ABI_ARGUMENTS_REGISTERS[:arguments][::-1]
-        pop_cells_from_stack_into_registers(context, *registers)
+    load_abi_ffi_arguments_into_registers(context, abi_ffi_arguments_count)
 
     context.write(f"call {function_name}")
 
@@ -230,9 +252,10 @@ def perform_operation_onto_stack(
                 "==": "e",
             }
 
+            # Result is zeroed with `movq` as it (unlike `xorq`) does not overwrite flags of comparison
             context.write(
-                "cmpq rbx, rax",
-                "xorq rax, rax",
+                "cmpq rax, rbx",
+                "movq $0, rax",
                 f"set{logic_op[operation]}b al",
             )
         case _:
@@ -251,5 +274,5 @@ def evaluate_conditional_block_on_stack_with_jump(
     pop_cells_from_stack_into_registers(context, "rax")
     context.write(
         "cmpq $0, rax",
-        f"jeq {jump_over_label}",
+        f"je {jump_over_label}",
     )
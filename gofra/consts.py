@@ -1,3 +1,6 @@
 """Constants used inside Gofra."""
 
 GOFRA_ENTRY_POINT = "main"
+
+# Version of compiler, same as package version
+GOFRA_VERSION = "0.0.1"
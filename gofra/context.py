@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from collections.abc import MutableMapping
 
+    from gofra.optimizer.remarks import OptimizationRemark
     from gofra.parser._context import ParserContext
     from gofra.parser.functions import Function
 
@@ -21,6 +22,15 @@ class ProgramContext:
     memories: MutableMapping[str, int]
     entry_point: Function
 
+    # Count of tokens consumed by top-level parser, for statistics only
+    parsed_tokens_count: int = 0
+
+    # Count of hits of each peephole optimization rule (by rule name), for statistics only
+    peephole_rules_hits: dict[str, int] = field(default_factory=dict)
+
+    # Decisions made by optimizer (e.g what is inlined), for statistics only
+    optimization_remarks: list[OptimizationRemark] = field(default_factory=list)
+
     @staticmethod
     def from_parser_context(
         parser_context: ParserContext,
@@ -30,4 +40,5 @@ class ProgramContext:
             functions=parser_context.functions,
             memories=parser_context.memories,
             entry_point=entry_point,
+            parsed_tokens_count=parser_context.tokens.tokens_consumed,
         )
@@ -4,6 +4,21 @@ from abc import abstractmethod
 class GofraError(Exception):
     """Parent for all Gofra errors (exceptions)."""
 
+    def __reduce__(self) -> tuple[object, ...]:
+        # Errors are constructed with keyword-only arguments, so they are pickled (e.g from parallel workers) by state
+        return (_restore_gofra_error, (type(self), self.args, self.__dict__))
+
     @abstractmethod
     def __repr__(self) -> str:
         return f"Some internal error occurred ({super().__repr__()}), that is currently not documented"
+
+
+def _restore_gofra_error(
+    error_type: type[GofraError],
+    args: tuple[object, ...],
+    state: dict[str, object],
+) -> GofraError:
+    error = error_type.__new__(error_type, *args)
+    error.args = args
+    error.__dict__.update(state)
+    return error
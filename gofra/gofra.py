@@ -1,15 +1,29 @@
 """Gofra core entry."""
 
-from collections.abc import Iterable
-from pathlib import Path
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from gofra.context import ProgramContext
 from gofra.parser import parse_file
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from gofra.lexer import LEXER_ENGINE_T
+    from gofra.lexer.cache import TokenCache
+    from gofra.parser.includes import IncludeGraph
+
 
-def process_input_file(
+def process_input_file(  # noqa: PLR0913
     filepath: Path,
     include_paths: Iterable[Path],
+    *,
+    lexer_engine: LEXER_ENGINE_T = "scanner",
+    token_cache: TokenCache | None = None,
+    include_graph: IncludeGraph | None = None,
+    jobs: int = 1,
 ) -> ProgramContext:
     """Core entry for Gofra API.
 
@@ -17,6 +31,16 @@ def process_input_file(
     Maybe assembled into executable/library/object/etc... via `assemble_program`
 
     Does not provide optimizer or type checker.
+    Included files may be loaded from given persistent token cache,
+    and are tracked within given include graph (if any).
+    Bodies of functions are parsed in parallel if more than one job is given.
     """
-    parser_context, entry_point = parse_file(filepath, include_paths)
+    parser_context, entry_point = parse_file(
+        filepath,
+        include_paths,
+        lexer_engine=lexer_engine,
+        token_cache=token_cache,
+        include_graph=include_graph,
+        jobs=jobs,
+    )
     return ProgramContext.from_parser_context(parser_context, entry_point)
@@ -2,10 +2,11 @@
 
 from .exceptions import LexerError
 from .keywords import Keyword
-from .lexer import TokenGenerator, load_file_for_lexical_analysis
+from .lexer import LEXER_ENGINE_T, TokenGenerator, load_file_for_lexical_analysis
 from .tokens import Token, TokenType
 
 __all__ = [
+    "LEXER_ENGINE_T",
     "Keyword",
     "LexerError",
     "Token",
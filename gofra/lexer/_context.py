@@ -1,9 +1,7 @@
-from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from .exceptions import LexerEmptyInputLinesError
-from .tokens import TokenLocation
+from .tokens import TokenLocation, intern_source_filepath
 
 
 @dataclass(frozen=False)
@@ -11,29 +9,25 @@ class LexerContext:
     """Context for lexical analysis which only required from internal usages."""
 
     source_filepath: Path
-    lines: Sequence[str]
+    source_file_id: int = field(init=False)
 
-    row_end: int
     col_end: int = 0
 
     row: int = 0
     col: int = 0
 
+    # Current line that is consumed, lines are streamed so there is no other lines
     line: str = ""
 
     def __post_init__(self) -> None:
-        if not self.row_end:
-            raise LexerEmptyInputLinesError
-
-    def row_is_consumed(self) -> bool:
-        return self.row >= self.row_end
+        self.source_file_id = intern_source_filepath(self.source_filepath)
 
     def col_is_consumed(self) -> bool:
         return self.col >= self.col_end
 
     def current_location(self) -> TokenLocation:
         return TokenLocation(
-            filepath=self.source_filepath,
+            file_id=self.source_file_id,
             line_number=self.row,
             col_number=self.col,
         )
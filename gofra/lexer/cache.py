@@ -0,0 +1,217 @@
+"""Persistent (on-disk) cache of lexical tokens for included files.
+
+Included files (like standard library) are rarely changed between compilations,
+so their tokens are stored inside build cache directory and loaded back from compact binary file instead of being lexed again.
+
+Entries are keyed by file content hash and compiler version, so changed file (or compiler) never hits stale entry.
+Entry name is also prefixed with source file path key, and storing entry removes other entries of same file,
+so cache holds at most one entry per included file (stale entries are pruned instead of piling up).
+Tokens are stored without source file path (as struct of arrays), path is attached back on load.
+
+Tokens are streamed to parser (same as when file is lexed without cache): on hit these are created from stored arrays
+while being read, on miss file is lexed while being read and entry is stored once its tokens are exhausted.
+Stored arrays of included file are kept until its tokens are read, which is smaller than list of its tokens.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+from array import array
+from dataclasses import dataclass, field
+from hashlib import file_digest, sha256
+from typing import TYPE_CHECKING
+
+from gofra.consts import GOFRA_VERSION
+from gofra.tracing import trace_span
+
+from .exceptions import LexerFileNotFoundError
+from .lexer import load_file_for_lexical_analysis
+from .tokens import (
+    Token,
+    TokenLocation,
+    TokenType,
+    TokenValue,
+    intern_source_filepath,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from .lexer import LEXER_ENGINE_T
+
+# Bump on any change of entry layout or tokens semantics
+TOKEN_CACHE_FORMAT_VERSION = 1
+CACHE_ENTRY_SUFFIX = ".tokens"
+
+
+@dataclass(frozen=False)
+class TokenCache:
+    """Cache of tokens for included files inside given directory, tracks hit/miss statistics."""
+
+    directory: Path
+    lexer_engine: LEXER_ENGINE_T = field(default="scanner")
+
+    hits: int = field(default=0)
+    misses: int = field(default=0)
+
+    def load_tokens(self, source_filepath: Path) -> Iterator[Token]:
+        """Get tokens of given file, from cache entry if it is present otherwise lex and store them (once read)."""
+        if not source_filepath.is_file():
+            raise LexerFileNotFoundError(filepath=source_filepath)
+
+        with trace_span(
+            "load cached tokens",
+            category="lexer",
+            args={"file": str(source_filepath)},
+        ):
+            return self._load_tokens(source_filepath)
+
+    def _load_tokens(self, source_filepath: Path) -> Iterator[Token]:
+        source_key = _cache_source_key(source_filepath)
+        entry_path = self.directory / (
+            f"{source_key}-{_cache_entry_key(source_filepath)}{CACHE_ENTRY_SUFFIX}"
+        )
+        file_id = intern_source_filepath(source_filepath)
+
+        entry = _read_cache_entry(entry_path)
+        if entry is not None:
+            self.hits += 1
+            return _entry_tokens(entry, file_id)
+
+        self.misses += 1
+        return self._lex_and_store_tokens(source_filepath, entry_path, source_key)
+
+    def _lex_and_store_tokens(
+        self,
+        source_filepath: Path,
+        entry_path: Path,
+        source_key: str,
+    ) -> Iterator[Token]:
+        """Lex given file while its tokens are read, storing cache entry once all of them are read."""
+        entry = _CacheEntry()
+        for token in load_file_for_lexical_analysis(
+            source_filepath,
+            engine=self.lexer_engine,
+        ):
+            entry.append(token)
+            yield token
+        _write_cache_entry(entry_path, entry)
+        _prune_cache_entries(self.directory, source_key, keep=entry_path)
+
+
+def _cache_source_key(source_filepath: Path) -> str:
+    """Get key of source file path, shared by all entries of that file."""
+    return sha256(str(source_filepath.resolve()).encode()).hexdigest()[:16]
+
+
+def _cache_entry_key(source_filepath: Path) -> str:
+    """Get key of cache entry from file content and compiler version."""
+    with source_filepath.open("rb") as fd:
+        content_hash = file_digest(fd, "sha256").hexdigest()
+    version = f"{GOFRA_VERSION}:{TOKEN_CACHE_FORMAT_VERSION}:"
+    return sha256((version + content_hash).encode()).hexdigest()
+
+
+def _prune_cache_entries(directory: Path, source_key: str, keep: Path) -> None:
+    """Remove entries of same source file except given one (these are for previous content or compiler version)."""
+    for entry_path in directory.glob(f"{source_key}-*{CACHE_ENTRY_SUFFIX}"):
+        if entry_path != keep:
+            entry_path.unlink(missing_ok=True)
+
+
+@dataclass(frozen=True, slots=True)
+class _CacheEntry:
+    """Tokens of single file as struct of arrays (without source file path)."""
+
+    # Types are appended while file is lexed (bytearray), loaded entry has them immutable (bytes)
+    types: bytearray | bytes = field(default_factory=bytearray)
+    rows: array[int] = field(default_factory=lambda: array("L"))
+    cols: array[int] = field(default_factory=lambda: array("L"))
+    texts: list[str] = field(default_factory=lambda: list())  # noqa: C408
+    values: list[TokenValue] = field(default_factory=lambda: list())  # noqa: C408
+
+    def append(self, token: Token) -> None:
+        assert isinstance(self.types, bytearray)
+        self.types.append(token.type)
+        self.rows.append(token.location.line_number)
+        self.cols.append(token.location.col_number)
+        self.texts.append(token.text)
+        self.values.append(token.value)
+
+
+def _read_cache_entry(entry_path: Path) -> _CacheEntry | None:
+    """Load cache entry, or nothing if entry is missing or broken (e.g corrupted or stored in other format)."""
+    try:
+        with entry_path.open("rb") as fd:
+            types, rows, cols, texts, values = pickle.load(fd)  # noqa: S301
+        entry = _CacheEntry(
+            types=types,
+            rows=rows,
+            cols=cols,
+            texts=texts,
+            values=values,
+        )
+    except (
+        OSError,
+        EOFError,
+        ValueError,
+        TypeError,
+        AttributeError,
+        ImportError,
+        IndexError,
+        KeyError,
+        pickle.UnpicklingError,
+    ):
+        return None
+
+    # Validated before tokens are streamed, so broken entry is never found while its tokens are read
+    if not _is_valid_cache_entry(entry):
+        return None
+    return entry
+
+
+def _is_valid_cache_entry(entry: _CacheEntry) -> bool:
+    columns = (entry.types, entry.rows, entry.cols, entry.texts, entry.values)
+    column_types = (bytes, array, array, list, list)
+    return (
+        all(map(isinstance, columns, column_types))
+        and all(len(column) == len(entry.types) for column in columns)
+        and set(entry.types) <= {int(token_type) for token_type in TokenType}
+    )
+
+
+def _entry_tokens(entry: _CacheEntry, file_id: int) -> Iterator[Token]:
+    """Get tokens of cache entry attached to given file, created while being read."""
+    for token_type, row, col, text, value in zip(
+        entry.types,
+        entry.rows,
+        entry.cols,
+        entry.texts,
+        entry.values,
+        strict=True,
+    ):
+        yield Token(
+            type=TokenType(token_type),
+            text=text,
+            value=value,
+            location=TokenLocation(file_id=file_id, line_number=row, col_number=col),
+        )
+
+
+def _write_cache_entry(entry_path: Path, entry: _CacheEntry) -> None:
+    """Store cache entry (atomically, so concurrent compilations never read partial entry)."""
+    stored_entry = (
+        bytes(entry.types),
+        entry.rows,
+        entry.cols,
+        entry.texts,
+        entry.values,
+    )
+
+    entry_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_entry_path = entry_path.with_suffix(f".{os.getpid()}.partial")
+    with partial_entry_path.open("wb") as fd:
+        pickle.dump(stored_entry, fd, protocol=pickle.HIGHEST_PROTOCOL)
+    partial_entry_path.replace(entry_path)
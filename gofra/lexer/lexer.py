@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 import sys
-from collections.abc import Generator, Sequence
-from typing import TYPE_CHECKING
+from collections.abc import Generator, Iterable
+from typing import TYPE_CHECKING, Literal
 
 from gofra.lexer.keywords import WORD_TO_KEYWORD
 
 from ._context import LexerContext
 from .exceptions import (
     LexerEmptyCharacterError,
+    LexerEmptyInputLinesError,
     LexerExcessiveCharacterLengthError,
     LexerFileNotFoundError,
     LexerUnclosedCharacterQuoteError,
@@ -20,6 +21,7 @@ from .helpers import (
     find_word_start,
     unescape_string,
 )
+from .scanner import scan_source_stream
 from .tokens import Token, TokenLocation, TokenType
 
 if TYPE_CHECKING:
@@ -27,13 +29,21 @@ if TYPE_CHECKING:
 
 type TokenGenerator = Generator[Token, None, LexerContext]
 
+# `scanner` tokenizes whole file buffer with single master regex
+# `lines` walks each line character by character (original lexer)
+type LEXER_ENGINE_T = Literal["scanner", "lines"]
+
 
 def load_file_for_lexical_analysis(
     source_filepath: Path,
-) -> TokenGenerator:
+    *,
+    engine: LEXER_ENGINE_T = "scanner",
+) -> Generator[Token]:
     """Load file to read and stream resulting lexical tokens.
 
     Propagates source file path so can be used for module file resolution
+    Both engines results in same tokens so engine may be chosen freely
+    File is read incrementally while tokens are consumed, so whole file is never kept in memory
 
     Returns tokens in default order (ordered)
     """
@@ -49,33 +59,32 @@ def load_file_for_lexical_analysis(
         newline="",
         encoding="UTF-8",
     ) as fd:
-        source_file_lines = fd.readlines(-1)
+        if engine == "scanner":
+            yield from scan_source_stream(fd, source_filepath=source_filepath)
+            return
 
-    context = yield from _perform_lexical_analysis(
-        lines=source_file_lines,
-        source_filepath=source_filepath,
-    )
-    return context
+        yield from _perform_lexical_analysis(
+            lines=fd,
+            source_filepath=source_filepath,
+        )
 
 
 def _perform_lexical_analysis(
-    lines: Sequence[str],
+    lines: Iterable[str],
     source_filepath: Path,
 ) -> TokenGenerator:
     """Convert source lines of text into stream of tokens.
 
-    TODO(@kirillzhosul): Input is not an stream, we may introduce generator sending with lines
+    Lines are consumed lazily one by one, so input may be an stream (e.g file descriptor)
     """
-    context = LexerContext(
-        source_filepath=source_filepath,
-        lines=lines,
-        row_end=len(lines),
-    )
+    context = LexerContext(source_filepath=source_filepath)
 
-    while not context.row_is_consumed():
-        context.line = lines[context.row]
+    for row, line in enumerate(lines):
+        context.row, context.line = row, line
         context = yield from _consume_context_from_row_start(context=context)
-        context.row += 1
+
+    if not context.line:
+        raise LexerEmptyInputLinesError
 
     return context
 
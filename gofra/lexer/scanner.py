@@ -0,0 +1,208 @@
+"""Whole-buffer scanner engine for lexical analysis.
+
+Tokenizes source buffer in single pass with one precompiled master regex,
+unlike line-by-line lexer which walks each line character by character.
+Resulting tokens (and their locations) are same as from line-by-line lexer.
+
+Source is read in chunks of complete lines, so memory is bounded by chunk size rather than file size.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+from .exceptions import (
+    LexerEmptyCharacterError,
+    LexerEmptyInputLinesError,
+    LexerExcessiveCharacterLengthError,
+    LexerUnclosedCharacterQuoteError,
+    LexerUnclosedStringQuoteError,
+)
+from .helpers import unescape_string
+from .keywords import WORD_TO_KEYWORD
+from .tokens import Token, TokenLocation, TokenType, intern_source_filepath
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+    from typing import IO
+
+# Count of characters read from source at once
+# Trailing incomplete line is carried over into next chunk
+SCANNER_CHUNK_SIZE = 64 * 1024
+
+# Each match is an (optional) horizontal whitespace followed by exactly one named group
+# Line breaks are same as universal newlines so rows are same as from `readlines`
+# Numbers are only numbers if they are whole word, otherwise they are falling into an word
+SCANNER_MASTER_PATTERN = re.compile(
+    r"""
+    [^\S\r\n]*
+    (?:
+        (?P<newline>\r\n|\r|\n)
+      | (?P<comment>//[^\r\n]*)
+      | (?P<string>"[^\r\n]*?(?<!\\)")
+      | (?P<character>'[^'\r\n]*')
+      | (?P<hexadecimal>0x[0-9a-fA-F]*)(?!\S)
+      | (?P<integer>-?\d+)(?!\S)
+      | (?P<word>[^\s'"]\S*)
+      | (?P<unclosed_quote>['"])
+    )
+    """,
+    re.VERBOSE,
+)
+
+
+def scan_source_stream(
+    fd: IO[str],
+    source_filepath: Path,
+    *,
+    chunk_size: int = SCANNER_CHUNK_SIZE,
+) -> Generator[Token]:
+    """Convert source text stream into stream of tokens by reading it in chunks.
+
+    Only complete lines of chunk are scanned, incomplete line is carried into next chunk.
+    """
+    row, carry = 0, ""
+    while chunk := fd.read(chunk_size):
+        buffer = carry + chunk
+        lines_end_at = _find_complete_lines_end(buffer)
+        carry = buffer[lines_end_at:]
+        row = yield from scan_source_buffer(
+            buffer,
+            source_filepath,
+            row=row,
+            endpos=lines_end_at,
+        )
+
+    if carry:
+        yield from scan_source_buffer(carry, source_filepath, row=row)
+    elif not row:
+        raise LexerEmptyInputLinesError
+
+
+def _find_complete_lines_end(buffer: str) -> int:
+    """Get position right after last line break within buffer (or zero if there is no complete lines).
+
+    Trailing carriage return is not an complete line break as it may be followed by line feed in next chunk.
+    """
+    return max(buffer.rfind("\n"), buffer.rfind("\r", 0, len(buffer) - 1)) + 1
+
+
+def scan_source_buffer(
+    buffer: str,
+    source_filepath: Path,
+    *,
+    row: int = 0,
+    endpos: int | None = None,
+) -> Generator[Token, None, int]:
+    """Convert source text buffer (up to `endpos`) into stream of tokens.
+
+    Rows are counted starting from given row, returns row at which buffer was ended.
+    """
+    file_id = intern_source_filepath(source_filepath)
+    row_starts_at = 0
+    matches = SCANNER_MASTER_PATTERN.finditer(
+        buffer,
+        0,
+        len(buffer) if endpos is None else endpos,
+    )
+    for match in matches:
+        kind = match.lastgroup
+        if kind == "newline":
+            row, row_starts_at = row + 1, match.end()
+            continue
+        if kind == "comment":
+            continue
+
+        col = match.start(kind) - row_starts_at
+        text = match.group(kind)
+        location = TokenLocation(
+            file_id=file_id,
+            line_number=row,
+            col_number=col,
+        )
+        match kind:
+            case "word":
+                if keyword := WORD_TO_KEYWORD.get(text):
+                    yield Token(
+                        type=TokenType.KEYWORD,
+                        text=text,
+                        location=location,
+                        value=keyword,
+                    )
+                    continue
+                yield Token(
+                    type=TokenType.WORD,
+                    text=text,
+                    location=location,
+                    value=text,
+                )
+            case "integer":
+                yield Token(
+                    type=TokenType.INTEGER,
+                    text=text,
+                    value=int(text),
+                    location=location,
+                )
+            case "hexadecimal":
+                yield Token(
+                    type=TokenType.INTEGER,
+                    text=text,
+                    value=int(text, 16),
+                    location=location,
+                )
+            case "string":
+                yield Token(
+                    type=TokenType.STRING,
+                    text=text,
+                    location=location,
+                    value=unescape_string(text[1:-1]),
+                )
+            case "character":
+                yield _scan_character_token(text, location)
+            case "unclosed_quote":
+                open_quote_location = _shift_location(location, by=1)
+                if text == '"':
+                    raise LexerUnclosedStringQuoteError(
+                        open_quote_location=open_quote_location,
+                    )
+                raise LexerUnclosedCharacterQuoteError(
+                    open_quote_location=open_quote_location,
+                )
+            case _:
+                raise AssertionError
+
+    return row
+
+
+def _scan_character_token(character_raw: str, location: TokenLocation) -> Token:
+    """Convert raw quoted character into character token."""
+    character = unescape_string(character_raw[1:-1])
+
+    character_len = len(character)
+    if character_len == 0:
+        raise LexerEmptyCharacterError(
+            open_quote_location=_shift_location(location, by=1),
+        )
+    if character_len > 1:
+        raise LexerExcessiveCharacterLengthError(
+            excess_begins_at=_shift_location(location, by=2),
+            excess_by_count=character_len,
+        )
+
+    return Token(
+        type=TokenType.CHARACTER,
+        text=character_raw,
+        value=ord(character),
+        location=location,
+    )
+
+
+def _shift_location(location: TokenLocation, *, by: int) -> TokenLocation:
+    """Get location shifted by given columns count, used to point inside tokens."""
+    return TokenLocation(
+        file_id=location.file_id,
+        line_number=location.line_number,
+        col_number=location.col_number + by,
+    )
@@ -1,18 +1,60 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
 from enum import IntEnum, auto
-from pathlib import Path
+from typing import TYPE_CHECKING
 
 from gofra.lexer.keywords import Keyword
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 type TokenValue = int | float | str
 
+# Source file paths are interned into single (per process) table
+# so each location only holds an index (file id) of its source file
+SOURCE_FILEPATHS: list[Path] = []
+_SOURCE_FILEPATH_IDS: dict[Path, int] = {}
+
+
+def intern_source_filepath(filepath: Path) -> int:
+    """Get file id for given source file path, registering that path if it is new."""
+    file_id = _SOURCE_FILEPATH_IDS.get(filepath)
+    if file_id is None:
+        file_id = _SOURCE_FILEPATH_IDS[filepath] = len(SOURCE_FILEPATHS)
+        SOURCE_FILEPATHS.append(filepath)
+    return file_id
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TokenLocation:
-    filepath: Path
+    file_id: int
     line_number: int
     col_number: int
 
+    @property
+    def filepath(self) -> Path:
+        return SOURCE_FILEPATHS[self.file_id]
+
+    @staticmethod
+    def from_filepath(
+        filepath: Path,
+        line_number: int,
+        col_number: int,
+    ) -> TokenLocation:
+        return TokenLocation(
+            file_id=intern_source_filepath(filepath),
+            line_number=line_number,
+            col_number=col_number,
+        )
+
+    def __reduce__(self) -> tuple[object, ...]:
+        # File ids are only valid within current process, so path is serialized instead
+        return (
+            TokenLocation.from_filepath,
+            (self.filepath, self.line_number, self.col_number),
+        )
+
     def __repr__(self) -> str:
         return f"'{self.filepath.name}:{self.line_number + 1}:{self.col_number + 1}'"
 
@@ -27,7 +69,7 @@ class TokenType(IntEnum):
     KEYWORD = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Token:
     type: TokenType
     text: str
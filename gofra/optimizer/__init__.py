@@ -1,5 +1,19 @@
 """Optimizer package that used to apply different optimizations strategies for program."""
 
-from .optimizer import optimize_program
+from .optimizer import OPTIMIZATION_PASSES, OPTIMIZATION_PIPELINES, optimize_program
+from .pass_manager import (
+    OPTIMIZATION_LEVEL_T,
+    OptimizationPass,
+    OptimizationPassStatistics,
+)
+from .remarks import OptimizationRemark
 
-__all__ = ["optimize_program"]
+__all__ = [
+    "OPTIMIZATION_LEVEL_T",
+    "OPTIMIZATION_PASSES",
+    "OPTIMIZATION_PIPELINES",
+    "OptimizationPass",
+    "OptimizationPassStatistics",
+    "OptimizationRemark",
+    "optimize_program",
+]
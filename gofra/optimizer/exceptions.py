@@ -0,0 +1,37 @@
+from collections.abc import Sequence
+
+from gofra.exceptions import GofraError
+
+
+class OptimizerUnknownPassError(GofraError):
+    def __init__(
+        self,
+        *args: object,
+        pass_name: str,
+        registered_pass_names: Sequence[str],
+    ) -> None:
+        super().__init__(*args)
+        self.pass_name = pass_name
+        self.registered_pass_names = registered_pass_names
+
+    def __repr__(self) -> str:
+        return f"""Unknown optimization pass '{self.pass_name}'!
+
+Available passes: {", ".join(self.registered_pass_names)}"""
+
+
+class OptimizerRepeatedPassError(GofraError):
+    def __init__(
+        self,
+        *args: object,
+        pass_name: str,
+        repeatable_pass_names: Sequence[str],
+    ) -> None:
+        super().__init__(*args)
+        self.pass_name = pass_name
+        self.repeatable_pass_names = repeatable_pass_names
+
+    def __repr__(self) -> str:
+        return f"""Optimization pass '{self.pass_name}' is requested more than once, but it is not safe to repeat!
+
+Passes that may be repeated: {", ".join(self.repeatable_pass_names)}"""
@@ -1,12 +1,164 @@
-from gofra.context import ProgramContext
+from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from .pass_manager import (
+    OPTIMIZATION_LEVEL_T,
+    OptimizationPass,
+    OptimizationPassStatistics,
+    apply_optimization_passes,
+    resolve_optimization_passes,
+)
 from .strategies import (
+    InliningCostModel,
+    optimize_branch_folding,
     optimize_constant_folding,
     optimize_dead_code_elimination,
+    optimize_inlining,
+    optimize_peephole,
+    optimize_syscall_injection,
+    optimize_tail_calls,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from gofra.context import ProgramContext
+
+# Inlining decisions for each optimization level
+# `0` has no pipeline, so inlining is only applied when requested explicitly (with cost model of default level)
+INLINING_COST_MODELS: dict[OPTIMIZATION_LEVEL_T, InliningCostModel] = {
+    "1": InliningCostModel(
+        max_body_size=8,
+        loop_nesting_multiplier=2,
+        max_single_call_site_body_size=64,
+        max_program_growth=0.1,
+    ),
+    "2": InliningCostModel(
+        max_body_size=24,
+        loop_nesting_multiplier=3,
+        max_single_call_site_body_size=256,
+        max_program_growth=0.5,
+    ),
+    # Only bodies that are not larger than call itself, or single call site (definition is removed after)
+    "s": InliningCostModel(
+        max_body_size=1,
+        loop_nesting_multiplier=1,
+        max_single_call_site_body_size=None,
+        max_program_growth=0.0,
+    ),
+}
+
+
+def _apply_inlining(program: ProgramContext, level: OPTIMIZATION_LEVEL_T) -> None:
+    optimize_inlining(
+        program,
+        INLINING_COST_MODELS.get(level, INLINING_COST_MODELS["1"]),
+    )
+
+
+# Every optimization pass that may be requested (by name)
+OPTIMIZATION_PASSES: dict[str, OptimizationPass] = {
+    optimization_pass.name: optimization_pass
+    for optimization_pass in (
+        OptimizationPass(
+            # Not repeatable as inlined bodies would be inlined again (program growth is limited per application)
+            name="inline",
+            apply=_apply_inlining,
+        ),
+        OptimizationPass(
+            name="constant-folding",
+            apply=lambda program, _: optimize_constant_folding(program),
+            is_repeatable=True,
+        ),
+        OptimizationPass(
+            name="peephole",
+            apply=lambda program, _: optimize_peephole(program),
+            is_repeatable=True,
+        ),
+        OptimizationPass(
+            # Conditions are only known when these are folded into constants
+            name="branch-folding",
+            apply=lambda program, _: optimize_branch_folding(program),
+            requires=("constant-folding",),
+            is_repeatable=True,
+        ),
+        OptimizationPass(
+            name="dce",
+            apply=lambda program, _: optimize_dead_code_elimination(program),
+            is_repeatable=True,
+        ),
+        OptimizationPass(
+            # Arguments are only injected when these are folded into constants,
+            # applied once after passes that may expose more constants right before syscalls
+            name="syscall-injection",
+            apply=lambda program, _: optimize_syscall_injection(program),
+            requires=("constant-folding",),
+        ),
+        OptimizationPass(
+            # Only marks operators (source is not changed), marks are only valid while source is not changed after
+            name="tail-calls",
+            apply=lambda program, _: optimize_tail_calls(program),
+            invalidates=(),
+            is_scheduled_last=True,
+            is_repeatable=True,
+        ),
+    )
+}
+
+# Passes (in order) that are applied for each optimization level
+OPTIMIZATION_PIPELINES: dict[OPTIMIZATION_LEVEL_T, tuple[str, ...]] = {
+    "0": (),
+    # Inlined bodies are optimized further within context of call site,
+    # functions called only from inlined or folded (dead) branches becomes unused for dead code elimination
+    "1": (
+        "inline",
+        "constant-folding",
+        "peephole",
+        "branch-folding",
+        "dce",
+        "syscall-injection",
+        "tail-calls",
+    ),
+    # Bodies of unwrapped branches are folded again within context of operators around them
+    "2": (
+        "inline",
+        "constant-folding",
+        "peephole",
+        "branch-folding",
+        "constant-folding",
+        "peephole",
+        "dce",
+        "syscall-injection",
+        "tail-calls",
+    ),
+    "s": (
+        "inline",
+        "constant-folding",
+        "peephole",
+        "branch-folding",
+        "dce",
+        "syscall-injection",
+        "tail-calls",
+    ),
+}
+
+
+def optimize_program(
+    program: ProgramContext,
+    level: OPTIMIZATION_LEVEL_T = "1",
+    passes: Sequence[str] | None = None,
+) -> list[OptimizationPassStatistics]:
+    """Apply optimization passes within given program context.
 
-def optimize_program(program: ProgramContext) -> None:
-    """Apply optimization strategies within given program context."""
-    optimize_constant_folding(program)
-    optimize_dead_code_elimination(program)
+    Passes are taken from pipeline of given level, unless custom pipeline (names of passes) is given.
+    Returns measurements of each applied pass.
+    """
+    return apply_optimization_passes(
+        program,
+        resolve_optimization_passes(
+            OPTIMIZATION_PIPELINES[level] if passes is None else passes,
+            OPTIMIZATION_PASSES,
+        ),
+        level=level,
+    )
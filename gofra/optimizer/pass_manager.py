@@ -0,0 +1,171 @@
+"""Pass manager that applies optimization passes (strategies) within program in requested order.
+
+Each pass is registered with name, passes it requires and analyses it invalidates:
+- required passes are applied before pass, if these are not applied already within same pipeline,
+- passes scheduled last are applied after all other passes, whatever order they are requested in,
+- passes that are not repeatable (applying them again changes result of already applied pass) are only applied once,
+- invalidated analyses (attached to functions) are dropped after pass, so these are not used while stale.
+
+Each applied pass is measured (time and size of program before and after it).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Literal
+
+from gofra.tracing import trace_span
+
+from .exceptions import OptimizerRepeatedPassError, OptimizerUnknownPassError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+    from gofra.context import ProgramContext
+
+# `0` disables optimizations, `1` and `2` trades size of code for speed, `s` optimizes for size
+type OPTIMIZATION_LEVEL_T = Literal["0", "1", "2", "s"]
+
+# Analyses attached to functions: `cfg` is control-flow graph, `stack-depth` is data stack depth
+type ANALYSIS_T = Literal["cfg", "stack-depth"]
+
+
+@dataclass(frozen=True, slots=True)
+class OptimizationPass:
+    """Optimization that is applied within whole program."""
+
+    # Name of pass, used to request pass (e.g within custom pipeline)
+    name: str
+
+    # Apply pass within given program, with given optimization level
+    apply: Callable[[ProgramContext, OPTIMIZATION_LEVEL_T], None]
+
+    # Names of passes that must be applied before that pass
+    requires: tuple[str, ...] = ()
+
+    # Analyses that are stale after that pass
+    invalidates: tuple[ANALYSIS_T, ...] = ("cfg", "stack-depth")
+
+    # Pass is scheduled after all other passes of pipeline (e.g it marks operators that other passes does not preserve)
+    is_scheduled_last: bool = False
+
+    # Pass may be applied more than once within pipeline (applying it again right after is no-op)
+    is_repeatable: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class OptimizationPassStatistics:
+    """Measurements of single applied pass."""
+
+    name: str
+
+    wall_time_ns: int
+
+    # Size of program (operators within all functions) before and after pass
+    operators_before: int
+    operators_after: int
+
+    # Count of functions before and after pass
+    functions_before: int
+    functions_after: int
+
+
+def resolve_optimization_passes(
+    names: Sequence[str],
+    registry: Mapping[str, OptimizationPass],
+) -> list[OptimizationPass]:
+    """Get passes to apply (in order) for requested pass names, with required passes scheduled before them.
+
+    Required pass is only scheduled when it is not scheduled before within same pipeline,
+    passes that must be scheduled last are moved after all other passes (keeping their order).
+    Raises error when pass that is not repeatable is requested more than once.
+    """
+    scheduled: list[OptimizationPass] = []
+    scheduled_names: set[str] = set()
+
+    def schedule(name: str, requested_by: tuple[str, ...]) -> None:
+        if name not in registry:
+            raise OptimizerUnknownPassError(
+                pass_name=name,
+                registered_pass_names=list(registry),
+            )
+        optimization_pass = registry[name]
+        assert name not in requested_by, f"Optimization pass '{name}' requires itself"
+        if name in scheduled_names and not optimization_pass.is_repeatable:
+            raise OptimizerRepeatedPassError(
+                pass_name=name,
+                repeatable_pass_names=[
+                    repeatable.name
+                    for repeatable in registry.values()
+                    if repeatable.is_repeatable
+                ],
+            )
+        for required_name in optimization_pass.requires:
+            if required_name not in scheduled_names:
+                schedule(required_name, (*requested_by, name))
+        scheduled.append(optimization_pass)
+        scheduled_names.add(name)
+
+    for name in names:
+        schedule(name, ())
+    return [
+        *(
+            optimization_pass
+            for optimization_pass in scheduled
+            if not optimization_pass.is_scheduled_last
+        ),
+        *(
+            optimization_pass
+            for optimization_pass in scheduled
+            if optimization_pass.is_scheduled_last
+        ),
+    ]
+
+
+def apply_optimization_passes(
+    program: ProgramContext,
+    passes: Sequence[OptimizationPass],
+    level: OPTIMIZATION_LEVEL_T,
+) -> list[OptimizationPassStatistics]:
+    """Apply given passes (in order) within program, invalidating stale analyses after each pass."""
+    statistics: list[OptimizationPassStatistics] = []
+    for optimization_pass in passes:
+        functions_before, operators_before = _program_size(program)
+        with trace_span(optimization_pass.name, category="optimizer"):
+            started_at = perf_counter_ns()
+            optimization_pass.apply(program, level)
+            wall_time_ns = perf_counter_ns() - started_at
+        _invalidate_analyses(program, optimization_pass.invalidates)
+
+        functions_after, operators_after = _program_size(program)
+        statistics.append(
+            OptimizationPassStatistics(
+                name=optimization_pass.name,
+                wall_time_ns=wall_time_ns,
+                operators_before=operators_before,
+                operators_after=operators_after,
+                functions_before=functions_before,
+                functions_after=functions_after,
+            ),
+        )
+    return statistics
+
+
+def _invalidate_analyses(
+    program: ProgramContext,
+    analyses: Sequence[ANALYSIS_T],
+) -> None:
+    for function in (*program.functions.values(), program.entry_point):
+        for analysis in analyses:
+            match analysis:
+                case "cfg":
+                    function.invalidate_control_flow_graph()
+                case "stack-depth":
+                    function.stack_depth = None
+
+
+def _program_size(program: ProgramContext) -> tuple[int, int]:
+    """Get count of functions and operators within them."""
+    functions = (*program.functions.values(), program.entry_point)
+    return len(functions), sum(len(function.source) for function in functions)
@@ -0,0 +1,28 @@
+"""Optimization remarks, that describes decisions made by optimizer (what is applied or missed and why)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from gofra.lexer.tokens import Token
+
+# `applied` when optimization is applied, `missed` when it is considered but not applied
+type OPTIMIZATION_REMARK_KIND_T = Literal["applied", "missed"]
+
+
+@dataclass(frozen=True, slots=True)
+class OptimizationRemark:
+    """Decision of optimizer about single operator."""
+
+    # Name of optimization (strategy) that made decision
+    optimization: str
+
+    kind: OPTIMIZATION_REMARK_KIND_T
+
+    # Token of operator that decision is made about
+    token: Token
+
+    # Human readable description of decision (and its reason)
+    message: str
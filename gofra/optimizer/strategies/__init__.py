@@ -1,6 +1,22 @@
 """Optimization strategies applied to the program to optimize it."""
 
+from .branch_folding import optimize_branch_folding
 from .constant_folding import optimize_constant_folding
 from .dead_code_elimination import optimize_dead_code_elimination
+from .inlining import InliningCostModel, optimize_inlining
+from .peephole import PEEPHOLE_RULES, PeepholeRule, optimize_peephole
+from .syscall_injection import optimize_syscall_injection
+from .tail_calls import optimize_tail_calls
 
-__all__ = ["optimize_constant_folding", "optimize_dead_code_elimination"]
+__all__ = [
+    "PEEPHOLE_RULES",
+    "InliningCostModel",
+    "PeepholeRule",
+    "optimize_branch_folding",
+    "optimize_constant_folding",
+    "optimize_dead_code_elimination",
+    "optimize_inlining",
+    "optimize_peephole",
+    "optimize_syscall_injection",
+    "optimize_tail_calls",
+]
@@ -0,0 +1,26 @@
+"""Relocation of jumps after operators are removed from function source."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from gofra.parser.operators import Operator
+
+
+def relocate_jumps(
+    operators: Sequence[Operator],
+    relocated_indices: Mapping[int, int],
+) -> None:
+    """Relocate jumps of operators (in-place) from indices of original source into indices of resulting one.
+
+    Relocated indices must contain every operator that is target of remaining jump.
+    """
+    for operator in operators:
+        if operator.jumps_to_operator_idx is None:
+            continue
+        operator.jumps_to_operator_idx = relocated_indices[
+            operator.jumps_to_operator_idx
+        ]
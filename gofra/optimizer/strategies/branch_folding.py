@@ -0,0 +1,94 @@
+"""Branch folding of conditional blocks with constant (known at compile time) conditions.
+
+Applied after constant folding, so conditions like `DEBUG if` or `true if` are single constant push before block:
+- `if` block with false condition is removed with its body,
+- `if` block with true condition is unwrapped (body is left as is),
+- `while` loop which condition is constant false is removed with its body.
+
+Removed operators (constant condition and blocks) are no-op as whole, so operators before and after them
+are adjacent and single forward pass is enough to fold blocks that becomes constant after other blocks are folded.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from gofra.parser.operators import OperatorType
+from gofra.tracing import trace_span
+
+from ._jumps import relocate_jumps
+
+if TYPE_CHECKING:
+    from gofra.context import ProgramContext
+    from gofra.parser.functions.function import Function
+    from gofra.parser.operators import Operator
+
+
+def optimize_branch_folding(program: ProgramContext) -> None:
+    """Fold conditional blocks with constant conditions within each function of program."""
+    for function in (*program.functions.values(), program.entry_point):
+        if function.is_externally_defined:
+            continue
+        with trace_span(
+            "fold branches of function",
+            category="optimizer",
+            args={"function": function.name},
+        ):
+            function.source = fold_function_branches(function)
+
+
+def fold_function_branches(function: Function) -> list[Operator]:
+    """Get operators of function source with folded constant branches (source itself is not replaced).
+
+    Jumps of remaining operators are relocated in-place.
+    """
+    source = function.source
+
+    folded: list[Operator] = []
+    relocated_indices: dict[int, int] = {}
+    # Indices of `end` operators of unwrapped blocks, these are skipped
+    unwrapped_block_ends: set[int] = set()
+
+    idx = 0
+    while idx < len(source):
+        operator = source[idx]
+        condition = _constant_condition_on_top(folded)
+
+        if operator.type == OperatorType.IF and condition is not None:
+            assert operator.jumps_to_operator_idx is not None
+            folded.pop()
+            if condition:
+                unwrapped_block_ends.add(operator.jumps_to_operator_idx)
+                idx += 1
+            else:
+                idx = operator.jumps_to_operator_idx + 1
+            continue
+
+        if (
+            operator.type == OperatorType.DO
+            and condition == 0
+            and len(folded) >= 2  # noqa: PLR2004
+            and folded[-2].type == OperatorType.WHILE
+        ):
+            # Loop condition is only constant itself, so loop body is never executed
+            assert operator.jumps_to_operator_idx is not None
+            folded.pop()
+            folded.pop()
+            idx = operator.jumps_to_operator_idx + 1
+            continue
+
+        if idx not in unwrapped_block_ends:
+            relocated_indices[idx] = len(folded)
+            folded.append(operator)
+        idx += 1
+
+    relocate_jumps(folded, relocated_indices)
+    return folded
+
+
+def _constant_condition_on_top(operators: list[Operator]) -> int | None:
+    """Get value of constant pushed by last operator, if it is constant."""
+    if not operators or operators[-1].type != OperatorType.PUSH_INTEGER:
+        return None
+    assert isinstance(operators[-1].operand, int)
+    return operators[-1].operand
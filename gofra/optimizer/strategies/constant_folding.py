@@ -1,20 +1,37 @@
+"""Constant folding (and propagation through stack) of function operators.
+
+Operators are processed within single forward pass where resulting operators are treated as stack:
+when operator consumes values that are pushed by constant operators right before it (within same basic block),
+these are evaluated at compile time and replaced with resulting constant (which may be folded further),
+so `2 2 + 3 *` folds into single push of 12 and `1 1 ==` into single push of (boolean) 1.
+
+Control-flow operators are never folded, so jumps are relocated by single remap after pass.
+"""
+
+from __future__ import annotations
+
 import operator as python_operator
-from collections import deque
-from collections.abc import MutableSequence, Sequence
-from typing import Callable
+from typing import TYPE_CHECKING
 
-from gofra.context import ProgramContext
-from gofra.lexer import Token, TokenType
 from gofra.parser import Operator, OperatorType
 from gofra.parser.intrinsics import Intrinsic
+from gofra.tracing import trace_span
 from gofra.typecheck.types import GofraType
 
+from ._jumps import relocate_jumps
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from gofra.context import ProgramContext
+    from gofra.parser.functions.function import Function
+
 type BinaryIntFoldPredicate = Callable[[int, int], int]
 BINARY_INT_INTRINSIC_FOLD_PREDICATES: dict[Intrinsic, BinaryIntFoldPredicate] = {
     Intrinsic.PLUS: python_operator.add,
     Intrinsic.MINUS: python_operator.sub,
     Intrinsic.MULTIPLY: python_operator.mul,
-    Intrinsic.DIVIDE: python_operator.truediv,
+    Intrinsic.DIVIDE: python_operator.floordiv,
     Intrinsic.MODULUS: python_operator.mod,
     Intrinsic.EQUAL: python_operator.eq,
     Intrinsic.NOT_EQUAL: python_operator.ne,
@@ -24,6 +41,16 @@ BINARY_INT_INTRINSIC_FOLD_PREDICATES: dict[Intrinsic, BinaryIntFoldPredicate] =
     Intrinsic.GREATER_EQUAL_THAN: python_operator.ge,
 }
 
+type UnaryIntFoldPredicate = Callable[[int], int]
+UNARY_INT_INTRINSIC_FOLD_PREDICATES: dict[Intrinsic, UnaryIntFoldPredicate] = {
+    Intrinsic.INCREMENT: lambda value: value + 1,
+    Intrinsic.DECREMENT: lambda value: value - 1,
+}
+
+# Only non-negative integers that fits into signed machine word are folded
+# so folded value is same as computed at runtime (signed or unsigned) and still may be pushed by codegen
+FOLDABLE_INTEGER_MAX = 2**63 - 1
+
 
 def optimize_constant_folding(program: ProgramContext) -> None:
     """Optimize given operators so they dont left unfolded into useless operators.
@@ -31,169 +58,152 @@ def optimize_constant_folding(program: ProgramContext) -> None:
     For example: 2 2 + folds into single push 4
     or operations that results into dropping from stack being eliminated
     """
-    # TODO(@kirillzhosul): This should be refactored due to refactoring core.
-    return
     for function in (*program.functions.values(), program.entry_point):
-        function.source = _fold_operators(function.source)
-
-
-def _fold_operators(unoptimized: Sequence[Operator]) -> Sequence[Operator]:
-    non_optimizable_offset = 2
-    if len(unoptimized) < non_optimizable_offset:
-        return unoptimized
-
-    optimized = deque(unoptimized[:non_optimizable_offset])
-    jump_idx_left_shift = 0
-
-    open_ctx_stack: list[Operator] = [
-        operator
-        for operator in optimized
-        if operator.type in (OperatorType.DO, OperatorType.IF)
-    ]
-
-    def shift_unoptimized_operator() -> None:
-        op = optimized[-1]
-        if op.jumps_to_operator_idx is not None:
-            op.jumps_to_operator_idx = max(
-                op.jumps_to_operator_idx - int(jump_idx_left_shift),
-                0,
-            )
-
-    def shift_open_ctx_operator(shifted_left_by: int) -> None:
-        assert len(open_ctx_stack) > 0
-
-        ctx_operator = open_ctx_stack.pop()
-
-        assert ctx_operator.jumps_to_operator_idx is not None
-        ctx_operator.jumps_to_operator_idx -= shifted_left_by
-
-    for idx, operator in enumerate(unoptimized[2:], start=2):
-        if operator.type in (OperatorType.DO, OperatorType.IF):
-            open_ctx_stack.append(operator)
-            optimized.append(operator)
-            continue
-
-        if operator.type == OperatorType.END:
-            optimized.append(operator)
-            shift_unoptimized_operator()
-            shift_open_ctx_operator(shifted_left_by=jump_idx_left_shift)
+        if function.is_externally_defined:
             continue
+        with trace_span(
+            "fold function",
+            category="optimizer",
+            args={"function": function.name},
+        ):
+            function.source = fold_function_operators(function)
 
-        if operator.type != OperatorType.INTRINSIC:
-            optimized.append(operator)
-            shift_unoptimized_operator()
-            continue
 
-        assert isinstance(operator.operand, Intrinsic)
+def fold_function_operators(function: Function) -> list[Operator]:
+    """Get folded operators of function source (source itself is not replaced).
 
-        if operator.operand == Intrinsic.DROP:
-            prev_operator = optimized[-1]
-            if prev_operator.type == OperatorType.PUSH_INTEGER:
-                optimized.pop()
-                jump_idx_left_shift += 2
-                continue
+    Jumps of control-flow operators are relocated in-place.
+    """
+    source = function.source
+    operator_blocks = function.control_flow_graph().operator_blocks
+
+    folded: list[Operator] = []
+    # Basic block of each folded operator (that is block of operator which is folded into it)
+    folded_blocks: list[int] = []
+    # Index within folded operators of each operator that is not folded away (control-flow operators always)
+    relocated_indices: dict[int, int] = {}
+
+    def constant_operands(count: int, block: int) -> list[int] | None:
+        """Get values of given count of constants on top of folded operators, if all of them are within given block."""
+        if len(folded) < count:
+            return None
+        values: list[int] = []
+        for folded_idx in range(len(folded) - count, len(folded)):
+            candidate = folded[folded_idx]
             if (
-                prev_operator.is_syscall()
-                and prev_operator.syscall_optimization_omit_result is False
+                candidate.type != OperatorType.PUSH_INTEGER
+                or folded_blocks[folded_idx] != block
             ):
-                prev_operator.syscall_optimization_omit_result = True
-                prev_operator.has_optimizations = True
-                jump_idx_left_shift += 1
-                continue
+                return None
+            assert isinstance(candidate.operand, int)
+            values.append(candidate.operand)
+        return values
+
+    def replace_constants(count: int, block: int, *constants: Operator) -> None:
+        """Replace given count of constants on top of folded operators with given ones."""
+        del folded[len(folded) - count :]
+        del folded_blocks[len(folded_blocks) - count :]
+        folded.extend(constants)
+        folded_blocks.extend([block] * len(constants))
+
+    for idx, operator in enumerate(source):
+        block = operator_blocks[idx]
+        intrinsic = (
+            operator.operand if operator.type == OperatorType.INTRINSIC else None
+        )
 
-        if (
-            operator.is_syscall()
-            and operator.syscall_optimization_injected_args is None
-        ):
-            args_count = operator.get_syscall_arguments_count()
-            for arg_n in range(args_count):
-                arg_operator = optimized.pop()
-                if arg_operator.type != OperatorType.PUSH_INTEGER:
-                    optimized.append(arg_operator)
-                    break
-
-                if operator.syscall_optimization_injected_args is None:
-                    operator.has_optimizations = True
-                    operator.syscall_optimization_injected_args = [
-                        None for _ in range(args_count)
-                    ]
-
-                assert isinstance(arg_operator.operand, int)
-                operator.syscall_optimization_injected_args[arg_n] = (
-                    arg_operator.operand
+        if intrinsic in BINARY_INT_INTRINSIC_FOLD_PREDICATES:
+            assert isinstance(intrinsic, Intrinsic)
+            operands = constant_operands(2, block)
+            value = (
+                _fold_binary_intrinsic(intrinsic, *operands)
+                if operands is not None
+                else None
+            )
+            if value is not None:
+                replace_constants(
+                    2,
+                    block,
+                    _folded_constant(operator, value, intrinsic),
                 )
-                jump_idx_left_shift += 1
-            if operator.syscall_optimization_injected_args:
-                operator.syscall_optimization_injected_args = list(
-                    reversed(operator.syscall_optimization_injected_args),
+                continue
+        elif intrinsic in UNARY_INT_INTRINSIC_FOLD_PREDICATES:
+            assert isinstance(intrinsic, Intrinsic)
+            operands = constant_operands(1, block)
+            value = (
+                _fold_unary_intrinsic(intrinsic, *operands)
+                if operands is not None
+                else None
+            )
+            if value is not None:
+                replace_constants(
+                    1,
+                    block,
+                    _folded_constant(operator, value, intrinsic),
                 )
-            optimized.append(operator)
+                continue
+        elif intrinsic == Intrinsic.COPY and constant_operands(1, block) is not None:
+            constant = folded[-1]
+            replace_constants(1, block, constant, constant.copy())
             continue
-
-        fold_predicate = BINARY_INT_INTRINSIC_FOLD_PREDICATES.get(operator.operand)
-        if fold_predicate is None:
-            optimized.append(operator)
-            shift_unoptimized_operator()
+        elif intrinsic == Intrinsic.SWAP and constant_operands(2, block) is not None:
+            lhs, rhs = folded[-2], folded[-1]
+            replace_constants(2, block, rhs, lhs)
             continue
-
-        was_folded = _fold_binary_integer_math_operator(
-            idx,
-            optimized,
-            unoptimized,
-            fold_predicate=fold_predicate,
-        )
-        if not was_folded:
-            optimized.append(operator)
-            shift_unoptimized_operator()
+        elif intrinsic == Intrinsic.DROP and constant_operands(1, block) is not None:
+            replace_constants(1, block)
             continue
 
-        jump_idx_left_shift += 2
-        shift_unoptimized_operator()
-
-    if jump_idx_left_shift > 0:
-        return _fold_operators(unoptimized=list(optimized))
-
-    return optimized
-
-
-def _fold_binary_integer_math_operator(
-    idx: int,
-    optimized: MutableSequence[Operator],
-    unoptimized: Sequence[Operator],
-    *,
-    fold_predicate: BinaryIntFoldPredicate,
-) -> bool:
-    operators = [unoptimized[idx - 1], unoptimized[idx - 2]]
-
-    if not (operators[0].type == operators[1].type == OperatorType.PUSH_INTEGER):
-        return False
-
-    operands = [operators[0].operand, operators[1].operand]
-    assert isinstance(operands[0], int)
-    assert isinstance(operands[1], int)
-
-    infer_type = GofraType.INTEGER
-    folded_value = fold_predicate(operands[0], operands[1])
-    if isinstance(folded_value, bool):
-        infer_type = GofraType.BOOLEAN
-
-    folded_value = int(folded_value)
-
-    optimized.pop()
-    optimized.pop()
-
-    operator = Operator(
+        relocated_indices[idx] = len(folded)
+        folded.append(operator)
+        folded_blocks.append(block)
+
+    # Jumps are only targeting control-flow operators, which are never folded
+    relocate_jumps(folded, relocated_indices)
+    return folded
+
+
+def _fold_binary_intrinsic(intrinsic: Intrinsic, lhs: int, rhs: int) -> int | None:
+    """Get result of given intrinsic (as would be computed at runtime), or nothing if that cannot be folded."""
+    if intrinsic in (Intrinsic.DIVIDE, Intrinsic.MODULUS) and rhs == 0:
+        # Division by zero is left as is to fail at runtime
+        return None
+    if not (0 <= lhs <= FOLDABLE_INTEGER_MAX and 0 <= rhs <= FOLDABLE_INTEGER_MAX):
+        return None
+    return _foldable_value(BINARY_INT_INTRINSIC_FOLD_PREDICATES[intrinsic](lhs, rhs))
+
+
+def _fold_unary_intrinsic(intrinsic: Intrinsic, value: int) -> int | None:
+    if not 0 <= value <= FOLDABLE_INTEGER_MAX:
+        return None
+    return _foldable_value(UNARY_INT_INTRINSIC_FOLD_PREDICATES[intrinsic](value))
+
+
+def _foldable_value(value: int) -> int | None:
+    if not 0 <= value <= FOLDABLE_INTEGER_MAX:
+        return None
+    return int(value)
+
+
+def _folded_constant(
+    folded_operator: Operator,
+    value: int,
+    intrinsic: Intrinsic,
+) -> Operator:
+    """Get constant (push) that given operator is folded into, comparisons are folded into boolean."""
+    is_comparison = intrinsic in (
+        Intrinsic.EQUAL,
+        Intrinsic.NOT_EQUAL,
+        Intrinsic.LESS_THAN,
+        Intrinsic.GREATER_THAN,
+        Intrinsic.LESS_EQUAL_THAN,
+        Intrinsic.GREATER_EQUAL_THAN,
+    )
+    return Operator(
         type=OperatorType.PUSH_INTEGER,
-        token=Token(
-            type=TokenType.INTEGER,
-            text="__optimized__",
-            value=folded_value,
-            location=unoptimized[idx].token.location,
-        ),
-        operand=folded_value,
+        token=folded_operator.token,
+        operand=value,
+        expanded_from=folded_operator.expanded_from,
         has_optimizations=True,
-        infer_type_after_optimization=infer_type,
+        infer_type_after_optimization=GofraType.BOOLEAN if is_comparison else None,
     )
-
-    optimized.append(operator)
-    return True
@@ -1,38 +1,79 @@
 from gofra.context import ProgramContext
-from gofra.parser.functions.function import Function
 from gofra.parser.operators import OperatorType
 
-DCE_MAX_TRAVERSIONS = 128
-
 
 def optimize_dead_code_elimination(
     program: ProgramContext,
 ) -> None:
     """Remove dead code from final operators result."""
     dce_remove_unused_functions(program)
+    dce_remove_unused_memories(program)
 
 
 def dce_remove_unused_functions(program: ProgramContext) -> None:
-    """Apply DCE for functions so unused functions are removed."""
-    for _ in range(DCE_MAX_TRAVERSIONS):
-        unused_functions = [
-            function
+    """Apply DCE for functions so unused functions are removed.
+
+    Call graph is built once and walked from entry point and global linker symbols (which may be called from outside),
+    every function that is not reachable within that walk is removed.
+    """
+    reachable_functions = reachable_function_names(program)
+
+    for function_name in [
+        function_name
+        for function_name in program.functions
+        if function_name not in reachable_functions
+    ]:
+        program.functions.pop(function_name)
+
+
+def reachable_function_names(program: ProgramContext) -> set[str]:
+    """Get names of functions that are reachable from entry point and global linker symbols (including them)."""
+    call_graph = _build_call_graph(program)
+
+    reachable_functions: set[str] = set()
+    unvisited_functions = [
+        program.entry_point.name,
+        *(
+            function.name
             for function in program.functions.values()
-            if not _is_function_was_called(program, program.functions[function.name])
-        ]
-        if not unused_functions:
-            return
-
-        [program.functions.pop(function.name) for function in unused_functions]
-
-
-def _is_function_was_called(program: ProgramContext, function: Function) -> bool:
-    """Check is given function was called atleast once in whole program."""
-    for possible_caller in [*program.functions.values(), program.entry_point]:
-        for operator in possible_caller.source:
-            if (
-                operator.type == OperatorType.FUNCTION_CALL
-                and operator.operand == function.name
-            ):
-                return True
-    return False
+            if function.is_global_linker_symbol
+        ),
+    ]
+    while unvisited_functions:
+        function_name = unvisited_functions.pop()
+        if function_name in reachable_functions:
+            continue
+        reachable_functions.add(function_name)
+        unvisited_functions.extend(call_graph.get(function_name, ()))
+    return reachable_functions
+
+
+def dce_remove_unused_memories(program: ProgramContext) -> None:
+    """Apply DCE for memories so memories that are not referenced within any function are removed.
+
+    Should be applied after unused functions are removed, so memories used only within them are removed too.
+    """
+    used_memories = {
+        operator.operand
+        for function in (*program.functions.values(), program.entry_point)
+        for operator in function.source
+        if operator.type == OperatorType.PUSH_MEMORY_POINTER
+    }
+    for memory_name in [
+        memory_name
+        for memory_name in program.memories
+        if memory_name not in used_memories
+    ]:
+        program.memories.pop(memory_name)
+
+
+def _build_call_graph(program: ProgramContext) -> dict[str, set[str]]:
+    """Get names of functions that each function calls (by function name)."""
+    return {
+        function.name: {
+            str(operator.operand)
+            for operator in function.source
+            if operator.type == OperatorType.FUNCTION_CALL
+        }
+        for function in (*program.functions.values(), program.entry_point)
+    }
@@ -0,0 +1,281 @@
+"""Automatic inlining of function calls, decided by cost model.
+
+Unlike `inline` functions (which are always expanded at parse time), these are still defined as usual functions,
+and calls to them are replaced with copies of their body when that is cheap enough:
+- body size (in operators) is within threshold, that is larger for call sites nested within loops (hot calls),
+- function with single call site (within reachable functions) is inlined with larger threshold,
+  as its definition becomes unused after,
+- whole program may grow only within size budget.
+
+Callees are inlined before callers (bottom-up over call graph), so body that is inlined already has inlined calls.
+Functions that are external, global linker symbols, recursive or have early return (`return`) are never inlined.
+Each decision (inlined or not, and why) is reported as optimization remark.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from gofra.optimizer.remarks import OptimizationRemark
+from gofra.parser.operators import OperatorType
+from gofra.tracing import trace_span
+
+from ._jumps import relocate_jumps
+from .dead_code_elimination import reachable_function_names
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from gofra.context import ProgramContext
+    from gofra.parser.functions.function import Function
+    from gofra.parser.operators import Operator
+
+
+@dataclass(frozen=True, slots=True)
+class InliningCostModel:
+    """Thresholds of inlining decisions, sizes are counted in operators."""
+
+    # Maximal body size of function that is inlined at call site outside of loops
+    max_body_size: int
+
+    # Maximal body size is multiplied by that for each loop that call site is nested within
+    loop_nesting_multiplier: int
+
+    # Maximal body size of function that has single call site, none if not limited
+    max_single_call_site_body_size: int | None
+
+    # Maximal growth of program size by inlining, relative to size of program before inlining
+    max_program_growth: float
+
+
+def optimize_inlining(program: ProgramContext, cost_model: InliningCostModel) -> None:
+    """Inline calls within each function of program, decided by given cost model.
+
+    Functions that are inlined at each call site are left unused, so dead code elimination should be applied after.
+    Calls within functions that are not reachable (from entry point or global linker symbols) are left as-is.
+    """
+    # Functions that are not reachable are removed by dead code elimination, so their calls are not counted
+    reachable_functions = reachable_function_names(program)
+    functions = [
+        function
+        for function in (*program.functions.values(), program.entry_point)
+        if function.name in reachable_functions
+    ]
+    call_sites_count = Counter(
+        str(operator.operand)
+        for function in functions
+        for operator in function.source
+        if operator.type == OperatorType.FUNCTION_CALL
+    )
+    program_size = sum(len(function.source) for function in functions)
+    growth_budget = int(program_size * cost_model.max_program_growth)
+
+    callers_order, recursive_functions = _bottom_up_functions(program)
+    for function in callers_order:
+        if function.name not in reachable_functions:
+            continue
+        with trace_span(
+            "inline calls of function",
+            category="optimizer",
+            args={"function": function.name},
+        ):
+            function.source, growth = inline_function_calls(
+                function,
+                program.functions,
+                cost_model=cost_model,
+                call_sites_count=call_sites_count,
+                not_inlinable_functions=recursive_functions,
+                growth_budget=growth_budget,
+                remarks=program.optimization_remarks,
+            )
+        growth_budget -= growth
+
+
+def inline_function_calls(  # noqa: PLR0913
+    function: Function,
+    functions: Mapping[str, Function],
+    *,
+    cost_model: InliningCostModel,
+    call_sites_count: Mapping[str, int],
+    not_inlinable_functions: set[str],
+    growth_budget: int,
+    remarks: list[OptimizationRemark],
+) -> tuple[list[Operator], int]:
+    """Get operators of function source with inlined calls (source itself is not replaced) and growth of its size.
+
+    Jumps of remaining operators are relocated in-place, inlined copies has jumps relocated to their location.
+    """
+    source = function.source
+    loop_depths = _operators_loop_depth(source)
+
+    inlined: list[Operator] = []
+    relocated_indices: dict[int, int] = {}
+    growth = 0
+
+    def remark(operator: Operator, *, is_applied: bool, message: str) -> None:
+        remarks.append(
+            OptimizationRemark(
+                optimization="inline",
+                kind="applied" if is_applied else "missed",
+                token=operator.token,
+                message=message,
+            ),
+        )
+
+    for idx, operator in enumerate(source):
+        callee = (
+            functions[operator.operand]
+            if operator.type == OperatorType.FUNCTION_CALL
+            and isinstance(operator.operand, str)
+            else None
+        )
+        if callee is None or not callee.has_executable_body():
+            relocated_indices[idx] = len(inlined)
+            inlined.append(operator)
+            continue
+
+        reason = _not_inlinable_reason(callee, not_inlinable_functions)
+        if reason is None:
+            loop_depth = loop_depths[idx]
+            has_single_call_site = call_sites_count[callee.name] == 1
+            threshold = cost_model.max_body_size * (
+                cost_model.loop_nesting_multiplier**loop_depth
+            )
+            body_size = len(callee.source)
+            if has_single_call_site:
+                threshold = max(
+                    threshold,
+                    cost_model.max_single_call_site_body_size or body_size,
+                )
+            # Call itself is replaced, and definition is unused when it is only call site
+            call_site_growth = 0 if has_single_call_site else body_size - 1
+
+            if body_size > threshold:
+                reason = f"body is too large ({body_size} > {threshold} operators, loop depth {loop_depth})"
+            elif growth + call_site_growth > growth_budget:
+                reason = f"program size budget is exhausted (growth by {call_site_growth} operators)"
+            else:
+                remark(
+                    operator,
+                    is_applied=True,
+                    message=f"'{callee.name}' inlined into '{function.name}' "
+                    f"({body_size} <= {threshold} operators, loop depth {loop_depth}"
+                    + (", single call site)" if has_single_call_site else ")"),
+                )
+                growth += call_site_growth
+                inlined.extend(_expanded_body(callee, operator, offset=len(inlined)))
+                continue
+
+        remark(
+            operator,
+            is_applied=False,
+            message=f"'{callee.name}' not inlined into '{function.name}': {reason}",
+        )
+        relocated_indices[idx] = len(inlined)
+        inlined.append(operator)
+
+    # Inlined copies are not operators of source (jumps are already relocated), these are never targets of jumps
+    relocate_jumps(
+        [source[idx] for idx in relocated_indices],
+        relocated_indices,
+    )
+    return inlined, growth
+
+
+def _not_inlinable_reason(
+    callee: Function,
+    not_inlinable_functions: set[str],
+) -> str | None:
+    if callee.is_global_linker_symbol:
+        return "callee is global linker symbol"
+    if callee.name in not_inlinable_functions:
+        return "callee is recursive"
+    if any(operator.type == OperatorType.FUNCTION_RETURN for operator in callee.source):
+        return "callee has early return"
+    return None
+
+
+def _expanded_body(
+    callee: Function,
+    call_operator: Operator,
+    offset: int,
+) -> list[Operator]:
+    """Get copies of callee body expanded from given call, with jumps relocated to given offset."""
+    expanded_operators = [operator.copy() for operator in callee.source]
+    for operator in expanded_operators:
+        if operator.expanded_from is None:
+            # Operators expanded within callee keep their innermost origin (macro or inline function usage)
+            operator.expanded_from = call_operator.token
+        # Tail call of callee is not last operator within caller
+        operator.call_optimization_is_tail_call = False
+        if operator.jumps_to_operator_idx is not None:
+            operator.jumps_to_operator_idx += offset
+    return expanded_operators
+
+
+def _operators_loop_depth(operators: list[Operator]) -> list[int]:
+    """Get count of loops that each operator is nested within."""
+    loop_depths: list[int] = []
+    loop_depth = 0
+    for operator in operators:
+        if operator.type == OperatorType.WHILE:
+            loop_depth += 1
+        loop_depths.append(loop_depth)
+        if (
+            operator.type == OperatorType.END
+            and operator.jumps_to_operator_idx is not None
+        ):
+            # Only `end` of loop jumps back (into `while`)
+            loop_depth -= 1
+    return loop_depths
+
+
+def _bottom_up_functions(program: ProgramContext) -> tuple[list[Function], set[str]]:
+    """Get functions with body where each function follows functions it calls, and names of recursive functions.
+
+    Functions within call graph cycle are ordered arbitrarily.
+    """
+    functions = program.functions
+    ordered: list[Function] = []
+    recursive_functions: set[str] = set()
+    visited: set[str] = set()
+
+    for root in (*functions.values(), program.entry_point):
+        if root.name in visited or not root.has_executable_body():
+            continue
+        # Depth-first traversal, function is ordered after all of its callees
+        visited.add(root.name)
+        on_path: set[str] = {root.name}
+        stack = [(root, _callees_of(root, functions), 0)]
+        while stack:
+            function, callees, callee_idx = stack[-1]
+            if callee_idx < len(callees):
+                stack[-1] = (function, callees, callee_idx + 1)
+                callee = callees[callee_idx]
+                if callee.name in on_path:
+                    recursive_functions.add(callee.name)
+                elif callee.name not in visited:
+                    visited.add(callee.name)
+                    on_path.add(callee.name)
+                    stack.append((callee, _callees_of(callee, functions), 0))
+                continue
+            stack.pop()
+            on_path.discard(function.name)
+            ordered.append(function)
+    return ordered, recursive_functions
+
+
+def _callees_of(
+    function: Function,
+    functions: Mapping[str, Function],
+) -> list[Function]:
+    """Get called functions (with body) of given function."""
+    return [
+        functions[operator.operand]
+        for operator in function.source
+        if operator.type == OperatorType.FUNCTION_CALL
+        and isinstance(operator.operand, str)
+        and functions[operator.operand].has_executable_body()
+    ]
@@ -0,0 +1,190 @@
+"""Peephole optimization of redundant stack shuffling (e.g `swap swap`, `copy drop`, `inc dec`).
+
+Optimization is driven by declarative table of rewrite rules (`PEEPHOLE_RULES`):
+each rule has pattern (matchers of adjacent operators), replacement and optional condition on matched operators.
+
+Operators are processed within single forward pass where resulting operators are treated as stack,
+rules are matched against top of it (only rules which pattern ends with pushed operator) (after each operator is pushed). When rule is applied,
+matched operators are removed and replacement is pushed back into input, so it is matched again with operators before it.
+Replacement is always shorter than pattern, so count of rewrites is bounded by count of operators (linear time)
+and result is fixed point (no rule may be applied to it).
+
+Patterns never match control-flow operators (which are the only jump targets and terminates blocks),
+so rewritten operators are always within single basic block and jumps are relocated by single remap after pass.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+from gofra.parser.intrinsics import Intrinsic
+from gofra.parser.operators import OperatorType
+from gofra.tracing import trace_span
+
+from ._jumps import relocate_jumps
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from gofra.context import ProgramContext
+    from gofra.parser.functions.function import Function
+    from gofra.parser.operators import Operator
+
+# Element of pattern, intrinsic matches only that intrinsic and `constant` matches push of single constant cell
+# (integer or memory pointer, string pushes two of them)
+type PeepholePatternElement = Intrinsic | Literal["constant"]
+type PeepholeReplacement = Callable[[Sequence[Operator]], list[Operator]]
+type PeepholeCondition = Callable[[Sequence[Operator]], bool]
+
+
+@dataclass(frozen=True, slots=True)
+class PeepholeRule:
+    """Rule to rewrite adjacent operators matched by pattern with replacement."""
+
+    # Name of rule, used to count hits of that rule
+    name: str
+
+    # Elements matching each operator (in order) that rule is applied to
+    pattern: tuple[PeepholePatternElement, ...]
+
+    # Get operators that matched operators are replaced with, must be shorter than pattern
+    replacement: PeepholeReplacement
+
+    # Additional condition on matched operators for rule to be applied
+    condition: PeepholeCondition | None = None
+
+
+def _removed(_: Sequence[Operator]) -> list[Operator]:
+    return []
+
+
+PEEPHOLE_RULES: tuple[PeepholeRule, ...] = (
+    PeepholeRule(
+        name="swap swap",
+        pattern=(Intrinsic.SWAP, Intrinsic.SWAP),
+        replacement=_removed,
+    ),
+    PeepholeRule(
+        name="copy drop",
+        pattern=(Intrinsic.COPY, Intrinsic.DROP),
+        replacement=_removed,
+    ),
+    PeepholeRule(
+        name="push drop",
+        pattern=("constant", Intrinsic.DROP),
+        replacement=_removed,
+    ),
+    PeepholeRule(
+        name="push push swap",
+        pattern=("constant", "constant", Intrinsic.SWAP),
+        replacement=lambda operators: [operators[1], operators[0]],
+    ),
+    PeepholeRule(
+        # Both elements are same after copy, so swap is no-op
+        name="copy swap",
+        pattern=(Intrinsic.COPY, Intrinsic.SWAP),
+        replacement=lambda operators: [operators[0]],
+    ),
+    PeepholeRule(
+        name="swap drop drop",
+        pattern=(Intrinsic.SWAP, Intrinsic.DROP, Intrinsic.DROP),
+        replacement=lambda operators: [operators[1], operators[2]],
+    ),
+    PeepholeRule(
+        name="inc dec",
+        pattern=(Intrinsic.INCREMENT, Intrinsic.DECREMENT),
+        replacement=_removed,
+    ),
+    PeepholeRule(
+        name="dec inc",
+        pattern=(Intrinsic.DECREMENT, Intrinsic.INCREMENT),
+        replacement=_removed,
+    ),
+)
+
+
+def optimize_peephole(program: ProgramContext) -> None:
+    """Apply peephole rules within each function of program.
+
+    Hits (applied rewrites) of each rule are counted within program context.
+    """
+    rules_hits = Counter(program.peephole_rules_hits)
+    for function in (*program.functions.values(), program.entry_point):
+        if function.is_externally_defined:
+            continue
+        with trace_span(
+            "peephole function",
+            category="optimizer",
+            args={"function": function.name},
+        ):
+            function.source = peephole_function_operators(function, rules_hits)
+    program.peephole_rules_hits = dict(rules_hits)
+
+
+def peephole_function_operators(
+    function: Function,
+    rules_hits: Counter[str],
+    rules: Sequence[PeepholeRule] = PEEPHOLE_RULES,
+) -> list[Operator]:
+    """Get operators of function source with applied peephole rules (source itself is not replaced).
+
+    Hits of applied rules are counted into given counter, jumps of remaining operators are relocated in-place.
+    """
+    source = function.source
+    # Rules are only tried for operators that matches last element of their pattern
+    rules_by_last_element: dict[PeepholePatternElement, list[PeepholeRule]] = {}
+    for rule in rules:
+        rules_by_last_element.setdefault(rule.pattern[-1], []).append(rule)
+
+    rewritten: list[Operator] = []
+    # Pattern element that each rewritten operator matches (none if operator is never matched)
+    rewritten_elements: list[PeepholePatternElement | None] = []
+    relocated_indices: dict[int, int] = {}
+    # Replacements that are pushed back into input, matched before next operator of source (last is first)
+    pending: list[Operator] = []
+
+    idx = 0
+    while pending or idx < len(source):
+        if pending:
+            operator = pending.pop()
+        else:
+            operator = source[idx]
+            relocated_indices[idx] = len(rewritten)
+            idx += 1
+        element = _pattern_element_of(operator)
+        rewritten.append(operator)
+        rewritten_elements.append(element)
+        if element is None:
+            continue
+
+        for rule in rules_by_last_element.get(element, ()):
+            pattern_length = len(rule.pattern)
+            if tuple(rewritten_elements[-pattern_length:]) != rule.pattern:
+                continue
+            matched = rewritten[-pattern_length:]
+            if rule.condition is not None and not rule.condition(matched):
+                continue
+            replacement = rule.replacement(matched)
+            assert len(replacement) < pattern_length, (
+                f"Replacement of peephole rule '{rule.name}' must be shorter than pattern"
+            )
+            del rewritten[-pattern_length:]
+            del rewritten_elements[-pattern_length:]
+            pending.extend(reversed(replacement))
+            rules_hits[rule.name] += 1
+            break
+
+    # Jumps are only targeting control-flow operators, which are never rewritten
+    relocate_jumps(rewritten, relocated_indices)
+    return rewritten
+
+
+def _pattern_element_of(operator: Operator) -> PeepholePatternElement | None:
+    if operator.type == OperatorType.INTRINSIC:
+        assert isinstance(operator.operand, Intrinsic)
+        return operator.operand
+    if operator.type in (OperatorType.PUSH_INTEGER, OperatorType.PUSH_MEMORY_POINTER):
+        return "constant"
+    return None
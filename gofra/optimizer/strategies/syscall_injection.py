@@ -0,0 +1,120 @@
+"""Injection of constant syscall arguments and omission of dropped syscall results.
+
+Syscall pops its number and arguments from stack into registers and pushes its result back onto stack,
+while these are mostly known at compile time (syscall number is always constant) and result is often dropped:
+- constants pushed right before syscall are injected into it, so codegen loads them straight into registers,
+- `drop` right after syscall is removed and syscall result is omitted, so it is never pushed onto stack.
+
+Only constants on top of stack are injected (contiguous from syscall number),
+as remaining arguments are still popped from stack in order.
+Applied after constant folding, so folded constants (e.g `SC_WRITE 1 +`) are injected too.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from gofra.parser.intrinsics import Intrinsic
+from gofra.parser.operators import OperatorType
+from gofra.tracing import trace_span
+
+from ._jumps import relocate_jumps
+
+if TYPE_CHECKING:
+    from gofra.context import ProgramContext
+    from gofra.parser.functions.function import Function
+    from gofra.parser.operators import Operator
+
+# Only non-negative integers that fits into signed machine word are injected, as these may be loaded by codegen
+INJECTABLE_INTEGER_MAX = 2**63 - 1
+
+
+def optimize_syscall_injection(program: ProgramContext) -> None:
+    """Inject constant arguments into syscalls and omit dropped results within each function of program."""
+    for function in (*program.functions.values(), program.entry_point):
+        if function.is_externally_defined:
+            continue
+        with trace_span(
+            "inject syscalls of function",
+            category="optimizer",
+            args={"function": function.name},
+        ):
+            function.source = inject_function_syscalls(function)
+
+
+def inject_function_syscalls(function: Function) -> list[Operator]:
+    """Get operators of function source with injected syscalls (source itself is not replaced).
+
+    Syscall operators are replaced with optimized copies, jumps of remaining operators are relocated in-place.
+    """
+    source = function.source
+
+    injected: list[Operator] = []
+    relocated_indices: dict[int, int] = {}
+
+    for idx, operator in enumerate(source):
+        if operator.is_syscall():
+            injected.append(_inject_syscall_arguments(operator, injected))
+            relocated_indices[idx] = len(injected) - 1
+            continue
+
+        if (
+            operator.type == OperatorType.INTRINSIC
+            and operator.operand == Intrinsic.DROP
+            and injected
+            and injected[-1].is_syscall()
+            and not injected[-1].syscall_optimization_omit_result
+        ):
+            # Syscall result is dropped right after, so it is never pushed
+            injected[-1].syscall_optimization_omit_result = True
+            injected[-1].has_optimizations = True
+            continue
+
+        relocated_indices[idx] = len(injected)
+        injected.append(operator)
+
+    # Jumps are only targeting control-flow operators, which are never removed
+    relocate_jumps(injected, relocated_indices)
+    return injected
+
+
+def _inject_syscall_arguments(syscall: Operator, operators: list[Operator]) -> Operator:
+    """Get copy of given syscall with constants on top of given operators injected into it (these are removed).
+
+    Injected arguments are in order of popping from stack (syscall number first), not injected ones are none.
+    Syscall that already has injected arguments (pass is applied again) is continued from these,
+    so only its remaining arguments (popped from stack) are injected.
+    """
+    arguments_count = syscall.get_syscall_arguments_count()
+    injected_args: list[int | None] = [
+        argument
+        for argument in syscall.syscall_optimization_injected_args or ()
+        if argument is not None
+    ]
+    injected_before = len(injected_args)
+    while (
+        len(injected_args) < arguments_count
+        and operators
+        and _is_injectable_constant(operators[-1])
+    ):
+        constant = operators.pop()
+        assert isinstance(constant.operand, int)
+        injected_args.append(constant.operand)
+
+    syscall = syscall.copy()
+    if len(injected_args) == injected_before:
+        return syscall
+    syscall.syscall_optimization_injected_args = [
+        *injected_args,
+        *(None for _ in range(arguments_count - len(injected_args))),
+    ]
+    syscall.has_optimizations = True
+    return syscall
+
+
+def _is_injectable_constant(operator: Operator) -> bool:
+    return (
+        operator.type == OperatorType.PUSH_INTEGER
+        and isinstance(operator.operand, int)
+        and 0 <= operator.operand <= INJECTABLE_INTEGER_MAX
+    )
@@ -0,0 +1,94 @@
+"""Tail-call optimization, calls that are last operator executed within caller are lowered into jumps.
+
+Call is tail call when it is followed by return (`call f return`) or by end of function,
+possibly through `end` of conditional blocks (these only falls through, unlike `end` of loops that jumps back).
+Callee of tail call returns straight into caller of function, so return address (and its stack) is not grown per call,
+and self-recursive tail call becomes loop.
+
+External functions are never called as tail calls, as their return value is pushed onto stack after call.
+Operators are only marked (source is not changed), lowering is done by codegen (arguments are loaded same as for call).
+Marks are only valid for operators at their position, so pass must be applied after passes that change source.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from gofra.optimizer.remarks import OptimizationRemark
+from gofra.parser.operators import OperatorType
+from gofra.tracing import trace_span
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from gofra.context import ProgramContext
+    from gofra.parser.functions.function import Function
+    from gofra.parser.operators import Operator
+
+
+def optimize_tail_calls(program: ProgramContext) -> None:
+    """Mark tail calls within each function of program."""
+    for function in (*program.functions.values(), program.entry_point):
+        if not function.has_executable_body():
+            continue
+        with trace_span(
+            "mark tail calls of function",
+            category="optimizer",
+            args={"function": function.name},
+        ):
+            mark_function_tail_calls(
+                function,
+                program.functions,
+                remarks=program.optimization_remarks,
+            )
+
+
+def mark_function_tail_calls(
+    function: Function,
+    functions: Mapping[str, Function],
+    *,
+    remarks: list[OptimizationRemark],
+) -> None:
+    """Mark calls within function source that are tail calls (in-place)."""
+    source = function.source
+    for idx, operator in enumerate(source):
+        if operator.type != OperatorType.FUNCTION_CALL or not _is_returning_after(
+            source,
+            idx + 1,
+        ):
+            continue
+        assert isinstance(operator.operand, str)
+        callee = functions[operator.operand]
+        if callee.is_externally_defined:
+            remarks.append(
+                OptimizationRemark(
+                    optimization="tail-call",
+                    kind="missed",
+                    token=operator.token,
+                    message=f"'{callee.name}' not lowered into jump within '{function.name}': callee is external",
+                ),
+            )
+            continue
+
+        operator.call_optimization_is_tail_call = True
+        remarks.append(
+            OptimizationRemark(
+                optimization="tail-call",
+                kind="applied",
+                token=operator.token,
+                message=f"'{callee.name}' lowered into jump within '{function.name}'"
+                + (" (self-recursion becomes loop)" if callee is function else ""),
+            ),
+        )
+
+
+def _is_returning_after(source: Sequence[Operator], idx: int) -> bool:
+    """Check that function returns right after operator at given index, without executing anything else."""
+    while (
+        idx < len(source)
+        and source[idx].type == OperatorType.END
+        and source[idx].jumps_to_operator_idx is None
+    ):
+        # End of conditional block falls through
+        idx += 1
+    return idx == len(source) or source[idx].type == OperatorType.FUNCTION_RETURN
@@ -1,6 +1,13 @@
 """Parser package that used to parse source tokens into operators."""
 
+from .compact import CompactOperators, OperandTable
 from .operators import Operator, OperatorType
 from .parser import parse_file
 
-__all__ = ["Operator", "OperatorType", "parse_file"]
+__all__ = [
+    "CompactOperators",
+    "OperandTable",
+    "Operator",
+    "OperatorType",
+    "parse_file",
+]
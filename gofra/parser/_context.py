@@ -13,9 +13,15 @@ if TYPE_CHECKING:
     from collections.abc import Iterable, MutableMapping, MutableSequence, Sequence
     from pathlib import Path
 
-    from gofra.lexer import Token
+    from gofra.lexer import LEXER_ENGINE_T, Token
+    from gofra.lexer.cache import TokenCache
     from gofra.typecheck.types import GofraType
 
+    from .cursor import TokenCursor
+    from .includes import IncludeGraph
+    from .macros import MacroTemplate
+    from .parallel import DeferredParsing
+
 
 @dataclass(frozen=False)
 class ParserContext:
@@ -23,8 +29,15 @@ class ParserContext:
 
     parsing_from_path: Path
     include_search_directories: Iterable[Path]
+    lexer_engine: LEXER_ENGINE_T
+
+    # If present, tokens of included files are loaded through that cache
+    token_cache: TokenCache | None
+
+    # Shared between all contexts within single compilation
+    include_graph: IncludeGraph
 
-    tokens: deque[Token]
+    tokens: TokenCursor
 
     # Should be refactored
     is_top_level: bool
@@ -36,17 +49,25 @@ class ParserContext:
     functions: MutableMapping[str, Function] = field(default_factory=lambda: dict())  # noqa: C408
     memories: MutableMapping[str, int] = field(default_factory=lambda: dict())  # noqa: C408
 
+    # Parsed macro bodies (nothing if macro cannot be expanded from template)
+    # Invalidated on any new definition, as it may change meaning of words inside macros
+    macro_templates: MutableMapping[str, MacroTemplate | None] = field(
+        default_factory=lambda: dict(),  # noqa: C408
+    )
+
     context_stack: deque[tuple[int, Operator]] = field(default_factory=lambda: deque())
-    included_source_paths: set[Path] = field(default_factory=lambda: set())
+
+    # If present, definitions are recorded and function bodies are deferred to be parsed in parallel after top-level
+    deferred_parsing: DeferredParsing | None = field(default=None)
 
     current_operator: int = field(default=0)
 
     def __post_init__(self) -> None:
-        assert self.tokens
-        self.included_source_paths.add(self.parsing_from_path)
+        assert not self.tokens.is_exhausted()
+        self.include_graph.add_root(self.parsing_from_path)
 
     def tokens_exhausted(self) -> bool:
-        return len(self.tokens) == 0
+        return self.tokens.is_exhausted()
 
     def has_context_stack(self) -> bool:
         return len(self.context_stack) > 0
@@ -54,8 +75,25 @@ class ParserContext:
     def new_macro(self, from_token: Token, name: str) -> Macro:
         macro = Macro(location=from_token.location, inner_tokens=[], name=name)
         self.macros[name] = macro
+        self.macro_templates.clear()
+        if self.deferred_parsing:
+            self.deferred_parsing.record_definition(
+                self.deferred_parsing.macros,
+                name,
+                macro,
+            )
         return macro
 
+    def new_memory(self, name: str, size: int) -> None:
+        self.memories[name] = size
+        self.macro_templates.clear()
+        if self.deferred_parsing:
+            self.deferred_parsing.record_definition(
+                self.deferred_parsing.memories,
+                name,
+                size,
+            )
+
     def new_function(
         self,
         from_token: Token,
@@ -79,17 +117,48 @@ class ParserContext:
             is_global_linker_symbol=is_global_linker_symbol,
         )
         self.functions[name] = function
+        self.macro_templates.clear()
+        if self.deferred_parsing:
+            self.deferred_parsing.record_definition(
+                self.deferred_parsing.functions,
+                name,
+                function,
+            )
         return function
 
-    def expand_from_inline_block(self, inline_block: Macro | Function) -> None:
+    def expand_from_inline_block(
+        self,
+        inline_block: Macro | Function,
+        expanded_from: Token,
+    ) -> None:
         if isinstance(inline_block, Function):
             if inline_block.is_externally_defined:
                 msg = "Cannot expand extern function."
                 raise ValueError(msg)
-            self.current_operator += len(inline_block.source)
-            self.operators.extend(inline_block.source)
+            self.expand_operators(inline_block.source, expanded_from=expanded_from)
             return
-        self.tokens.extend(deque(reversed(inline_block.inner_tokens)))
+        self.tokens.push(inline_block.inner_tokens)
+
+    def expand_operators(
+        self,
+        operators: Sequence[Operator],
+        *,
+        expanded_from: Token,
+    ) -> None:
+        """Expand copies of given operators (inline function body or macro template).
+
+        Jumps of copies are relocated to current operator, so given operators must have jumps relative to their beginning.
+        Originals are never emitted, so later mutations (e.g optimizations) does not leak across expansions.
+        """
+        expanded_operators = [operator.copy() for operator in operators]
+        for operator in expanded_operators:
+            if operator.expanded_from is None:
+                # Nested expansion keeps its innermost usage
+                operator.expanded_from = expanded_from
+            if operator.jumps_to_operator_idx is not None:
+                operator.jumps_to_operator_idx += self.current_operator
+        self.operators.extend(expanded_operators)
+        self.current_operator += len(expanded_operators)
 
     def pop_context_stack(self) -> tuple[int, Operator]:
         return self.context_stack.pop()
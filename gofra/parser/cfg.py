@@ -0,0 +1,266 @@
+"""Control-flow graph (basic blocks) of function source.
+
+Operators are flat sequence where conditional blocks are encoded as jumps (`jumps_to_operator_idx`):
+- `if` jumps to its `end` when condition is false, `end` of `if` only marks end of block (falls through),
+- `while` marks loop header, `do` jumps after its `end` when condition is false,
+- `end` of `while ... do` jumps back to `while` (loop back edge),
+- `return` leaves function.
+
+Graph is built once per function source and shared between stages, see `Function.control_flow_graph`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from .operators import OperatorType
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from .operators import Operator
+
+
+@dataclass(frozen=False, slots=True)
+class BasicBlock:
+    """Maximal sequence of operators that is entered only at its start and left only at its end."""
+
+    idx: int
+
+    # Operators of block are `source[start:end]`
+    start: int
+    end: int
+
+    successors: list[int] = field(default_factory=lambda: list())  # noqa: C408
+    predecessors: list[int] = field(default_factory=lambda: list())  # noqa: C408
+
+    # Control may leave function from that block (by `return` or by reaching end of source)
+    exits_function: bool = field(default=False)
+    # Block starts with `while` (is target of loop back edge)
+    is_loop_header: bool = field(default=False)
+
+    def __repr__(self) -> str:
+        return f"BB<{self.idx} [{self.start}..{self.end})>"
+
+
+@dataclass(frozen=False, slots=True)
+class ControlFlowGraph:
+    """Basic blocks of function source with edges between them and dominators.
+
+    First block is an entry block (if source is not empty).
+    """
+
+    # Source (and its length) graph is built from, to detect that source was replaced or resized
+    source: Sequence[Operator]
+    source_length: int
+
+    blocks: list[BasicBlock]
+    # Index of block that contains operator (by operator index)
+    operator_blocks: list[int]
+
+    # Blocks in reverse postorder from entry block, unreachable blocks are not included
+    reverse_postorder: list[int]
+    # Immediate dominator of each reachable block, entry block and unreachable blocks has none
+    immediate_dominators: list[int | None]
+
+    # Loop back edges (from `end` block into `while` block)
+    back_edges: list[tuple[int, int]]
+
+    def is_built_from(self, source: Sequence[Operator]) -> bool:
+        return self.source is source and self.source_length == len(source)
+
+    def block_of_operator(self, operator_idx: int) -> BasicBlock:
+        return self.blocks[self.operator_blocks[operator_idx]]
+
+    def is_reachable(self, block_idx: int) -> bool:
+        return block_idx == 0 or self.immediate_dominators[block_idx] is not None
+
+    def dominates(self, dominator_idx: int, block_idx: int) -> bool:
+        """Check is every path from entry into given block goes through dominator block."""
+        if not self.is_reachable(block_idx):
+            return False
+        current_idx: int | None = block_idx
+        while current_idx is not None:
+            if current_idx == dominator_idx:
+                return True
+            current_idx = self.immediate_dominators[current_idx]
+        return False
+
+
+def build_control_flow_graph(source: Sequence[Operator]) -> ControlFlowGraph:
+    """Split source into basic blocks and connect them by control flow."""
+    source_length = len(source)
+    leaders = _find_block_leaders(source)
+
+    blocks: list[BasicBlock] = []
+    operator_blocks: list[int] = []
+    for block_idx, start in enumerate(leaders):
+        end = leaders[block_idx + 1] if block_idx + 1 < len(leaders) else source_length
+        blocks.append(
+            BasicBlock(
+                idx=block_idx,
+                start=start,
+                end=end,
+                is_loop_header=source[start].type == OperatorType.WHILE,
+            ),
+        )
+        operator_blocks.extend([block_idx] * (end - start))
+
+    back_edges: list[tuple[int, int]] = []
+    for block in blocks:
+        for successor_idx, is_back_edge in _block_successors(
+            source,
+            block,
+            operator_blocks,
+        ):
+            if successor_idx is None:
+                block.exits_function = True
+                continue
+            if successor_idx not in block.successors:
+                block.successors.append(successor_idx)
+                blocks[successor_idx].predecessors.append(block.idx)
+            if is_back_edge:
+                back_edges.append((block.idx, successor_idx))
+
+    reverse_postorder = _reverse_postorder(blocks)
+    return ControlFlowGraph(
+        source=source,
+        source_length=source_length,
+        blocks=blocks,
+        operator_blocks=operator_blocks,
+        reverse_postorder=reverse_postorder,
+        immediate_dominators=_immediate_dominators(blocks, reverse_postorder),
+        back_edges=back_edges,
+    )
+
+
+def _find_block_leaders(source: Sequence[Operator]) -> list[int]:
+    """Get (sorted) indices of operators that are starting basic blocks."""
+    source_length = len(source)
+    leaders = {0} if source_length else set()
+    for idx, operator in enumerate(source):
+        match operator.type:
+            case OperatorType.WHILE:
+                leaders.add(idx)
+            case OperatorType.IF | OperatorType.DO:
+                assert operator.jumps_to_operator_idx is not None
+                leaders.add(idx + 1)
+                # `end` of `if` is join point, `do` leaves loop right after its `end`
+                leaders.add(
+                    operator.jumps_to_operator_idx
+                    + (1 if operator.type == OperatorType.DO else 0),
+                )
+            case OperatorType.END if operator.jumps_to_operator_idx is not None:
+                leaders.add(idx + 1)
+            case OperatorType.FUNCTION_RETURN:
+                leaders.add(idx + 1)
+            case _:
+                ...
+    return sorted(leader for leader in leaders if leader < source_length)
+
+
+def _block_successors(
+    source: Sequence[Operator],
+    block: BasicBlock,
+    operator_blocks: Sequence[int],
+) -> list[tuple[int | None, bool]]:
+    """Get successors of block (none for leaving function) with flag is that an loop back edge."""
+    source_length = len(source)
+
+    def block_at(operator_idx: int) -> int | None:
+        return operator_blocks[operator_idx] if operator_idx < source_length else None
+
+    terminator = source[block.end - 1]
+    match terminator.type:
+        case OperatorType.FUNCTION_RETURN:
+            return [(None, False)]
+        case OperatorType.IF:
+            assert terminator.jumps_to_operator_idx is not None
+            return [
+                (block_at(block.end), False),
+                (block_at(terminator.jumps_to_operator_idx), False),
+            ]
+        case OperatorType.DO:
+            assert terminator.jumps_to_operator_idx is not None
+            return [
+                (block_at(block.end), False),
+                (block_at(terminator.jumps_to_operator_idx + 1), False),
+            ]
+        case OperatorType.END if terminator.jumps_to_operator_idx is not None:
+            return [(block_at(terminator.jumps_to_operator_idx), True)]
+        case _:
+            return [(block_at(block.end), False)]
+
+
+def _reverse_postorder(blocks: Sequence[BasicBlock]) -> list[int]:
+    """Get reachable blocks in reverse postorder of depth-first traversal from entry block."""
+    if not blocks:
+        return []
+
+    postorder: list[int] = []
+    visited = {0}
+    # Stack of (block, index of next successor to visit), so traversal is not recursive
+    stack = [(0, 0)]
+    while stack:
+        block_idx, successor_pos = stack[-1]
+        successors = blocks[block_idx].successors
+        if successor_pos < len(successors):
+            stack[-1] = (block_idx, successor_pos + 1)
+            successor_idx = successors[successor_pos]
+            if successor_idx not in visited:
+                visited.add(successor_idx)
+                stack.append((successor_idx, 0))
+            continue
+        stack.pop()
+        postorder.append(block_idx)
+
+    postorder.reverse()
+    return postorder
+
+
+def _immediate_dominators(
+    blocks: Sequence[BasicBlock],
+    reverse_postorder: Sequence[int],
+) -> list[int | None]:
+    """Compute immediate dominators (iterative algorithm by Cooper, Harvey and Kennedy)."""
+    immediate_dominators: list[int | None] = [None] * len(blocks)
+    if not reverse_postorder:
+        return immediate_dominators
+
+    order = {block_idx: pos for pos, block_idx in enumerate(reverse_postorder)}
+
+    def dominator_of(block_idx: int) -> int:
+        dominator_idx = immediate_dominators[block_idx]
+        assert dominator_idx is not None
+        return dominator_idx
+
+    def intersect(lhs: int, rhs: int) -> int:
+        while lhs != rhs:
+            while order[lhs] > order[rhs]:
+                lhs = dominator_of(lhs)
+            while order[rhs] > order[lhs]:
+                rhs = dominator_of(rhs)
+        return lhs
+
+    entry_idx = reverse_postorder[0]
+    immediate_dominators[entry_idx] = entry_idx
+    changed = True
+    while changed:
+        changed = False
+        for block_idx in reverse_postorder[1:]:
+            processed_predecessors = [
+                predecessor_idx
+                for predecessor_idx in blocks[block_idx].predecessors
+                if immediate_dominators[predecessor_idx] is not None
+            ]
+            new_dominator = processed_predecessors[0]
+            for predecessor_idx in processed_predecessors[1:]:
+                new_dominator = intersect(predecessor_idx, new_dominator)
+            if immediate_dominators[block_idx] != new_dominator:
+                immediate_dominators[block_idx] = new_dominator
+                changed = True
+
+    # Entry block is not dominated by any other block
+    immediate_dominators[entry_idx] = None
+    return immediate_dominators
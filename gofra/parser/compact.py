@@ -0,0 +1,253 @@
+"""Compact (struct-of-arrays) form of operators.
+
+Each operator is an object carrying its token and optimization fields, so sequence of operators is sequence of objects.
+Compact form stores same operators as parallel arrays (opcodes, operands, jump targets), with operands that are not
+fitting into an machine word (strings, memory/function names, big integers) interned within operand table,
+and tokens (source locations) and optimization fields within side tables.
+
+Operators may be converted into compact form and back (without any loss), so stages may migrate to it one at a time.
+It is not used by compiler stages yet: each stage operates on (and mutates) operator objects, and converting
+into compact form and back costs more than any single stage (see `benchmarks/compact_operators.py`),
+so it only pays off once stages read arrays directly.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from .intrinsics import Intrinsic
+from .operators import Operator, OperatorType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from gofra.lexer import Token
+    from gofra.typecheck.types import GofraType
+
+    from .functions import Function
+    from .operators import OperatorOperand
+
+# Opcode is an operator type with kind of its operand in high bits (operator types are fitting into low bits)
+OPCODE_TYPE_MASK = 0x3F
+OPERAND_KIND_MASK = 0xC0
+
+# Operand is an integer stored as is
+OPERAND_KIND_INTEGER = 0x00
+# Operand is an index within operand table
+OPERAND_KIND_INTERNED = 0x40
+# Operand is an intrinsic stored as its value
+OPERAND_KIND_INTRINSIC = 0x80
+# Operator has no operand
+OPERAND_KIND_NONE = 0xC0
+
+# Jump target of operator that has no jump
+NO_JUMP = -1
+
+_INTEGER_OPERAND_MIN = -(2**63)
+_INTEGER_OPERAND_MAX = 2**63 - 1
+
+
+@dataclass(frozen=False, slots=True)
+class OperandTable:
+    """Interned operands which are not fitting into an machine word, shared between compacted sequences."""
+
+    operands: list[int | str] = field(default_factory=lambda: list())  # noqa: C408
+    _indices: dict[tuple[type, int | str], int] = field(
+        default_factory=lambda: dict(),  # noqa: C408
+    )
+
+    def intern(self, operand: int | str) -> int:
+        """Get index of given operand within table, adding it if it is not present."""
+        # Key by type too, so `1` and `"1"` are different operands
+        key = (type(operand), operand)
+        idx = self._indices.get(key)
+        if idx is None:
+            idx = self._indices[key] = len(self.operands)
+            self.operands.append(operand)
+        return idx
+
+
+@dataclass(frozen=True, slots=True)
+class OperatorOptimizations:
+    """Optimization fields of single operator, only stored for operators that has them."""
+
+    syscall_optimization_omit_result: bool
+    syscall_optimization_injected_args: list[int | None] | None
+    call_optimization_is_tail_call: bool
+    has_optimizations: bool
+    infer_type_after_optimization: GofraType | None
+
+    @staticmethod
+    def from_operator(operator: Operator) -> OperatorOptimizations:
+        injected_args = operator.syscall_optimization_injected_args
+        return OperatorOptimizations(
+            syscall_optimization_omit_result=operator.syscall_optimization_omit_result,
+            syscall_optimization_injected_args=(
+                list(injected_args) if injected_args is not None else None
+            ),
+            call_optimization_is_tail_call=operator.call_optimization_is_tail_call,
+            has_optimizations=operator.has_optimizations,
+            infer_type_after_optimization=operator.infer_type_after_optimization,
+        )
+
+    def apply_to(self, operator: Operator) -> None:
+        injected_args = self.syscall_optimization_injected_args
+        operator.syscall_optimization_omit_result = (
+            self.syscall_optimization_omit_result
+        )
+        operator.syscall_optimization_injected_args = (
+            list(injected_args) if injected_args is not None else None
+        )
+        operator.call_optimization_is_tail_call = self.call_optimization_is_tail_call
+        operator.has_optimizations = self.has_optimizations
+        operator.infer_type_after_optimization = self.infer_type_after_optimization
+
+
+@dataclass(frozen=False, slots=True)
+class CompactOperators:
+    """Sequence of operators in compact form, indices (and jump targets) are same as within original sequence."""
+
+    operand_table: OperandTable
+
+    opcodes: array[int] = field(default_factory=lambda: array("B"))
+    operands: array[int] = field(default_factory=lambda: array("q"))
+    jumps: array[int] = field(default_factory=lambda: array("q"))
+
+    # Side tables, optimizations are only stored for operators that has them
+    tokens: list[Token] = field(default_factory=lambda: list())  # noqa: C408
+    expanded_from: list[Token | None] = field(default_factory=lambda: list())  # noqa: C408
+    optimizations: dict[int, OperatorOptimizations] = field(
+        default_factory=lambda: dict(),  # noqa: C408
+    )
+
+    @staticmethod
+    def from_operators(
+        operators: Sequence[Operator],
+        operand_table: OperandTable | None = None,
+    ) -> CompactOperators:
+        """Convert operators into compact form, interning operands within given table (or new one)."""
+        compact = CompactOperators(operand_table=operand_table or OperandTable())
+        encoded_operands = [
+            compact._encode_operand(operator.operand) for operator in operators
+        ]
+
+        # Arrays are built at once (not appended), so they are not over-allocated
+        compact.opcodes = array(
+            "B",
+            [
+                operator.type | operand_kind
+                for operator, (operand_kind, _) in zip(
+                    operators,
+                    encoded_operands,
+                    strict=True,
+                )
+            ],
+        )
+        compact.operands = array("q", [operand for _, operand in encoded_operands])
+        compact.jumps = array(
+            "q",
+            [
+                NO_JUMP
+                if operator.jumps_to_operator_idx is None
+                else operator.jumps_to_operator_idx
+                for operator in operators
+            ],
+        )
+        compact.tokens = [operator.token for operator in operators]
+        compact.expanded_from = [operator.expanded_from for operator in operators]
+        compact.optimizations = {
+            idx: OperatorOptimizations.from_operator(operator)
+            for idx, operator in enumerate(operators)
+            if operator.has_optimizations
+            or operator.syscall_optimization_omit_result
+            or operator.syscall_optimization_injected_args is not None
+            or operator.call_optimization_is_tail_call
+            or operator.infer_type_after_optimization is not None
+        }
+        return compact
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    def operator_type(self, idx: int) -> OperatorType:
+        return OperatorType(self.opcodes[idx] & OPCODE_TYPE_MASK)
+
+    def operand(self, idx: int) -> OperatorOperand:
+        return self._decode_operand(self.opcodes[idx], self.operands[idx])
+
+    def jumps_to_operator_idx(self, idx: int) -> int | None:
+        jump = self.jumps[idx]
+        return None if jump == NO_JUMP else jump
+
+    def to_operator(self, idx: int) -> Operator:
+        """Get operator (new object) at given index."""
+        optimizations = self.optimizations.get(idx)
+        operator = Operator(
+            type=self.operator_type(idx),
+            token=self.tokens[idx],
+            operand=self.operand(idx),
+            jumps_to_operator_idx=self.jumps_to_operator_idx(idx),
+            expanded_from=self.expanded_from[idx],
+        )
+        if optimizations is not None:
+            optimizations.apply_to(operator)
+        return operator
+
+    def to_operators(self) -> list[Operator]:
+        """Convert back into operators (new objects), which are same as operators it was converted from."""
+        operators = [
+            Operator(
+                type=OperatorType(opcode & OPCODE_TYPE_MASK),
+                token=token,
+                operand=self._decode_operand(opcode, operand),
+                jumps_to_operator_idx=None if jump == NO_JUMP else jump,
+                expanded_from=expanded_from,
+            )
+            for opcode, operand, jump, token, expanded_from in zip(
+                self.opcodes,
+                self.operands,
+                self.jumps,
+                self.tokens,
+                self.expanded_from,
+                strict=True,
+            )
+        ]
+        for idx, optimizations in self.optimizations.items():
+            optimizations.apply_to(operators[idx])
+        return operators
+
+    def _decode_operand(self, opcode: int, operand: int) -> OperatorOperand:
+        operand_kind = opcode & OPERAND_KIND_MASK
+        if operand_kind == OPERAND_KIND_INTEGER:
+            return operand
+        if operand_kind == OPERAND_KIND_INTERNED:
+            return self.operand_table.operands[operand]
+        if operand_kind == OPERAND_KIND_INTRINSIC:
+            return Intrinsic(operand)
+        return None
+
+    def _encode_operand(self, operand: OperatorOperand) -> tuple[int, int]:
+        """Get kind of given operand and its value within operands array."""
+        if operand is None:
+            return OPERAND_KIND_NONE, 0
+        if isinstance(operand, Intrinsic):
+            return OPERAND_KIND_INTRINSIC, int(operand)
+        if (
+            isinstance(operand, int)
+            and _INTEGER_OPERAND_MIN <= operand <= _INTEGER_OPERAND_MAX
+        ):
+            return OPERAND_KIND_INTEGER, operand
+        return OPERAND_KIND_INTERNED, self.operand_table.intern(operand)
+
+
+def compact_functions_source(
+    functions: Iterable[Function],
+) -> dict[str, CompactOperators]:
+    """Convert source of each given function into compact form (by function name), all of them share single operand table."""
+    operand_table = OperandTable()
+    return {
+        function.name: CompactOperators.from_operators(function.source, operand_table)
+        for function in functions
+    }
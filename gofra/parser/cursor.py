@@ -0,0 +1,62 @@
+"""Forward cursor over token stream for parser.
+
+Parser reads tokens one by one (with single token lookahead) and pushes tokens of included files and expanded macros
+in front of remaining stream, so stream is never copied (or reversed) as whole.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from gofra.lexer import Token
+
+
+class TokenCursor:
+    """Forward cursor over stack of token streams, topmost stream is read first and dropped once exhausted."""
+
+    __slots__ = ("_lookahead", "_streams", "tokens_consumed")
+
+    def __init__(self, tokens: Iterable[Token]) -> None:
+        self._streams: list[Iterator[Token]] = [iter(tokens)]
+        self._lookahead: Token | None = None
+
+        # Count of tokens consumed (including pushed ones), for statistics only
+        self.tokens_consumed = 0
+
+    def push(self, tokens: Iterable[Token]) -> None:
+        """Push given tokens in front of remaining ones, so they are read next."""
+        if self._lookahead is not None:
+            self._streams.append(iter((self._lookahead,)))
+            self._lookahead = None
+        self._streams.append(iter(tokens))
+
+    def peek(self) -> Token | None:
+        """Get next token without consuming it, or nothing if cursor is exhausted."""
+        if self._lookahead is None:
+            self._lookahead = self._read_next_token()
+        return self._lookahead
+
+    def pop(self) -> Token:
+        """Consume next token."""
+        token = self.peek()
+        if token is None:
+            msg = "pop from exhausted token cursor"
+            raise IndexError(msg)
+        self._lookahead = None
+        self.tokens_consumed += 1
+        return token
+
+    def is_exhausted(self) -> bool:
+        return self.peek() is None
+
+    def _read_next_token(self) -> Token | None:
+        streams = self._streams
+        while streams:
+            token = next(streams[-1], None)
+            if token is not None:
+                return token
+            streams.pop()
+        return None
@@ -4,11 +4,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from gofra.parser.cfg import ControlFlowGraph, build_control_flow_graph
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
     from gofra.lexer.tokens import TokenLocation
     from gofra.parser.operators import Operator
+    from gofra.typecheck.stack_depth import FunctionStackDepth
     from gofra.typecheck.types import GofraType
 
 
@@ -55,7 +58,7 @@ class Function:
     # If true `function call` rather than proceeding into `jumping` (`calling`) into that function
     # just inject (emit) body of the function inside call target location (expand body of the function from call)
     # affects code generator so it wont generate native function block and will not use jumps
-    # TODO(@kirillzhosul): Current implementation pollutes original definition source (expand whole operator/token sequence)
+    # Expansion emits copies of source operators (with relocated jumps), so original definition source is not polluted
     emit_inline_body: bool
 
     # If true, function must have empty body as it is located somewhere else and only available after assembler step
@@ -65,6 +68,13 @@ class Function:
 
     is_global_linker_symbol: bool = False
 
+    # Control-flow graph of source, built on first request and rebuilt after source is replaced or resized
+    # In-place mutation of operators requires explicit invalidation
+    _control_flow_graph: ControlFlowGraph | None = None
+
+    # Depth of data stack (per operator and maximal), only attached by stack depth analysis
+    stack_depth: FunctionStackDepth | None = None
+
     def __init__(  # noqa: PLR0913
         self,
         *,
@@ -107,6 +117,20 @@ class Function:
             msg = "Functions that not marked as `external` must have an body!"
             raise ValueError(msg)
 
+    def control_flow_graph(self) -> ControlFlowGraph:
+        """Get control-flow graph of function source (cached)."""
+        control_flow_graph = self._control_flow_graph
+        if control_flow_graph is None or not control_flow_graph.is_built_from(
+            self.source,
+        ):
+            control_flow_graph = build_control_flow_graph(self.source)
+            self._control_flow_graph = control_flow_graph
+        return control_flow_graph
+
+    def invalidate_control_flow_graph(self) -> None:
+        """Drop cached control-flow graph, must be called after operators of source are mutated in-place."""
+        self._control_flow_graph = None
+
     def has_executable_body(self) -> bool:
         return not self.emit_inline_body and not self.is_externally_defined
 
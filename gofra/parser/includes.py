@@ -0,0 +1,107 @@
+"""Include graph for resolving and tracking included files during parsing.
+
+Each requested include path is resolved against search directories with file lookups cached per compilation,
+and canonical (resolved) paths of included files are stored once, so checking for already included file is constant time.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter_ns
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+@dataclass(frozen=True, slots=True)
+class IncludeRecord:
+    """Single `include` occurrence within include graph."""
+
+    # File in which include occurred
+    included_from: Path
+
+    requested_path: Path
+    # Path of included file as found within search directories (tokens are loaded from it)
+    path: Path
+    # Canonical path of included file (absolute, with symlinks resolved)
+    resolved_path: Path
+
+    # Time spent on resolution of requested path into canonical one
+    resolution_time_ns: int
+
+    # Already included files are skipped (not included twice)
+    was_already_included: bool
+
+
+@dataclass(frozen=False)
+class IncludeGraph:
+    """Graph of included files acquired within single compilation."""
+
+    # Canonical paths of all files that was included (or being parsed as root)
+    included_paths: set[Path] = field(default_factory=lambda: set())
+    records: list[IncludeRecord] = field(default_factory=lambda: list())  # noqa: C408
+
+    # File lookups cache (search directory, requested path) -> is file exists
+    _lookups: dict[tuple[Path, Path], bool] = field(default_factory=lambda: dict())  # noqa: C408
+    # Cache of canonical paths, as resolving requires filesystem access
+    _canonical_paths: dict[Path, Path] = field(default_factory=lambda: dict())  # noqa: C408
+
+    def add_root(self, path: Path) -> None:
+        """Mark given file (which is not included but parsed directly) as included."""
+        self.included_paths.add(self._canonical_path(path))
+
+    def resolve(
+        self,
+        requested_path: Path,
+        search_directories: Iterable[Path],
+    ) -> Path | None:
+        """Find requested path directly or within search directories (in that order), if it is exists."""
+        for search_directory in (Path(), *search_directories):
+            lookup_key = (search_directory, requested_path)
+            exists = self._lookups.get(lookup_key)
+            if exists is None:
+                exists = self._lookups[lookup_key] = search_directory.joinpath(
+                    requested_path,
+                ).exists()
+            if exists:
+                return search_directory.joinpath(requested_path)
+        return None
+
+    def include(
+        self,
+        included_from: Path,
+        requested_path: Path,
+        search_directories: Iterable[Path],
+    ) -> IncludeRecord | None:
+        """Resolve requested include and record it within graph, or nothing if file does not exists.
+
+        Already included files are also recorded, so check `was_already_included` before including it.
+        """
+        resolution_started_at = perf_counter_ns()
+        include_path = self.resolve(requested_path, search_directories)
+        if include_path is None:
+            return None
+
+        resolved_path = self._canonical_path(include_path)
+        resolution_time_ns = perf_counter_ns() - resolution_started_at
+
+        was_already_included = resolved_path in self.included_paths
+        self.included_paths.add(resolved_path)
+        record = IncludeRecord(
+            included_from=included_from,
+            requested_path=requested_path,
+            path=include_path,
+            resolved_path=resolved_path,
+            resolution_time_ns=resolution_time_ns,
+            was_already_included=was_already_included,
+        )
+        self.records.append(record)
+        return record
+
+    def _canonical_path(self, path: Path) -> Path:
+        canonical_path = self._canonical_paths.get(path)
+        if canonical_path is None:
+            canonical_path = self._canonical_paths[path] = path.resolve()
+        return canonical_path
@@ -1,8 +1,11 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from gofra.lexer import Token
 from gofra.lexer.tokens import TokenLocation
 
+from .operators import Operator
+
 
 @dataclass(frozen=True)
 class Macro:
@@ -14,3 +17,13 @@ class Macro:
     def push_token(self, token: Token) -> Token:
         self.inner_tokens.append(token)
         return token
+
+
+@dataclass(frozen=True, slots=True)
+class MacroTemplate:
+    """Operators of macro body parsed once, copied on each usage of that macro.
+
+    Jumps of operators are relative to template beginning and relocated when template is expanded.
+    """
+
+    operators: Sequence[Operator]
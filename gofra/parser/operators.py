@@ -29,7 +29,7 @@ class OperatorType(IntEnum):
     FUNCTION_CALL = auto()
 
 
-@dataclass(frozen=False)
+@dataclass(frozen=False, slots=True)
 class Operator:
     type: OperatorType
     token: Token
@@ -37,15 +37,43 @@ class Operator:
 
     jumps_to_operator_idx: int | None = field(default=None)
 
+    # Token of usage (macro name or inline function call) this operator was expanded from
+    # Original token still points to definition (body) of that macro or function
+    expanded_from: Token | None = field(default=None)
+
+    # Syscall result is not pushed onto stack (dropped right after syscall)
     syscall_optimization_omit_result: bool = field(default=False)
+    # Constant syscall arguments loaded straight into registers, in order of popping from stack
+    # (syscall number first), not injected arguments (none) are still popped from stack
     syscall_optimization_injected_args: list[int | None] | None = None
 
+    # Call is last operator executed within caller (followed by return), so it is lowered into jump by codegen
+    call_optimization_is_tail_call: bool = field(default=False)
+
     has_optimizations: bool = field(default=False)
     infer_type_after_optimization: GofraType | None = field(default=None)
 
     def __repr__(self) -> str:
         return f"OP<{self.type.name}>"
 
+    def copy(self) -> Operator:
+        """Get copy of operator, cheaper than generic `dataclasses.replace`."""
+        injected_args = self.syscall_optimization_injected_args
+        return Operator(
+            type=self.type,
+            token=self.token,
+            operand=self.operand,
+            jumps_to_operator_idx=self.jumps_to_operator_idx,
+            expanded_from=self.expanded_from,
+            syscall_optimization_omit_result=self.syscall_optimization_omit_result,
+            syscall_optimization_injected_args=(
+                list(injected_args) if injected_args is not None else None
+            ),
+            call_optimization_is_tail_call=self.call_optimization_is_tail_call,
+            has_optimizations=self.has_optimizations,
+            infer_type_after_optimization=self.infer_type_after_optimization,
+        )
+
     def is_syscall(self) -> bool:
         return self.type == OperatorType.INTRINSIC and self.operand in (
             Intrinsic.SYSCALL0,
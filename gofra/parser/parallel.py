@@ -0,0 +1,317 @@
+"""Two-phase parsing where bodies of functions are parsed in parallel.
+
+First phase is an top-level pass which records every definition (macros, functions, memories)
+and defers bodies of (not inline) functions, declaring these functions only by their signature.
+Second phase parses deferred bodies within process pool, each body sees exactly same definitions
+that it would see within single-pass parsing (definitions made before that function, with their values at that moment).
+Results are merged back in definition order, so output is same as from single-pass parsing.
+When first phase fails, bodies deferred before failure are still parsed (and their errors raised first),
+so first reported error is same too.
+
+Count of processes is capped by count of CPUs available, without more than one of them pool only adds its overhead,
+so single-pass parsing is used instead.
+"""
+
+from __future__ import annotations
+
+import os
+from bisect import bisect_left
+from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from gofra.tracing import stop_tracing
+
+from .cursor import TokenCursor
+from .includes import IncludeGraph
+from .operators import Operator
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+    from pathlib import Path
+
+    from gofra.lexer import LEXER_ENGINE_T, Token
+    from gofra.typecheck.types import GofraType
+
+    from ._context import ParserContext
+    from .functions import Function
+    from .macros import Macro
+    from .operators import OperatorOperand, OperatorType
+
+# Each name has its definitions (in order) with their global definition index
+type DefinitionVersions[V] = dict[str, list[tuple[int, V]]]
+
+
+@dataclass(frozen=True, slots=True)
+class DeferredFunctionBody:
+    """Function which body is parsed within second phase."""
+
+    # Function declared by signature only, replaced with actual function after its body is parsed
+    declaration: Function
+    token: Token
+
+    type_contract_in: Sequence[GofraType]
+    type_contract_out: Sequence[GofraType]
+    is_global_linker_symbol: bool
+
+    body_tokens: Sequence[Token]
+
+    # Only definitions with index lower than that are visible within function body
+    visible_definitions: int
+
+
+@dataclass(frozen=False)
+class DeferredParsing:
+    """Definitions and deferred function bodies acquired within first (top-level) phase."""
+
+    macros: DefinitionVersions[Macro] = field(default_factory=lambda: dict())  # noqa: C408
+    functions: DefinitionVersions[Function] = field(default_factory=lambda: dict())  # noqa: C408
+    memories: DefinitionVersions[int] = field(default_factory=lambda: dict())  # noqa: C408
+    definitions_count: int = field(default=0)
+
+    function_bodies: list[DeferredFunctionBody] = field(default_factory=lambda: list())  # noqa: C408
+
+    def record_definition[V](
+        self,
+        definitions: DefinitionVersions[V],
+        name: str,
+        value: V,
+    ) -> None:
+        definitions.setdefault(name, []).append((self.definitions_count, value))
+        self.definitions_count += 1
+
+
+class DefinitionsSnapshot[V](MutableMapping[str, V]):
+    """Read-only view of definitions made before given definition index (with their values at that moment)."""
+
+    __slots__ = ("_definitions", "_visible_definitions")
+
+    def __init__(
+        self,
+        definitions: DefinitionVersions[V],
+        visible_definitions: int,
+    ) -> None:
+        self._definitions = definitions
+        self._visible_definitions = visible_definitions
+
+    def __getitem__(self, name: str) -> V:
+        versions = self._definitions[name]
+        # Latest definition that is made before visible definitions boundary
+        version_idx = bisect_left(
+            versions,
+            self._visible_definitions,
+            key=lambda version: version[0],
+        )
+        if version_idx == 0:
+            raise KeyError(name)
+        return versions[version_idx - 1][1]
+
+    def __iter__(self) -> Iterator[str]:
+        return (
+            name
+            for name, versions in self._definitions.items()
+            if versions[0][0] < self._visible_definitions
+        )
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __setitem__(self, name: str, value: V) -> None:
+        msg = f"Cannot define '{name}' within function body, definitions snapshot is read-only."
+        raise TypeError(msg)
+
+    def __delitem__(self, name: str) -> None:
+        msg = f"Cannot undefine '{name}' within function body, definitions snapshot is read-only."
+        raise TypeError(msg)
+
+
+@dataclass(frozen=True, slots=True)
+class _FunctionBodyParser:
+    """State of worker that parses deferred function bodies (same for all bodies)."""
+
+    parsing_from_path: Path
+    include_search_directories: Sequence[Path]
+    lexer_engine: LEXER_ENGINE_T
+    deferred_parsing: DeferredParsing
+
+    # Passed in as parser module depends on that module
+    parse_from_context_into_operators: Callable[[ParserContext], ParserContext]
+
+    include_graph: IncludeGraph = field(default_factory=IncludeGraph)
+
+    def parse(self, body_idx: int) -> list[_TransferredOperator]:
+        from ._context import ParserContext
+
+        body = self.deferred_parsing.function_bodies[body_idx]
+        context = ParserContext(
+            parsing_from_path=self.parsing_from_path,
+            is_top_level=False,
+            include_search_directories=self.include_search_directories,
+            lexer_engine=self.lexer_engine,
+            token_cache=None,
+            include_graph=self.include_graph,
+            tokens=TokenCursor(body.body_tokens),
+            macros=DefinitionsSnapshot(
+                self.deferred_parsing.macros,
+                body.visible_definitions,
+            ),
+            functions=DefinitionsSnapshot(
+                self.deferred_parsing.functions,
+                body.visible_definitions,
+            ),
+            memories=DefinitionsSnapshot(
+                self.deferred_parsing.memories,
+                body.visible_definitions,
+            ),
+        )
+        operators = self.parse_from_context_into_operators(context).operators
+
+        token_indices = _worker_token_indices(self.deferred_parsing)
+        return [
+            (
+                operator.type,
+                operator.operand,
+                operator.jumps_to_operator_idx,
+                token_indices[id(operator.token)],
+                token_indices[id(operator.expanded_from)]
+                if operator.expanded_from
+                else None,
+            )
+            for operator in operators
+        ]
+
+
+# Operators are transferred from worker as plain tuples (much cheaper to pickle than operators themselves)
+# Tokens are transferred as index within tokens table, as both processes has same tokens
+# Only fields that are set while parsing are transferred
+type _TransferredOperator = tuple[
+    OperatorType,
+    OperatorOperand,
+    int | None,
+    int,
+    int | None,
+]
+
+# Parser of current worker process, initialized once per worker
+_worker_function_body_parser: _FunctionBodyParser | None = None
+_worker_token_indices_table: dict[int, int] | None = None
+
+
+def parallel_jobs_count(requested_jobs: int) -> int:
+    """Get count of processes that may actually run in parallel, requested count capped by count of available CPUs."""
+    available_cpus = (
+        len(os.sched_getaffinity(0))
+        if hasattr(os, "sched_getaffinity")
+        else os.cpu_count() or 1
+    )
+    return max(1, min(requested_jobs, available_cpus))
+
+
+def parse_deferred_function_bodies(
+    context: ParserContext,
+    parse_from_context_into_operators: Callable[[ParserContext], ParserContext],
+    *,
+    jobs: int,
+) -> None:
+    """Parse deferred function bodies within process pool and merge resulting functions into context."""
+    deferred_parsing = context.deferred_parsing
+    assert deferred_parsing is not None
+
+    function_bodies = deferred_parsing.function_bodies
+    if not function_bodies:
+        return
+
+    function_body_parser = _FunctionBodyParser(
+        parsing_from_path=context.parsing_from_path,
+        include_search_directories=list(context.include_search_directories),
+        lexer_engine=context.lexer_engine,
+        deferred_parsing=deferred_parsing,
+        parse_from_context_into_operators=parse_from_context_into_operators,
+    )
+    tokens = _tokens_table(deferred_parsing)
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(function_bodies)),
+        initializer=_initialize_worker,
+        initargs=(function_body_parser,),
+    ) as executor:
+        sources = executor.map(
+            _parse_function_body_within_worker,
+            range(len(function_bodies)),
+            chunksize=max(1, len(function_bodies) // (jobs * 4)),
+        )
+        # Merged in definition order, function that was redefined later is superseded by its redefinition
+        for body, source in zip(function_bodies, sources, strict=True):
+            if context.functions.get(body.declaration.name) is not body.declaration:
+                continue
+            context.new_function(
+                from_token=body.token,
+                name=body.declaration.name,
+                type_contract_in=body.type_contract_in,
+                type_contract_out=body.type_contract_out,
+                emit_inline_body=False,
+                is_externally_defined=False,
+                is_global_linker_symbol=body.is_global_linker_symbol,
+                source=[
+                    Operator(
+                        type=operator_type,
+                        operand=operand,
+                        jumps_to_operator_idx=jumps_to_operator_idx,
+                        token=tokens[token_idx],
+                        expanded_from=tokens[expanded_from_idx]
+                        if expanded_from_idx is not None
+                        else None,
+                    )
+                    for (
+                        operator_type,
+                        operand,
+                        jumps_to_operator_idx,
+                        token_idx,
+                        expanded_from_idx,
+                    ) in source
+                ],
+            )
+
+
+def _tokens_table(deferred_parsing: DeferredParsing) -> list[Token]:
+    """Get every token that may be referenced by operators of function bodies.
+
+    Order is deterministic, so worker (with same state) acquires same table.
+    """
+    tokens: list[Token] = []
+    for body in deferred_parsing.function_bodies:
+        tokens.extend(body.body_tokens)
+    for versions in deferred_parsing.macros.values():
+        for _, macro in versions:
+            tokens.extend(macro.inner_tokens)
+    for versions in deferred_parsing.functions.values():
+        for _, function in versions:
+            for operator in function.source:
+                tokens.append(operator.token)
+                if operator.expanded_from:
+                    tokens.append(operator.expanded_from)
+    return tokens
+
+
+def _worker_token_indices(deferred_parsing: DeferredParsing) -> dict[int, int]:
+    """Get index within tokens table by token identity, table is built once per worker."""
+    global _worker_token_indices_table  # noqa: PLW0603
+    if _worker_token_indices_table is None:
+        _worker_token_indices_table = {
+            id(token): idx for idx, token in enumerate(_tokens_table(deferred_parsing))
+        }
+    return _worker_token_indices_table
+
+
+def _initialize_worker(function_body_parser: _FunctionBodyParser) -> None:
+    global _worker_function_body_parser, _worker_token_indices_table  # noqa: PLW0603
+    _worker_function_body_parser = function_body_parser
+    _worker_token_indices_table = None
+
+    # Forked worker inherits tracer of parent process, but its spans are never collected
+    stop_tracing()
+
+
+def _parse_function_body_within_worker(body_idx: int) -> list[_TransferredOperator]:
+    assert _worker_function_body_parser is not None
+    return _worker_function_body_parser.parse(body_idx)
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from collections import deque
 from difflib import get_close_matches
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from gofra.exceptions import GofraError
 from gofra.lexer import (
     Keyword,
     Token,
@@ -15,8 +15,10 @@ from gofra.lexer.keywords import KEYWORD_TO_NAME, WORD_TO_KEYWORD
 from gofra.parser.functions import Function
 from gofra.parser.functions.parser import consume_function_definition
 from gofra.parser.validator import validate_and_pop_entry_point
+from gofra.tracing import is_tracing, trace_span
 
 from ._context import ParserContext
+from .cursor import TokenCursor
 from .exceptions import (
     ParserEmptyIfBodyError,
     ParserEndAfterWhileError,
@@ -37,31 +39,78 @@ from .exceptions import (
     ParserUnfinishedWhileDoBlockError,
     ParserUnknownWordError,
 )
+from .includes import IncludeGraph
 from .intrinsics import WORD_TO_INTRINSIC
+from .macros import Macro, MacroTemplate
 from .operators import OperatorType
+from .parallel import (
+    DeferredFunctionBody,
+    DeferredParsing,
+    parallel_jobs_count,
+    parse_deferred_function_bodies,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
+
+    from gofra.lexer import LEXER_ENGINE_T
+    from gofra.lexer.cache import TokenCache
+    from gofra.typecheck.types import GofraType
+
+
+# Macros with these keywords are always expanded from tokens, as they cannot be parsed standalone
+MACRO_TEMPLATE_UNSAFE_KEYWORDS = (
+    Keyword.INCLUDE,
+    Keyword.INLINE,
+    Keyword.EXTERN,
+    Keyword.FUNCTION,
+    Keyword.GLOBAL,
+    Keyword.MEMORY,
+    Keyword.MACRO,
+    Keyword.FUNCTION_CALL,
+)
 
 
-def parse_file(
+def parse_file(  # noqa: PLR0913
     path: Path,
     include_search_directories: Iterable[Path],
+    *,
+    lexer_engine: LEXER_ENGINE_T = "scanner",
+    token_cache: TokenCache | None = None,
+    include_graph: IncludeGraph | None = None,
+    jobs: int = 1,
 ) -> tuple[ParserContext, Function]:
-    """Load file for parsing into operators (lex and then parse)."""
-    # Consider reversing at generator side or smth like that
-    tokens = deque(list(load_file_for_lexical_analysis(source_filepath=path))[::-1])
-    context = _parse_from_context_into_operators(
-        context=ParserContext(
-            is_top_level=True,
-            parsing_from_path=path,
-            tokens=tokens,
-            include_search_directories=include_search_directories,
-            macros={},
-            functions={},
-            memories={},
-        ),
+    """Load file for parsing into operators (tokens are lexed lazily while parsing).
+
+    Tokens of included files are loaded via given token cache (if any).
+    Included files are tracked within given include graph (or new one if not given).
+    If more than one job is given, bodies of functions are parsed in parallel by given count of processes
+    (capped by count of available CPUs, single-pass parsing is used when only one is available).
+    """
+    jobs = parallel_jobs_count(jobs)
+    context = ParserContext(
+        is_top_level=True,
+        parsing_from_path=path,
+        tokens=TokenCursor(_load_file_tokens(path, lexer_engine)),
+        include_search_directories=include_search_directories,
+        lexer_engine=lexer_engine,
+        token_cache=token_cache,
+        include_graph=include_graph or IncludeGraph(),
+        macros={},
+        functions={},
+        memories={},
+        deferred_parsing=DeferredParsing() if jobs > 1 else None,
     )
+    try:
+        _parse_from_context_into_operators(context)
+    except GofraError:
+        # Bodies deferred before failed top-level definition are parsed before it within single-pass parsing,
+        # so their errors are raised first
+        if context.deferred_parsing:
+            _parse_deferred_function_bodies(context, jobs=jobs)
+        raise
+    if context.deferred_parsing:
+        _parse_deferred_function_bodies(context, jobs=jobs)
 
     assert context.is_top_level
     assert not context.operators
@@ -70,6 +119,31 @@ def parse_file(
     return context, entry_point
 
 
+def _parse_deferred_function_bodies(context: ParserContext, *, jobs: int) -> None:
+    with trace_span(
+        "parse deferred function bodies",
+        category="parser",
+        args={"jobs": jobs},
+    ):
+        parse_deferred_function_bodies(
+            context,
+            _parse_from_context_into_operators,
+            jobs=jobs,
+        )
+
+
+def _load_file_tokens(path: Path, lexer_engine: LEXER_ENGINE_T) -> Iterable[Token]:
+    """Load tokens of file to be lexed lazily while parsing.
+
+    When tracing, file is lexed eagerly within its own span, otherwise lexing would be interleaved with parsing.
+    """
+    tokens = load_file_for_lexical_analysis(path, engine=lexer_engine)
+    if not is_tracing():
+        return tokens
+    with trace_span("lex", category="lexer", args={"file": str(path)}):
+        return list(tokens)
+
+
 def _parse_from_context_into_operators(context: ParserContext) -> ParserContext:
     """Consumes token stream into language operators."""
     while not context.tokens_exhausted():
@@ -174,7 +248,7 @@ def _unpack_memory_segment_from_token(context: ParserContext, token: Token) -> N
     assert isinstance(memory_segment_size.value, int)
 
     # This is an definition only so we dont acquire reference/pointer
-    context.memories[memory_segment_name.value] = memory_segment_size.value
+    context.new_memory(memory_segment_name.value, memory_segment_size.value)
 
 
 def _consume_macro_definition_into_token(context: ParserContext, token: Token) -> None:
@@ -326,15 +400,50 @@ def _unpack_function_definition_from_token(
             macro_name=function_name,
         )
 
+    if context.deferred_parsing and not modifier_is_inline:
+        _defer_function_body(
+            context,
+            token,
+            function_name,
+            type_contract_in=type_contract_in,
+            type_contract_out=type_contract_out,
+            is_global_linker_symbol=modifier_is_global,
+            body_tokens=function_body_tokens,
+        )
+        return
+
+    if not modifier_is_inline:
+        # Declared by signature only while its body is parsed, so function may call itself (recursion)
+        context.new_function(
+            from_token=token,
+            name=function_name,
+            type_contract_in=type_contract_in,
+            type_contract_out=type_contract_out,
+            emit_inline_body=False,
+            is_externally_defined=True,
+            is_global_linker_symbol=False,
+            source=[],
+        )
+
     new_context = ParserContext(
         parsing_from_path=context.parsing_from_path,
         is_top_level=False,
         include_search_directories=context.include_search_directories,
-        tokens=function_body_tokens[::-1],  # type: ignore  # noqa: PGH003
+        lexer_engine=context.lexer_engine,
+        token_cache=context.token_cache,
+        include_graph=context.include_graph,
+        tokens=TokenCursor(function_body_tokens),
         macros=context.macros,
         functions=context.functions,
         memories=context.memories,
+        macro_templates=context.macro_templates,
     )
+    with trace_span(
+        "parse function",
+        category="parser",
+        args={"function": function_name},
+    ):
+        source = _parse_from_context_into_operators(context=new_context).operators
     context.new_function(
         from_token=token,
         name=function_name,
@@ -343,7 +452,47 @@ def _unpack_function_definition_from_token(
         emit_inline_body=modifier_is_inline,
         is_externally_defined=modifier_is_extern,
         is_global_linker_symbol=modifier_is_global,
-        source=_parse_from_context_into_operators(context=new_context).operators,
+        source=source,
+    )
+
+
+def _defer_function_body(  # noqa: PLR0913
+    context: ParserContext,
+    token: Token,
+    function_name: str,
+    *,
+    type_contract_in: Sequence[GofraType],
+    type_contract_out: Sequence[GofraType],
+    is_global_linker_symbol: bool,
+    body_tokens: Sequence[Token],
+) -> None:
+    """Declare function by its signature only, its body will be parsed in second phase.
+
+    Until then it is declared as an external function, as that is enough to parse calls to that function.
+    """
+    assert context.deferred_parsing is not None
+    declaration = context.new_function(
+        from_token=token,
+        name=function_name,
+        type_contract_in=type_contract_in,
+        type_contract_out=type_contract_out,
+        emit_inline_body=False,
+        is_externally_defined=True,
+        is_global_linker_symbol=False,
+        source=[],
+    )
+    # Declaration itself is visible within function body, so function may call itself (recursion)
+    visible_definitions = context.deferred_parsing.definitions_count
+    context.deferred_parsing.function_bodies.append(
+        DeferredFunctionBody(
+            declaration=declaration,
+            token=token,
+            type_contract_in=type_contract_in,
+            type_contract_out=type_contract_out,
+            is_global_linker_symbol=is_global_linker_symbol,
+            body_tokens=body_tokens,
+            visible_definitions=visible_definitions,
+        ),
     )
 
 
@@ -363,35 +512,25 @@ def _unpack_include_from_token(context: ParserContext, token: Token) -> None:
     if requested_include_path.absolute() == context.parsing_from_path.absolute():
         raise ParserIncludeSelfFileMacroError
 
-    include_path = _resolve_real_import_path(requested_include_path, context)
+    include = context.include_graph.include(
+        included_from=token.location.filepath,
+        requested_path=requested_include_path,
+        search_directories=context.include_search_directories,
+    )
 
-    if include_path is None:
+    if include is None:
         raise ParserIncludeFileNotFoundError(
             include_token=token,
             include_path=requested_include_path,
         )
 
-    already_included_sources = (n.resolve() for n in context.included_source_paths)
-    if include_path.resolve() in already_included_sources:
+    if include.was_already_included:
         return
 
-    context.included_source_paths.add(include_path)
-    context.tokens.extend(reversed(list(load_file_for_lexical_analysis(include_path))))
-
-
-def _resolve_real_import_path(
-    requested_include_path: Path,
-    context: ParserContext,
-) -> Path | None:
-    if requested_include_path.exists():
-        return requested_include_path
-
-    for include_search_directory in context.include_search_directories:
-        load_from_path = include_search_directory.joinpath(requested_include_path)
-        if load_from_path.exists():
-            return load_from_path
-
-    return None
+    if context.token_cache:
+        context.tokens.push(context.token_cache.load_tokens(include.path))
+        return
+    context.tokens.push(_load_file_tokens(include.path, context.lexer_engine))
 
 
 def _consume_conditional_keyword_from_token(
@@ -501,11 +640,65 @@ def _try_unpack_macro_or_inline_function_from_token(
             not inline_block.emit_inline_body or inline_block.is_externally_defined
         ):
             raise NotImplementedError
-        context.expand_from_inline_block(inline_block)
+        if isinstance(inline_block, Macro) and not context.is_top_level:
+            template = _acquire_macro_template(context, inline_block)
+            if template is not None:
+                context.expand_operators(template.operators, expanded_from=token)
+                return True
+        context.expand_from_inline_block(inline_block, expanded_from=token)
 
     return bool(inline_block)
 
 
+def _acquire_macro_template(
+    context: ParserContext,
+    macro: Macro,
+) -> MacroTemplate | None:
+    """Get template of macro body, parsing it once on first usage."""
+    if macro.name not in context.macro_templates:
+        context.macro_templates[macro.name] = _parse_macro_template(context, macro)
+    return context.macro_templates[macro.name]
+
+
+def _parse_macro_template(context: ParserContext, macro: Macro) -> MacroTemplate | None:
+    """Parse macro body standalone into template operators.
+
+    Macro has no template (and is expanded from its tokens) if its body cannot be parsed standalone:
+    it has definitions or function calls, or its blocks are finished outside (e.g `while` without `do`).
+    """
+    for token in macro.inner_tokens:
+        if (
+            token.type == TokenType.KEYWORD
+            and token.value in MACRO_TEMPLATE_UNSAFE_KEYWORDS
+        ):
+            return None
+        if token.type == TokenType.WORD and token.text in context.functions:
+            return None
+
+    if not macro.inner_tokens:
+        return MacroTemplate(operators=[])
+
+    template_context = ParserContext(
+        parsing_from_path=context.parsing_from_path,
+        is_top_level=False,
+        include_search_directories=context.include_search_directories,
+        lexer_engine=context.lexer_engine,
+        token_cache=context.token_cache,
+        include_graph=context.include_graph,
+        tokens=TokenCursor(macro.inner_tokens),
+        macros=context.macros,
+        functions=context.functions,
+        memories=context.memories,
+        macro_templates=context.macro_templates,
+    )
+    try:
+        _parse_from_context_into_operators(context=template_context)
+    except GofraError:
+        # Erroneous macros are expanded from tokens, so error is raised at actual usage
+        return None
+    return MacroTemplate(operators=template_context.operators)
+
+
 def _push_string_operator(context: ParserContext, token: Token) -> None:
     assert isinstance(token.value, str)
     context.push_new_operator(
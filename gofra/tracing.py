@@ -0,0 +1,93 @@
+"""Tracing of compiler internals into Chrome trace-event format.
+
+Spans (lexing of each file, parsing and typechecking of each function, optimizer strategies, etc.)
+are recorded as complete events and may be viewed within `chrome://tracing` or Perfetto.
+
+Tracing is disabled by default, in that case span is an shared no-op context so overhead is negligible.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from time import perf_counter_ns
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Mapping
+    from contextlib import AbstractContextManager
+    from pathlib import Path
+
+
+@dataclass(frozen=False)
+class Tracer:
+    """Recorder of trace events within single process."""
+
+    # Timestamps of events are relative to that moment
+    started_at_ns: int = field(default_factory=perf_counter_ns)
+    events: list[dict[str, object]] = field(default_factory=lambda: list())  # noqa: C408
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        category: str,
+        args: Mapping[str, object] | None,
+    ) -> Generator[None]:
+        span_started_at_ns = perf_counter_ns()
+        try:
+            yield
+        finally:
+            span_ended_at_ns = perf_counter_ns()
+            self.events.append(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": (span_started_at_ns - self.started_at_ns) / 1_000,
+                    "dur": (span_ended_at_ns - span_started_at_ns) / 1_000,
+                    "pid": os.getpid(),
+                    "tid": 0,
+                    "args": dict(args or {}),
+                },
+            )
+
+    def write(self, path: Path) -> None:
+        """Store recorded events as trace file (JSON object format)."""
+        with path.open("w") as fd:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, fd)
+            fd.write("\n")
+
+
+# Tracer of current process, tracing is disabled if there is none
+_tracer: Tracer | None = None
+_NO_SPAN = nullcontext()
+
+
+def start_tracing() -> Tracer:
+    """Enable tracing within current process, spans are recorded into resulting tracer."""
+    global _tracer  # noqa: PLW0603
+    _tracer = Tracer()
+    return _tracer
+
+
+def stop_tracing() -> None:
+    global _tracer  # noqa: PLW0603
+    _tracer = None
+
+
+def is_tracing() -> bool:
+    return _tracer is not None
+
+
+def trace_span(
+    name: str,
+    category: str,
+    args: Mapping[str, object] | None = None,
+) -> AbstractContextManager[None]:
+    """Record given span while within context, if tracing is enabled."""
+    if _tracer is None:
+        return _NO_SPAN
+    return _tracer.span(name, category, args)
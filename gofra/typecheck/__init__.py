@@ -3,6 +3,13 @@
 Provides validation for type system and resulting behavior
 """
 
+from .cache import TypecheckCache
+from .stack_depth import FunctionStackDepth, analyze_stack_depth
 from .typechecker import validate_type_safety
 
-__all__ = ["validate_type_safety"]
+__all__ = [
+    "FunctionStackDepth",
+    "TypecheckCache",
+    "analyze_stack_depth",
+    "validate_type_safety",
+]
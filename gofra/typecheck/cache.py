@@ -0,0 +1,138 @@
+"""Persistent (on-disk) cache of successfully typechecked functions.
+
+Same program is compiled many times while only few functions are changed between compilations,
+so functions that was already typechecked (and not changed since) are not typechecked again.
+
+Function is identified by hash of its operators, its type contract and type contracts of functions it calls
+(as that is everything typechecking of function depends on), so changed function (or its callee contract) is always checked.
+Hashes of functions that are passed typecheck are stored per program inside build cache directory.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+from dataclasses import dataclass, field
+from hashlib import sha256
+from typing import TYPE_CHECKING
+
+from gofra.consts import GOFRA_VERSION
+from gofra.parser.intrinsics import Intrinsic
+from gofra.parser.operators import OperatorType
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+    from gofra.parser.functions.function import Function
+
+# Bump on any change of hash layout or typechecker semantics
+TYPECHECK_CACHE_FORMAT_VERSION = 1
+CACHE_ENTRY_SUFFIX = ".typechecked"
+
+FUNCTION_HASH_SIZE = sha256().digest_size
+
+
+@dataclass(frozen=False)
+class TypecheckCache:
+    """Cache of typechecked functions of single program (stored inside given directory), tracks skip statistics."""
+
+    directory: Path
+    # Source file of program, each program has its own entry
+    program_path: Path
+
+    # Functions that was not typechecked as they are already typechecked before
+    skipped: int = field(default=0)
+    checked: int = field(default=0)
+
+    _previously_typechecked: set[bytes] | None = field(default=None)
+    _typechecked: set[bytes] = field(default_factory=lambda: set())
+
+    def function_hash(
+        self,
+        function: Function,
+        global_functions: Mapping[str, Function],
+    ) -> bytes:
+        """Get hash of everything typechecking of given function depends on."""
+        source = function.source
+        # Operators are hashed as columns (not as tuple per operator), which is much faster to build and serialize
+        operator_types = [int(operator.type) for operator in source]
+        operands = [
+            int(operator.operand)
+            if isinstance(operator.operand, Intrinsic)
+            else operator.operand
+            for operator in source
+        ]
+        jumps = [operator.jumps_to_operator_idx for operator in source]
+
+        callees = {
+            str(operand)
+            for operator_type, operand in zip(operator_types, operands, strict=True)
+            if operator_type == OperatorType.FUNCTION_CALL
+        }
+        callee_contracts = []
+        for callee_name in sorted(callees):
+            callee = global_functions.get(callee_name)
+            callee_contracts.append(
+                (
+                    callee_name,
+                    [int(t) for t in callee.type_contract_in] if callee else None,
+                    [int(t) for t in callee.type_contract_out] if callee else None,
+                ),
+            )
+
+        payload = (
+            GOFRA_VERSION,
+            TYPECHECK_CACHE_FORMAT_VERSION,
+            [int(t) for t in function.type_contract_in],
+            [int(t) for t in function.type_contract_out],
+            callee_contracts,
+            operator_types,
+            operands,
+            jumps,
+        )
+        return sha256(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)).digest()
+
+    def is_typechecked(self, function_hash: bytes) -> bool:
+        """Check is function with given hash was typechecked before, if so it is skipped."""
+        if self._previously_typechecked is None:
+            self._previously_typechecked = _read_cache_entry(self._entry_path())
+        if function_hash not in self._previously_typechecked:
+            return False
+        self._typechecked.add(function_hash)
+        self.skipped += 1
+        return True
+
+    def record_typechecked(self, function_hash: bytes) -> None:
+        self._typechecked.add(function_hash)
+        self.checked += 1
+
+    def save(self) -> None:
+        """Store functions that are typechecked within that compilation (previous ones are dropped)."""
+        _write_cache_entry(self._entry_path(), self._typechecked)
+
+    def _entry_path(self) -> Path:
+        program_key = sha256(str(self.program_path.resolve()).encode()).hexdigest()
+        return self.directory / (program_key + CACHE_ENTRY_SUFFIX)
+
+
+def _read_cache_entry(entry_path: Path) -> set[bytes]:
+    """Load function hashes from cache entry, or nothing if entry is missing or broken."""
+    try:
+        entry = entry_path.read_bytes()
+    except OSError:
+        return set()
+    if len(entry) % FUNCTION_HASH_SIZE:
+        return set()
+    return {
+        entry[offset : offset + FUNCTION_HASH_SIZE]
+        for offset in range(0, len(entry), FUNCTION_HASH_SIZE)
+    }
+
+
+def _write_cache_entry(entry_path: Path, function_hashes: set[bytes]) -> None:
+    """Store function hashes into cache entry (atomically, so concurrent compilations never read partial entry)."""
+    entry_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_entry_path = entry_path.with_suffix(f".{os.getpid()}.partial")
+    partial_entry_path.write_bytes(b"".join(sorted(function_hashes)))
+    partial_entry_path.replace(entry_path)
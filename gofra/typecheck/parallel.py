@@ -0,0 +1,163 @@
+"""Typechecking of functions within process pool.
+
+Type safety of each function is validated independently (only type contracts of other functions are used),
+so functions are split into contiguous chunks which are typechecked by workers.
+Workers only report index of first function that is failed to typecheck, that function is typechecked again
+within main process to raise same error as single-process typechecking (errors are reported in same order).
+
+Worker state is sent once per worker (as pool initializer argument): forked worker inherits it without serialization,
+while under `spawn` / `forkserver` start methods it is pickled for each worker.
+That state holds only functions that are typechecked (with their bodies) and table of callee type contracts
+(name to its location and type contracts), as callees are only checked against their contracts,
+so bodies of other functions are never sent to workers.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from gofra.exceptions import GofraError
+from gofra.parser.functions.function import Function
+from gofra.tracing import stop_tracing
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, MutableMapping, Sequence
+
+    from gofra.lexer.tokens import TokenLocation
+    from gofra.parser.functions.function import FunctionTypeContract
+
+# Callee by its name, with location and type contracts (`in`, `out`)
+type _CalleeTypeContracts = dict[
+    str,
+    tuple[TokenLocation, FunctionTypeContract, FunctionTypeContract],
+]
+
+
+@dataclass(frozen=True, slots=True)
+class _FunctionsTypechecker:
+    """State of worker that typechecks functions (same for all chunks)."""
+
+    functions: Sequence[Function]
+    callee_type_contracts: _CalleeTypeContracts
+
+    # Passed in as typechecker module depends on that module
+    validate_function_type_safety: Callable[
+        [Function, MutableMapping[str, Function]],
+        None,
+    ]
+
+    def find_first_ill_typed_function(
+        self,
+        chunk: range,
+        global_functions: MutableMapping[str, Function],
+    ) -> int | None:
+        function_idx = chunk.start
+        try:
+            for function_idx in chunk:
+                self.validate_function_type_safety(
+                    self.functions[function_idx],
+                    global_functions,
+                )
+        except GofraError:
+            return function_idx
+        return None
+
+
+# Typechecker of current worker process with callees rebuilt from their type contracts, initialized once per worker
+_worker_functions_typechecker: _FunctionsTypechecker | None = None
+_worker_global_functions: dict[str, Function] | None = None
+
+
+def find_first_ill_typed_function(
+    functions: Sequence[Function],
+    global_functions: MutableMapping[str, Function],
+    validate_function_type_safety: Callable[
+        [Function, MutableMapping[str, Function]],
+        None,
+    ],
+    *,
+    jobs: int,
+) -> int | None:
+    """Typecheck given functions within process pool, get index of first function that is failed to typecheck (if any).
+
+    Functions are passed to each worker once, with only type contracts of global functions (not their bodies).
+    """
+    if not functions:
+        return None
+
+    chunk_size = max(1, len(functions) // (jobs * 4))
+    chunks = [
+        range(chunk_start, min(chunk_start + chunk_size, len(functions)))
+        for chunk_start in range(0, len(functions), chunk_size)
+    ]
+    functions_typechecker = _FunctionsTypechecker(
+        functions=functions,
+        callee_type_contracts=_callee_type_contracts(global_functions),
+        validate_function_type_safety=validate_function_type_safety,
+    )
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(chunks)),
+        initializer=_initialize_worker,
+        initargs=(functions_typechecker,),
+    ) as executor:
+        # Chunks are in order of functions, so first failed chunk contains first failed function
+        for failed_function_idx in executor.map(
+            _find_first_ill_typed_function_within_worker,
+            chunks,
+        ):
+            if failed_function_idx is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+                return failed_function_idx
+    return None
+
+
+def _callee_type_contracts(
+    global_functions: Mapping[str, Function],
+) -> _CalleeTypeContracts:
+    """Get location and type contracts of each global function by its name."""
+    return {
+        name: (function.location, function.type_contract_in, function.type_contract_out)
+        for name, function in global_functions.items()
+    }
+
+
+def _callee_from_type_contracts(
+    name: str,
+    location: TokenLocation,
+    type_contract_in: FunctionTypeContract,
+    type_contract_out: FunctionTypeContract,
+) -> Function:
+    """Get callee that stands in for global function within worker (only its type contracts are ever read)."""
+    return Function(
+        location=location,
+        name=name,
+        source=[],
+        type_contract_in=type_contract_in,
+        type_contract_out=type_contract_out,
+        emit_inline_body=False,
+        is_externally_defined=True,
+        is_global_linker_symbol=False,
+    )
+
+
+def _initialize_worker(functions_typechecker: _FunctionsTypechecker) -> None:
+    global _worker_functions_typechecker, _worker_global_functions  # noqa: PLW0603
+    _worker_functions_typechecker = functions_typechecker
+    _worker_global_functions = {
+        name: _callee_from_type_contracts(name, *type_contracts)
+        for name, type_contracts in functions_typechecker.callee_type_contracts.items()
+    }
+
+    # Forked worker inherits tracer of parent process, but its spans are never collected
+    stop_tracing()
+
+
+def _find_first_ill_typed_function_within_worker(chunk: range) -> int | None:
+    assert _worker_functions_typechecker is not None
+    assert _worker_global_functions is not None
+    return _worker_functions_typechecker.find_first_ill_typed_function(
+        chunk,
+        _worker_global_functions,
+    )
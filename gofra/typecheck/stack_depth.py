@@ -0,0 +1,159 @@
+"""Static analysis of data stack depth.
+
+Typechecker emulates exact type stack of each function, so depth of stack is known before each operator.
+Depth is counted in stack cells (one cell per stack element) and includes arguments of the function itself.
+
+Depth including called functions is computed over call graph:
+callee is entered with depth at call site (without callee arguments) and uses its own maximal depth from there.
+Recursive functions has no static bound of stack depth.
+Calls to external functions are not counted, as they are not using data stack.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from gofra.parser.operators import OperatorType
+
+from .typechecker import emulate_type_stack_for_operators
+
+if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
+    from gofra.parser.functions.function import Function
+
+
+@dataclass(frozen=True, slots=True)
+class FunctionStackDepth:
+    """Depth of data stack within single function."""
+
+    # Depth of stack before each operator (by operator index), operators that are never reached has none
+    operators_stack_depth: list[int | None]
+
+    # Maximal depth within function itself
+    max_stack_depth: int
+
+    # Maximal depth including every (transitively) called function, none if function may recurse
+    max_stack_depth_with_calls: int | None
+
+
+def analyze_stack_depth(
+    functions: MutableMapping[str, Function],
+) -> dict[str, FunctionStackDepth]:
+    """Compute stack depth of each given function (by function name) and attach it to function.
+
+    Functions are expected to be type safe (typechecked before).
+    """
+    operators_stack_depths = {
+        name: _emulate_operators_stack_depth(function, functions)
+        for name, function in functions.items()
+        if not function.is_externally_defined
+    }
+
+    stack_depths: dict[str, FunctionStackDepth] = {}
+    max_stack_depths_with_calls = _max_stack_depths_with_calls(
+        operators_stack_depths,
+        functions,
+    )
+    for name, emulated_stack_depth in operators_stack_depths.items():
+        operators_stack_depth, max_stack_depth = emulated_stack_depth
+        stack_depth = FunctionStackDepth(
+            operators_stack_depth=operators_stack_depth,
+            max_stack_depth=max_stack_depth,
+            max_stack_depth_with_calls=max_stack_depths_with_calls[name],
+        )
+        functions[name].stack_depth = stack_depth
+        stack_depths[name] = stack_depth
+    return stack_depths
+
+
+def _emulate_operators_stack_depth(
+    function: Function,
+    global_functions: MutableMapping[str, Function],
+) -> tuple[list[int | None], int]:
+    """Get depth of stack before each operator and maximal depth within function."""
+    operators_stack_depth: list[int | None] = [None] * len(function.source)
+    resulting_type_stack = emulate_type_stack_for_operators(
+        operators=function.source,
+        global_functions=global_functions,
+        initial_type_stack=list(function.type_contract_in),
+        current_function=function,
+        operators_stack_depth=operators_stack_depth,
+    )
+    # Blocks are not modifying stack, so depth after each operator is depth before next one (or resulting stack)
+    max_stack_depth = max(
+        (depth for depth in operators_stack_depth if depth is not None),
+        default=0,
+    )
+    return operators_stack_depth, max(
+        max_stack_depth,
+        len(function.type_contract_in),
+        len(resulting_type_stack),
+    )
+
+
+def _max_stack_depths_with_calls(
+    operators_stack_depths: dict[str, tuple[list[int | None], int]],
+    functions: MutableMapping[str, Function],
+) -> dict[str, int | None]:
+    """Get maximal depth including called functions, traversing call graph without recursion."""
+    max_stack_depths_with_calls: dict[str, int | None] = {}
+
+    def calls_of(name: str) -> list[tuple[str, int]]:
+        """Get called (not external) functions with depth of stack at call site (without callee arguments)."""
+        operators_stack_depth, _ = operators_stack_depths[name]
+        calls: list[tuple[str, int]] = []
+        for operator, depth in zip(
+            functions[name].source,
+            operators_stack_depth,
+            strict=True,
+        ):
+            if operator.type != OperatorType.FUNCTION_CALL or depth is None:
+                continue
+            assert isinstance(operator.operand, str)
+            callee = functions[operator.operand]
+            if callee.is_externally_defined:
+                continue
+            calls.append((callee.name, depth - len(callee.type_contract_in)))
+        return calls
+
+    for root_name in operators_stack_depths:
+        if root_name in max_stack_depths_with_calls:
+            continue
+        # Depth-first traversal, function is resolved after all of its callees
+        on_path: set[str] = {root_name}
+        stack = [(root_name, calls_of(root_name), 0)]
+        while stack:
+            name, calls, call_idx = stack[-1]
+            if call_idx < len(calls):
+                stack[-1] = (name, calls, call_idx + 1)
+                callee_name, _ = calls[call_idx]
+                if callee_name in on_path:
+                    # Recursion, every function within cycle (and every function that calls into it) has no bound
+                    for cycle_name, _, _ in stack:
+                        max_stack_depths_with_calls[cycle_name] = None
+                elif callee_name not in max_stack_depths_with_calls:
+                    on_path.add(callee_name)
+                    stack.append((callee_name, calls_of(callee_name), 0))
+                continue
+
+            stack.pop()
+            on_path.discard(name)
+            _, max_stack_depth = operators_stack_depths[name]
+            if name in max_stack_depths_with_calls:
+                # Already known to be unbounded (within cycle)
+                continue
+            max_stack_depth_with_calls: int | None = max_stack_depth
+            for callee_name, call_site_depth in calls:
+                callee_max_stack_depth = max_stack_depths_with_calls[callee_name]
+                if callee_max_stack_depth is None:
+                    # Calls function that may recurse
+                    max_stack_depth_with_calls = None
+                    break
+                max_stack_depth_with_calls = max(
+                    max_stack_depth_with_calls,
+                    call_site_depth + callee_max_stack_depth,
+                )
+            max_stack_depths_with_calls[name] = max_stack_depth_with_calls
+    return max_stack_depths_with_calls
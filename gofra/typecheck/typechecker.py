@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, assert_never
 
 from gofra.parser import Operator, OperatorType
 from gofra.parser.intrinsics import Intrinsic
+from gofra.parser.parallel import parallel_jobs_count
+from gofra.tracing import trace_span
 
 from ._context import TypecheckContext
 from .exceptions import (
@@ -12,6 +15,7 @@ from .exceptions import (
     TypecheckInvalidBinaryMathArithmeticsError,
     TypecheckInvalidPointerArithmeticsError,
 )
+from .parallel import find_first_ill_typed_function
 from .types import GofraType as T
 
 if TYPE_CHECKING:
@@ -19,16 +23,71 @@ if TYPE_CHECKING:
 
     from gofra.parser.functions.function import Function
 
+    from .cache import TypecheckCache
 
-def validate_type_safety(functions: MutableMapping[str, Function]) -> None:
-    """Validate type safety of an program by type checking all given functions."""
-    for function in functions.values():
-        if function.is_externally_defined:
-            continue
-        validate_function_type_safety(
-            function=function,
-            global_functions=functions,
-        )
+
+def validate_type_safety(
+    functions: MutableMapping[str, Function],
+    *,
+    cache: TypecheckCache | None = None,
+    jobs: int = 1,
+) -> None:
+    """Validate type safety of an program by type checking all given functions.
+
+    If cache is given, functions that are typechecked within previous compilations (and not changed since) are skipped.
+    If more than one job is given, functions are typechecked within process pool (first error is same as without it),
+    count of processes is capped by count of available CPUs (typechecked within single process when only one is available).
+    """
+    jobs = parallel_jobs_count(jobs)
+    try:
+        pending_functions: list[tuple[Function, bytes | None]] = []
+        for function in functions.values():
+            if function.is_externally_defined:
+                continue
+
+            function_hash = cache.function_hash(function, functions) if cache else None
+            if cache and function_hash and cache.is_typechecked(function_hash):
+                continue
+            pending_functions.append((function, function_hash))
+
+        # Functions before that one are already typechecked within process pool
+        typechecked_functions_count = 0
+        if jobs > 1:
+            with trace_span(
+                "typecheck functions in parallel",
+                category="typecheck",
+                args={"jobs": jobs, "functions": len(pending_functions)},
+            ):
+                failed_function_idx = find_first_ill_typed_function(
+                    [function for function, _ in pending_functions],
+                    global_functions=functions,
+                    validate_function_type_safety=validate_function_type_safety,
+                    jobs=jobs,
+                )
+            typechecked_functions_count = (
+                len(pending_functions)
+                if failed_function_idx is None
+                else failed_function_idx
+            )
+
+        for function_idx, (function, function_hash) in enumerate(pending_functions):
+            if function_idx >= typechecked_functions_count:
+                with trace_span(
+                    "typecheck function",
+                    category="typecheck",
+                    args={"function": function.name},
+                ):
+                    validate_function_type_safety(
+                        function=function,
+                        global_functions=functions,
+                    )
+
+            if cache and function_hash:
+                cache.record_typechecked(function_hash)
+    finally:
+        # Functions typechecked before failure are not typechecked again
+        if cache:
+            cache.save()
 
 
 def validate_function_type_safety(
@@ -54,16 +113,26 @@ def emulate_type_stack_for_operators(
     global_functions: MutableMapping[str, Function],
     initial_type_stack: Sequence[T],
     current_function: Function,
-    blocks_idx_shift: int = 0,
+    operators_stack_depth: MutableSequence[int | None] | None = None,
 ) -> MutableSequence[T]:
     """Emulate and return resulting type stack from given operators.
 
     Functions are provided so calling it will dereference new emulation type stack.
+    Operators are emulated within single forward pass, blocks (`if`, `do`) are tracked with explicit stack,
+    so nesting depth is not limited by recursion and operators are never copied.
+    If operators stack depth is given (same size as operators), depth of stack before each emulated operator is stored in it.
     """
     context = TypecheckContext(emulated_stack_types=list(initial_type_stack))
+    blocks: list[_TypecheckBlock] = []
 
     idx_max, idx = len(operators), 0
     while idx < idx_max:
+        if blocks and blocks[-1].end_idx == idx:
+            # Reached end of block body, rest is emulated with stack from before block
+            _close_typecheck_block(context, blocks.pop(), operators)
+
+        if operators_stack_depth is not None:
+            operators_stack_depth[idx] = len(context.emulated_stack_types)
         operator, idx = operators[idx], idx + 1
         match operator.type:
             case OperatorType.WHILE | OperatorType.END:
@@ -71,40 +140,36 @@ def emulate_type_stack_for_operators(
             case OperatorType.DO | OperatorType.IF:
                 context.raise_for_arguments(operator, current_function, T.BOOLEAN)
 
-                # Acquire where this block jumps, shift due to emulation layers
+                # Acquire where this block jumps
                 assert operator.jumps_to_operator_idx
-                jumps_to_idx = operator.jumps_to_operator_idx - blocks_idx_shift
+                jumps_to_idx = operator.jumps_to_operator_idx
 
                 assert operators[jumps_to_idx].type == OperatorType.END
 
-                type_stack = emulate_type_stack_for_operators(
-                    operators=operators[idx:jumps_to_idx],
-                    global_functions=global_functions,
-                    initial_type_stack=context.emulated_stack_types[::],
-                    blocks_idx_shift=blocks_idx_shift + idx,
-                    current_function=current_function,
-                )
-
-                if type_stack != context.emulated_stack_types:
-                    raise TypecheckBlockStackMismatchError(
+                # Body of block is emulated with copy of stack, as block should not modify it
+                blocks.append(
+                    _TypecheckBlock(
                         operator_begin=operator,
-                        operator_end=operators[jumps_to_idx],
+                        end_idx=jumps_to_idx,
                         stack_before_block=context.emulated_stack_types,
-                        stack_after_block=type_stack,
-                    )
-
-                # Skip this part as we typecheck below and acquire type stack
-                idx = jumps_to_idx
+                    ),
+                )
+                context.emulated_stack_types = context.emulated_stack_types[::]
             case OperatorType.PUSH_STRING:
                 context.push_types(T.POINTER, T.INTEGER)
             case OperatorType.PUSH_MEMORY_POINTER:
                 context.push_types(T.POINTER)
             case OperatorType.PUSH_INTEGER:
-                assert not operator.has_optimizations, "TBD"
-                assert not operator.infer_type_after_optimization, "TBD"
-                context.push_types(T.INTEGER)
+                # Constants folded from comparisons are booleans
+                context.push_types(operator.infer_type_after_optimization or T.INTEGER)
             case OperatorType.FUNCTION_RETURN:
-                return context.emulated_stack_types
+                if not blocks:
+                    return context.emulated_stack_types
+
+                # Return finishes emulation of block body, rest is emulated after that block
+                block = blocks.pop()
+                _close_typecheck_block(context, block, operators)
+                idx = block.end_idx
             case OperatorType.FUNCTION_CALL:
                 assert isinstance(operator.operand, str)
 
@@ -233,17 +298,22 @@ def emulate_type_stack_for_operators(
                         | Intrinsic.SYSCALL5
                         | Intrinsic.SYSCALL6
                     ):
-                        assert not operator.syscall_optimization_injected_args
-                        assert not operator.syscall_optimization_omit_result
-                        args_count = operator.get_syscall_arguments_count()
-
-                        argument_types = (T.ANY for _ in range(args_count))
-                        context.raise_for_arguments(
-                            operator,
-                            current_function,
-                            *argument_types,
+                        # Injected arguments are not taken from stack
+                        injected_args = operator.syscall_optimization_injected_args
+                        args_count = operator.get_syscall_arguments_count() - sum(
+                            injected_arg is not None
+                            for injected_arg in injected_args or ()
                         )
-                        context.push_types(T.INTEGER)
+
+                        if args_count:
+                            argument_types = (T.ANY for _ in range(args_count))
+                            context.raise_for_arguments(
+                                operator,
+                                current_function,
+                                *argument_types,
+                            )
+                        if not operator.syscall_optimization_omit_result:
+                            context.push_types(T.INTEGER)
                     case Intrinsic.SWAP:
                         context.raise_for_enough_arguments(
                             operator,
@@ -260,4 +330,31 @@ def emulate_type_stack_for_operators(
             case _:
                 assert_never(operator.type)
 
+    assert not blocks, "Blocks must be finished with `end` within operators"
     return context.emulated_stack_types
+
+
+@dataclass(frozen=True, slots=True)
+class _TypecheckBlock:
+    """Block (`if`, `do`) which body is being emulated."""
+
+    operator_begin: Operator
+    # Index of `end` operator, body of block is right before it
+    end_idx: int
+    stack_before_block: MutableSequence[T]
+
+
+def _close_typecheck_block(
+    context: TypecheckContext,
+    block: _TypecheckBlock,
+    operators: Sequence[Operator],
+) -> None:
+    """Validate that block body did not modify stack and restore stack from before block."""
+    if context.emulated_stack_types != block.stack_before_block:
+        raise TypecheckBlockStackMismatchError(
+            operator_begin=block.operator_begin,
+            operator_end=operators[block.end_idx],
+            stack_before_block=block.stack_before_block,
+            stack_after_block=context.emulated_stack_types,
+        )
+    context.emulated_stack_types = block.stack_before_block
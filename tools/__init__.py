@@ -0,0 +1 @@
+"""Development checks of compiler that are not part of it (run as `python -m tools.<name>` from repository root)."""
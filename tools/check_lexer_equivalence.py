@@ -0,0 +1,72 @@
+"""Check that both lexer engines (`scanner` and `lines`) produce same token stream for each source file.
+
+Usage: `python -m tools.check_lexer_equivalence [directory or file ...]` (`lib`, `examples` and `tests` by default).
+Files that fails to lex must fail with same error (type and message) within both engines.
+Exits with non-zero code if any file differs, reporting first different token of each such file.
+"""
+
+from __future__ import annotations
+
+import sys
+from itertools import zip_longest
+from pathlib import Path
+
+from gofra.exceptions import GofraError
+from gofra.lexer import LEXER_ENGINE_T, Token, load_file_for_lexical_analysis
+
+DEFAULT_DIRECTORIES = ("lib", "examples", "tests")
+
+
+def lex_file(path: Path, engine: LEXER_ENGINE_T) -> list[Token] | str:
+    """Get tokens of file lexed by given engine, or description of error that engine raised."""
+    try:
+        return list(load_file_for_lexical_analysis(path, engine=engine))
+    except GofraError as e:
+        return f"{type(e).__name__}: {e!r}"
+
+
+def first_difference(path: Path) -> str | None:
+    """Get description of first difference between engines for given file, or nothing if these are same."""
+    scanned = lex_file(path, engine="scanner")
+    lined = lex_file(path, engine="lines")
+    if isinstance(scanned, str) or isinstance(lined, str):
+        if scanned == lined:
+            return None
+        return f"scanner: {_describe(scanned)}\n  lines:   {_describe(lined)}"
+
+    for idx, (scanned_token, lined_token) in enumerate(
+        zip_longest(scanned, lined),
+    ):
+        if scanned_token != lined_token:
+            return f"token #{idx}\n  scanner: {scanned_token}\n  lines:   {lined_token}"
+    return None
+
+
+def _describe(result: list[Token] | str) -> str:
+    return result if isinstance(result, str) else f"{len(result)} tokens"
+
+
+def main(directories: list[str]) -> int:
+    """Compare engines over source files within given directories (or given files), get exit code."""
+    paths = sorted(
+        path
+        for directory in map(Path, directories or DEFAULT_DIRECTORIES)
+        for path in (directory.rglob("*.gof") if directory.is_dir() else [directory])
+    )
+    if not paths:
+        print("No source files found", file=sys.stderr)
+        return 1
+
+    different_count = 0
+    for path in paths:
+        difference = first_difference(path)
+        if difference is not None:
+            different_count += 1
+            print(f"{path}: {difference}")
+
+    print(f"{len(paths) - different_count}/{len(paths)} files lexed equally")
+    return 1 if different_count else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,105 @@
+"""Check that each repeatable optimization pass yields same IR when applied twice as when applied once.
+
+Usage: `python -m tools.check_pass_repetition [directory or file ...]` (`examples` and `tests` by default).
+Each program is optimized with `--passes=<pass>` and `--passes=<pass>,<pass>` for every pass that may be repeated,
+and IR of both is compared. Passes that are not repeatable must be rejected when requested twice.
+Exits with non-zero code if any IR differs (or repeated pass is not rejected).
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from gofra.cli.ir import emit_ir_into_stdout
+from gofra.consts import GOFRA_ENTRY_POINT
+from gofra.exceptions import GofraError
+from gofra.gofra import process_input_file
+from gofra.optimizer import optimize_program
+from gofra.optimizer.exceptions import OptimizerRepeatedPassError
+from gofra.optimizer.optimizer import OPTIMIZATION_PASSES
+from gofra.optimizer.pass_manager import resolve_optimization_passes
+from gofra.typecheck import validate_type_safety
+
+DEFAULT_DIRECTORIES = ("examples", "tests")
+
+
+def optimized_ir(path: Path, passes: list[str]) -> str:
+    """Get IR of program at given path optimized with given passes."""
+    program = process_input_file(path, [Path("./"), path.parent, Path("./lib")])
+    validate_type_safety(
+        functions={**program.functions, GOFRA_ENTRY_POINT: program.entry_point},
+    )
+    optimize_program(program, passes=passes)
+    with redirect_stdout(io.StringIO()) as ir:
+        emit_ir_into_stdout(program)
+    return ir.getvalue()
+
+
+def check_program(path: Path) -> list[str]:
+    """Get names of repeatable passes that yields different IR when repeated within given program."""
+    different: list[str] = []
+    for optimization_pass in OPTIMIZATION_PASSES.values():
+        if not optimization_pass.is_repeatable:
+            continue
+        name = optimization_pass.name
+        if optimized_ir(path, [name]) != optimized_ir(path, [name, name]):
+            different.append(name)
+    return different
+
+
+def not_rejected_passes() -> list[str]:
+    """Get names of passes that are not repeatable, but are not rejected when requested twice."""
+    accepted: list[str] = []
+    for optimization_pass in OPTIMIZATION_PASSES.values():
+        if optimization_pass.is_repeatable:
+            continue
+        try:
+            resolve_optimization_passes(
+                [optimization_pass.name, optimization_pass.name],
+                OPTIMIZATION_PASSES,
+            )
+        except OptimizerRepeatedPassError:
+            continue
+        accepted.append(optimization_pass.name)
+    return accepted
+
+
+def main(directories: list[str]) -> int:
+    """Check passes over programs within given directories (or given files), get exit code."""
+    paths = sorted(
+        path
+        for directory in map(Path, directories or DEFAULT_DIRECTORIES)
+        for path in (directory.rglob("*.gof") if directory.is_dir() else [directory])
+    )
+    if not paths:
+        print("No source files found", file=sys.stderr)
+        return 1
+
+    failed = False
+    checked_count = 0
+    for path in paths:
+        try:
+            different = check_program(path)
+        except GofraError as e:
+            # Only programs that compiles are checked (e.g tests of compile errors are not)
+            print(f"{path}: skipped ({type(e).__name__})")
+            continue
+        checked_count += 1
+        if different:
+            failed = True
+            print(f"{path}: IR differs when repeated: {', '.join(different)}")
+
+    accepted = not_rejected_passes()
+    if accepted:
+        failed = True
+        print(f"Not repeatable passes accepted twice: {', '.join(accepted)}")
+
+    print(f"{checked_count}/{len(paths)} programs checked")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
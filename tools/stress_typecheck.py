@@ -0,0 +1,108 @@
+"""Stress typechecking of deeply nested and very long functions (typechecker must not recurse or copy per block).
+
+Usage: `python -m tools.stress_typecheck [--depth N] [--operators N]`, generates programs with:
+- single function with `depth` nested `if` blocks (10k by default),
+- single function with `operators` operators within few nested blocks (1M by default),
+- same nested function with type error at deepest block, which must be reported (not crash).
+Typechecking is done under default recursion limit, so recursion over blocks crashes (`RecursionError`),
+exits with non-zero code if any result is not expected.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from gofra.consts import GOFRA_ENTRY_POINT
+from gofra.exceptions import GofraError
+from gofra.gofra import process_input_file
+from gofra.typecheck import validate_type_safety
+
+# Blocks around long body, so it is typechecked within block stack (not only at function level)
+LONG_FUNCTION_NESTING = 20
+
+
+def nested_function_source(depth: int, *, with_type_error: bool = False) -> str:
+    """Get source of function with given count of nested `if` blocks."""
+    deepest_body = "1 1 +" if with_type_error else "1 drop"
+    return (
+        f"func void {GOFRA_ENTRY_POINT}\n"
+        + "1 1 == if\n" * depth
+        + f"{deepest_body}\n"
+        + "end\n" * depth
+        + "end\n"
+    )
+
+
+def long_function_source(operators: int) -> str:
+    """Get source of function with (at least) given count of operators."""
+    # Each `if` block is 4 operators (with condition and `end`), each `1 drop` is 2 operators
+    body_repeats = max(0, operators - LONG_FUNCTION_NESTING * 4) // 2 + 1
+    return (
+        f"func void {GOFRA_ENTRY_POINT}\n"
+        + "1 1 == if\n" * LONG_FUNCTION_NESTING
+        + "1 drop\n" * body_repeats
+        + "end\n" * LONG_FUNCTION_NESTING
+        + "end\n"
+    )
+
+
+def typecheck_source(name: str, source: str, *, expect_error: bool) -> bool:
+    """Parse and typecheck given source, report operators count and time, get whether result is expected."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / f"{name}.gof"
+        path.write_text(source)
+        program = process_input_file(path, include_paths=[])
+
+    operators_count = len(program.entry_point.source)
+    started_at = perf_counter()
+    try:
+        validate_type_safety(
+            functions={**program.functions, GOFRA_ENTRY_POINT: program.entry_point},
+        )
+    except GofraError as e:
+        outcome = f"error reported ({type(e).__name__})"
+        is_expected = expect_error
+    else:
+        outcome = "ok"
+        is_expected = not expect_error
+    elapsed = perf_counter() - started_at
+
+    print(
+        f"{name:<24}{operators_count:>10} operators {elapsed:>8.3f}s  {outcome}"
+        + ("" if is_expected else "  UNEXPECTED"),
+    )
+    return is_expected
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depth", type=int, default=10_000)
+    parser.add_argument("--operators", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    results = [
+        typecheck_source(
+            "nested",
+            nested_function_source(args.depth),
+            expect_error=False,
+        ),
+        typecheck_source(
+            "nested-with-error",
+            nested_function_source(args.depth, with_type_error=True),
+            expect_error=True,
+        ),
+        typecheck_source(
+            "long",
+            long_function_source(args.operators),
+            expect_error=False,
+        ),
+    ]
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())